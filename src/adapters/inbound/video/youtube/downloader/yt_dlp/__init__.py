@@ -1,20 +1,29 @@
+from copy import deepcopy
 from datetime import datetime
 import os
-import re
+import time
 from typing import Any, Callable
-from yt_dlp import YoutubeDL
 from src.ports.inbound.video.youtube.downloader import YouTubeVideoDownloaderInterface
+from src.adapters.inbound.video.youtube.yt_dlp_pool import YoutubeDLPool
 from src.domain.entity.error.video import DownloadingYouTubeVideoError
 from src.domain.entity.video.download_status import (
     OnCompleteDownloadingVideoStatus,
     OnProgressDownloadingVideoStatus,
 )
-from src.domain.entity.video.youtube import DownloadedYouTubeVideo
+from src.domain.entity.video.youtube import DownloadedYouTubeVideo, YouTubeVideoInfo
 
 
 class YtDlpYouTubeVideoDownloader(YouTubeVideoDownloaderInterface):
-    def __init__(self) -> None:
-        pass
+    def __init__(
+        self,
+        *,
+        youtube_dl_pool: YoutubeDLPool | None = None,
+        progress_interval_in_s: float = 0.5,
+    ) -> None:
+        self.__youtube_dl_pool = youtube_dl_pool or YoutubeDLPool()
+        # The minimum interval between two progress updates of the same download,
+        # the chunks downloaded in between are coalesced into the next update
+        self.__progress_interval_in_s = progress_interval_in_s
 
     def download_from_url(
         self,
@@ -26,6 +35,7 @@ class YtDlpYouTubeVideoDownloader(YouTubeVideoDownloaderInterface):
         cookies_file_path: str | None = None,
         on_progress_callback: Callable[[OnProgressDownloadingVideoStatus], Any],
         on_complete_callback: Callable[[OnCompleteDownloadingVideoStatus], Any],
+        video_info: YouTubeVideoInfo | None = None,
     ) -> DownloadingYouTubeVideoError | DownloadedYouTubeVideo:
         if not os.path.exists(download_path):
             return DownloadingYouTubeVideoError(
@@ -35,24 +45,38 @@ class YtDlpYouTubeVideoDownloader(YouTubeVideoDownloaderInterface):
                 resolution=resolution,
             )
 
+        last_progress_at: float = 0
+
         def __on_progress_hook(status_obj: dict[str, Any]) -> None:
+            nonlocal last_progress_at
             if status_obj.get("status", "NA") == "downloading":
+                # Only the yt-dlp's raw numeric fields are read, and at most once per interval
+                # (except for the last chunk), as this hook is called for every downloaded chunk
+                downloaded_bytes = status_obj.get("downloaded_bytes") or 0
+                total_bytes = status_obj.get("total_bytes") or status_obj.get(
+                    "total_bytes_estimate"
+                )
+                progress_at = time.monotonic()
+                if progress_at - last_progress_at < self.__progress_interval_in_s and (
+                    total_bytes is None or downloaded_bytes < total_bytes
+                ):
+                    return None
+                last_progress_at = progress_at
+
                 return on_progress_callback(
                     OnProgressDownloadingVideoStatus(
                         url=url,
                         title=status_obj.get("info_dict", {}).get("fulltitle", "NA"),
                         height=resolution,
                         width=status_obj.get("info_dict", {}).get("width", "NA"),
-                        size_in_bytes=status_obj.get("total_bytes", "NA"),
-                        downloaded_ratio=re.sub(
-                            r"\x1b\[[0-9;]*m", "", status_obj.get("_percent_str", "NA")
-                        ).strip(),
-                        download_speed_in_bytes=re.sub(
-                            r"\x1b\[[0-9;]*m", "", status_obj.get("_speed_str", "NA")
-                        ).strip(),
-                        download_eta_in_seconds=re.sub(
-                            r"\x1b\[[0-9;]*m", "", status_obj.get("_eta_str", "00:00")
-                        ).strip(),
+                        downloaded_bytes=int(downloaded_bytes),
+                        total_bytes=int(total_bytes)
+                        if total_bytes is not None
+                        else None,
+                        speed_in_bytes_per_s=status_obj.get("speed"),
+                        eta_in_s=status_obj.get("eta"),
+                        fragment_index=status_obj.get("fragment_index"),
+                        fragments_count=status_obj.get("fragment_count"),
                     )
                 )
             elif status_obj.get("status", "NA") == "finished":
@@ -75,8 +99,6 @@ class YtDlpYouTubeVideoDownloader(YouTubeVideoDownloaderInterface):
                 f"bv*[height<={resolution}]+ba/"  # 3️⃣ nearest lower
                 "best"  # 4️⃣ default (best) -- will be used for SABR streaming clients
             ),
-            progress_hooks=[__on_progress_hook],
-            postprocessor_hooks=[],
             paths=dict(home=download_path),
             outtmpl="%(title)s.%(ext)s",
             merge_output_format="mkv",
@@ -88,59 +110,67 @@ class YtDlpYouTubeVideoDownloader(YouTubeVideoDownloaderInterface):
         if cookies_file_path is not None:
             download_options.update(dict(cookiefile=cookies_file_path))
 
-        with YoutubeDL(download_options) as yt:
-            try:
-                youtube_video_info = yt.extract_info(url=url, download=True)
-                assert youtube_video_info is not None
-                video_title: str = os.path.basename(
-                    youtube_video_info.get("fulltitle", "NA")
-                )
-                published_timestamp: float = float(
-                    youtube_video_info.get("timestamp", datetime.now().timestamp())
-                )
-                published_date: datetime = datetime.fromtimestamp(published_timestamp)
-                fetched_video_average_rating = youtube_video_info.get(
-                    "average_rating", 0.0
-                )
-                return DownloadedYouTubeVideo(
-                    url=url,
-                    title=video_title,
-                    height=youtube_video_info.get("height", "NA"),
-                    width=youtube_video_info.get("width", "NA"),
-                    resolution=resolution,
-                    download_path=download_path,
-                    downloaded_file=os.path.join(
-                        download_path,
-                        video_title + "." + youtube_video_info.get("ext", "NA"),
-                    ),
-                    duration=youtube_video_info.get("duration_string", "NA"),
-                    published_date_str=published_date.isoformat(),
-                    channel_id=youtube_video_info.get("channel_id", "NA"),
-                    channel_name=youtube_video_info.get("channel", "NA"),
-                    channel_url=youtube_video_info.get("channel_url", "NA"),
-                    tags=initial_tags + youtube_video_info.get("tags", []),
-                    thumbnail=youtube_video_info.get("thumbnail", "NA"),
-                    average_rating=(
-                        fetched_video_average_rating
-                        if fetched_video_average_rating is not None
-                        else 0.0
-                    ),
-                )
-            except Exception as ex:
-                error_message: str = str(ex)
+        try:
+            # A failure leaves the pool's context first, so the instance that failed isn't reused
+            with self.__youtube_dl_pool.acquire(
+                options=download_options, progress_hooks=[__on_progress_hook]
+            ) as yt:
+                if video_info is not None and video_info.raw_info is not None:
+                    # Going straight to the formats selection with the already extracted info
+                    # (copied as yt-dlp updates it in place while processing it)
+                    youtube_video_info = yt.process_ie_result(
+                        ie_result=deepcopy(video_info.raw_info), download=True
+                    )
+                else:
+                    youtube_video_info = yt.extract_info(url=url, download=True)
+            assert youtube_video_info is not None
+            video_title: str = os.path.basename(
+                youtube_video_info.get("fulltitle", "NA")
+            )
+            published_timestamp: float = float(
+                youtube_video_info.get("timestamp", datetime.now().timestamp())
+            )
+            published_date: datetime = datetime.fromtimestamp(published_timestamp)
+            fetched_video_average_rating = youtube_video_info.get("average_rating", 0.0)
+            return DownloadedYouTubeVideo(
+                url=url,
+                title=video_title,
+                height=youtube_video_info.get("height", "NA"),
+                width=youtube_video_info.get("width", "NA"),
+                resolution=resolution,
+                download_path=download_path,
+                downloaded_file=os.path.join(
+                    download_path,
+                    video_title + "." + youtube_video_info.get("ext", "NA"),
+                ),
+                duration=youtube_video_info.get("duration_string", "NA"),
+                published_date_str=published_date.isoformat(),
+                channel_id=youtube_video_info.get("channel_id", "NA"),
+                channel_name=youtube_video_info.get("channel", "NA"),
+                channel_url=youtube_video_info.get("channel_url", "NA"),
+                tags=initial_tags + youtube_video_info.get("tags", []),
+                thumbnail=youtube_video_info.get("thumbnail", "NA"),
+                average_rating=(
+                    fetched_video_average_rating
+                    if fetched_video_average_rating is not None
+                    else 0.0
+                ),
+            )
+        except Exception as ex:
+            error_message: str = str(ex)
 
-                if (
-                    "Video unavailable" in str(ex)
-                    or "is not a valid URL" in str(ex)
-                    or "Unable to download" in str(ex)
-                ):
-                    error_message = f"This url [{url}] doesn't exist !"
-                elif "Failed to extract any player response" in str(ex):
-                    error_message = "There is no internet connectivity !"
+            if (
+                "Video unavailable" in str(ex)
+                or "is not a valid URL" in str(ex)
+                or "Unable to download" in str(ex)
+            ):
+                error_message = f"This url [{url}] doesn't exist !"
+            elif "Failed to extract any player response" in str(ex):
+                error_message = "There is no internet connectivity !"
 
-                return DownloadingYouTubeVideoError(
-                    error=error_message,
-                    download_path=download_path,
-                    resolution=resolution,
-                    url=url,
-                )
+            return DownloadingYouTubeVideoError(
+                error=error_message,
+                download_path=download_path,
+                resolution=resolution,
+                url=url,
+            )
@@ -1,17 +1,17 @@
 from datetime import datetime
 from typing import Any
-from yt_dlp import YoutubeDL
 from src.domain.entity.error.video import (
     GettingYouTubeVideoInfoError,
     GettingYouTubeVideosFromChannelNameError,
 )
 from src.domain.entity.video.youtube import YouTubeVideoInfo
 from src.ports.inbound.video.youtube.fetcher import YouTubeVideoFetcherInterface
+from src.adapters.inbound.video.youtube.yt_dlp_pool import YoutubeDLPool
 
 
 class YtDlpYouTubeVideoFetcher(YouTubeVideoFetcherInterface):
-    def __init__(self) -> None:
-        pass
+    def __init__(self, *, youtube_dl_pool: YoutubeDLPool | None = None) -> None:
+        self.__youtube_dl_pool = youtube_dl_pool or YoutubeDLPool()
 
     def __get_video_info_from_dict(self, *, entry: dict[str, Any]) -> YouTubeVideoInfo:
         published_timestamp: float = float(
@@ -35,19 +35,21 @@ class YtDlpYouTubeVideoFetcher(YouTubeVideoFetcherInterface):
             channel_id=entry.get("channel_id", "NA"),
             channel_name=entry.get("channel", "NA"),
             channel_url=entry.get("channel_url", "NA"),
+            raw_info=entry,
         )
 
     def get_video_info_from_url(
         self, *, url: str
     ) -> GettingYouTubeVideoInfoError | YouTubeVideoInfo:
         ydl_opts = {"quiet": True, "extract_flat": False}
-        with YoutubeDL(ydl_opts) as yt:
-            try:
+        try:
+            # A failure leaves the pool's context first, so the instance that failed isn't reused
+            with self.__youtube_dl_pool.acquire(options=ydl_opts) as yt:
                 youtube_video_info = yt.extract_info(url=url, download=False)
-                assert youtube_video_info is not None
-                return self.__get_video_info_from_dict(entry=youtube_video_info)
-            except Exception as ex:
-                return GettingYouTubeVideoInfoError(error=str(ex))
+            assert youtube_video_info is not None
+            return self.__get_video_info_from_dict(entry=youtube_video_info)
+        except Exception as ex:
+            return GettingYouTubeVideoInfoError(error=str(ex))
 
     def get_latest_video_from_channel(
         self, *, channel_name: str, videos_limit: int = 3
@@ -55,15 +57,15 @@ class YtDlpYouTubeVideoFetcher(YouTubeVideoFetcherInterface):
         channel_url = f"https://www.youtube.com/c/{channel_name}/videos"
         ydl_opts = {"quiet": True, "extract_flat": False, "playlistend": videos_limit}
 
-        with YoutubeDL(ydl_opts) as ydl:
-            try:
+        try:
+            with self.__youtube_dl_pool.acquire(options=ydl_opts) as ydl:
                 youtube_video_info = ydl.extract_info(url=channel_url, download=False)
-                assert youtube_video_info is not None
-                return [
-                    self.__get_video_info_from_dict(entry=youtube_video_info)
-                    for youtube_video_info in youtube_video_info.get("entries", [])
-                ]
-            except Exception as ex:
-                return GettingYouTubeVideosFromChannelNameError(
-                    error=str(ex), channel_name=channel_name
-                )
+            assert youtube_video_info is not None
+            return [
+                self.__get_video_info_from_dict(entry=youtube_video_info)
+                for youtube_video_info in youtube_video_info.get("entries", [])
+            ]
+        except Exception as ex:
+            return GettingYouTubeVideosFromChannelNameError(
+                error=str(ex), channel_name=channel_name
+            )
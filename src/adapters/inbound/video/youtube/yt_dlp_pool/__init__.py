@@ -0,0 +1,202 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Generator
+from yt_dlp import YoutubeDL
+import json
+import os
+import threading
+
+
+class _PooledYoutubeDL:
+    """A YoutubeDL instance with its hooks bound once, forwarding to the hooks of whoever is using it.
+
+    It remembers the modification time of its cookies file (if any) as it loaded or last saved it,
+    so it never overwrites a cookies file that has been refreshed under it with its stale cookies
+    """
+
+    __slots__ = (
+        "youtube_dl",
+        "progress_hooks",
+        "postprocessor_hooks",
+        "cookie_file_path",
+        "cookie_file_mtime",
+    )
+
+    def __init__(self, *, options: dict[str, Any]) -> None:
+        self.progress_hooks: list[Callable[[dict[str, Any]], Any]] = []
+        self.postprocessor_hooks: list[Callable[[dict[str, Any]], Any]] = []
+        self.cookie_file_path: str | None = options.get("cookiefile")
+        self.cookie_file_mtime: int | None = self.__get_cookie_file_mtime()
+        self.youtube_dl = YoutubeDL(
+            options
+            | dict(
+                progress_hooks=[self.__on_progress_hook],
+                postprocessor_hooks=[self.__on_postprocessor_hook],
+            )
+        )
+
+    def __on_progress_hook(self, status_obj: dict[str, Any]) -> None:
+        for progress_hook in self.progress_hooks:
+            progress_hook(status_obj)
+
+    def __on_postprocessor_hook(self, status_obj: dict[str, Any]) -> None:
+        for postprocessor_hook in self.postprocessor_hooks:
+            postprocessor_hook(status_obj)
+
+    def __get_cookie_file_mtime(self) -> int | None:
+        if self.cookie_file_path is None:
+            return None
+        try:
+            return os.stat(self.cookie_file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def is_cookie_file_changed(self) -> bool:
+        """Whether the cookies file has been written by someone else since this instance loaded (or saved) it"""
+        return self.__get_cookie_file_mtime() != self.cookie_file_mtime
+
+    def save_cookies(self) -> None:
+        """Keeping the cookies file (if any) up to date as if the instance was closed, unless it has been
+        refreshed under the instance (then the refreshed one wins)
+        """
+        if self.cookie_file_path is None or self.is_cookie_file_changed():
+            return None
+        self.youtube_dl.save_cookies()
+        self.cookie_file_mtime = self.__get_cookie_file_mtime()
+
+    def close(self, *, is_saving_cookies: bool = True) -> None:
+        if not is_saving_cookies or self.is_cookie_file_changed():
+            # Closing a YoutubeDL instance saves its cookies, which would overwrite the refreshed ones
+            self.youtube_dl.params["cookiefile"] = None
+        self.youtube_dl.close()
+
+
+class YoutubeDLPool:
+    """A thread-safe pool of YoutubeDL instances keyed by their options (cookies, format, paths, ...),
+    so the repeated lookups/downloads reuse the already parsed options, loaded cookies, initialized
+    extractors and opened HTTP sessions instead of building them again for every call.
+
+    An instance is only used by one caller at a time, and up to `max_idle_instances` of them are kept
+    between the calls, the least recently used ones are closed first. An idle instance whose cookies file
+    has been refreshed meanwhile is replaced by a new one loading the refreshed cookies
+    """
+
+    def __init__(self, *, max_idle_instances: int = 8) -> None:
+        self.__max_idle_instances = max_idle_instances
+        self.__lock = threading.Lock()
+        self.__idle_instances: OrderedDict[str, list[_PooledYoutubeDL]] = OrderedDict()
+        self.__idle_instances_count: int = 0
+        self.__is_closed: bool = False
+
+    @staticmethod
+    def __get_options_key(*, options: dict[str, Any]) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+    def __take_idle_instance(self, *, options_key: str) -> _PooledYoutubeDL | None:
+        with self.__lock:
+            idle_instances = self.__idle_instances.get(options_key)
+            if not idle_instances:
+                return None
+            self.__idle_instances_count -= 1
+            pooled_youtube_dl = idle_instances.pop()
+            if not idle_instances:
+                del self.__idle_instances[options_key]
+            return pooled_youtube_dl
+
+    def __put_idle_instance(
+        self, *, options_key: str, pooled_youtube_dl: _PooledYoutubeDL
+    ) -> None:
+        evicted_instances: list[_PooledYoutubeDL] = []
+        with self.__lock:
+            if self.__is_closed:
+                evicted_instances.append(pooled_youtube_dl)
+            else:
+                self.__idle_instances.setdefault(options_key, []).append(
+                    pooled_youtube_dl
+                )
+                self.__idle_instances.move_to_end(options_key)
+                self.__idle_instances_count += 1
+                while self.__idle_instances_count > self.__max_idle_instances:
+                    oldest_options_key, oldest_instances = next(
+                        iter(self.__idle_instances.items())
+                    )
+                    evicted_instances.append(oldest_instances.pop(0))
+                    self.__idle_instances_count -= 1
+                    if not oldest_instances:
+                        del self.__idle_instances[oldest_options_key]
+
+        # Closing outside of the lock, it saves the cookies and closes the HTTP sessions
+        for evicted_instance in evicted_instances:
+            self.__close_instance(pooled_youtube_dl=evicted_instance)
+
+    @staticmethod
+    def __close_instance(
+        *, pooled_youtube_dl: _PooledYoutubeDL, is_saving_cookies: bool = True
+    ) -> None:
+        try:
+            pooled_youtube_dl.close(is_saving_cookies=is_saving_cookies)
+        except Exception as ex:
+            print(f" [x] Error closing a YoutubeDL instance for reason [{str(ex)}] ...")
+
+    @contextmanager
+    def acquire(
+        self,
+        *,
+        options: dict[str, Any],
+        progress_hooks: list[Callable[[dict[str, Any]], Any]] = [],
+        postprocessor_hooks: list[Callable[[dict[str, Any]], Any]] = [],
+    ) -> Generator[YoutubeDL, None, None]:
+        """Getting a YoutubeDL instance for these options for the time of the call
+
+        Args:
+            options (dict[str, Any]): The YoutubeDL options, without the hooks
+            progress_hooks (list[Callable[[dict[str, Any]], Any]], optional): The progress hooks of this call only.
+                Defaults to [].
+            postprocessor_hooks (list[Callable[[dict[str, Any]], Any]], optional): The postprocessor hooks of this call only.
+                Defaults to [].
+        """
+        options_key = self.__get_options_key(options=options)
+        pooled_youtube_dl = self.__take_idle_instance(options_key=options_key)
+        if pooled_youtube_dl is not None and pooled_youtube_dl.is_cookie_file_changed():
+            self.__close_instance(pooled_youtube_dl=pooled_youtube_dl)
+            pooled_youtube_dl = None
+        if pooled_youtube_dl is None:
+            pooled_youtube_dl = _PooledYoutubeDL(options=options)
+
+        pooled_youtube_dl.progress_hooks = progress_hooks
+        pooled_youtube_dl.postprocessor_hooks = postprocessor_hooks
+        try:
+            yield pooled_youtube_dl.youtube_dl
+        except BaseException:
+            # Not trusting the state (nor the cookies) of an instance that failed its caller
+            self.__close_instance(
+                pooled_youtube_dl=pooled_youtube_dl, is_saving_cookies=False
+            )
+            raise
+        finally:
+            pooled_youtube_dl.progress_hooks = []
+            pooled_youtube_dl.postprocessor_hooks = []
+
+        try:
+            pooled_youtube_dl.save_cookies()
+        except Exception as ex:
+            print(
+                f" [x] Error saving the cookies of a YoutubeDL instance for reason [{str(ex)}] ..."
+            )
+        self.__put_idle_instance(
+            options_key=options_key, pooled_youtube_dl=pooled_youtube_dl
+        )
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__is_closed = True
+            idle_instances = [
+                pooled_youtube_dl
+                for options_instances in self.__idle_instances.values()
+                for pooled_youtube_dl in options_instances
+            ]
+            self.__idle_instances.clear()
+            self.__idle_instances_count = 0
+
+        for pooled_youtube_dl in idle_instances:
+            self.__close_instance(pooled_youtube_dl=pooled_youtube_dl)
@@ -41,7 +41,11 @@ class PonySqliteCommandRepository(CommandRepositoryInterface):
             error_message: str = str(ex)
 
             if "IntegrityError: UNIQUE constraint failed" in error_message:
-                error_message = "This command is already existed in the database !"
+                return SavingCommandError(
+                    error="This command is already existed in the database !",
+                    command=command,
+                    is_duplicate=True,
+                )
             else:
                 error_message = f"Error persisting the video for the reason [{str(ex)}]"
 
@@ -50,6 +54,60 @@ class PonySqliteCommandRepository(CommandRepositoryInterface):
                 command=command,
             )
 
+    def save_commands(
+        self, *, commands: list[GenericCommand]
+    ) -> list[SavingCommandError | None]:
+        saving_statuses: list[SavingCommandError | None] = [None] * len(commands)
+        try:
+            with db_session:
+                created_at_iso_formats = [
+                    command.created_at_iso_format for command in commands
+                ]
+                # Fetching the already saved commands' keys with one query instead of one per command
+                saved_keys: set[tuple[str, str, str]] = {
+                    (
+                        saved_command.topic,
+                        saved_command.created_at_iso_format,
+                        saved_command.command_data_class_name,
+                    )
+                    for saved_command in self.__command_model.select(
+                        lambda c: c.created_at_iso_format in created_at_iso_formats
+                    )
+                }
+                for index, command in enumerate(commands):
+                    key = (
+                        command.get_topic(),
+                        command.created_at_iso_format,
+                        command.get_topic(),
+                    )
+                    # Duplicates are reported per command instead of failing the whole transaction
+                    if key in saved_keys:
+                        saving_statuses[index] = SavingCommandError(
+                            error="This command is already existed in the database !",
+                            command=command,
+                            is_duplicate=True,
+                        )
+                        continue
+
+                    saved_keys.add(key)
+                    self.__command_model(
+                        topic=command.get_topic(),
+                        created_at_iso_format=command.created_at_iso_format,
+                        command_data_class_name=command.get_topic(),
+                        command_data_json=asdict(command),
+                    )
+        except Exception as ex:
+            return [
+                saving_status
+                or SavingCommandError(
+                    error=f"Error persisting the commands for the reason [{str(ex)}]",
+                    command=command,
+                )
+                for saving_status, command in zip(saving_statuses, commands)
+            ]
+
+        return saving_statuses
+
     def get_commands_by_topic(self, *, topic: str) -> list[GenericCommand]:
         try:
             with db_session:
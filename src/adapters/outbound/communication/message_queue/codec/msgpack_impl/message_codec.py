@@ -0,0 +1,40 @@
+from typing import Any
+
+import msgpack
+
+from src.domain.entity.error.message_queue import (
+    DecodingMessageError,
+    EncodingMessageError,
+)
+from src.ports.outbound.communication.message_queue.message_codec import (
+    MessageCodecInterface,
+)
+
+
+class MsgPackMessageCodec(MessageCodecInterface):
+    def __init__(self) -> None:
+        pass
+
+    def get_content_type(self) -> str:
+        return "application/msgpack"
+
+    def encode(self, *, data: dict[str, Any]) -> EncodingMessageError | bytes:
+        try:
+            return msgpack.packb(data, use_bin_type=True)
+        except Exception as ex:
+            return EncodingMessageError(
+                error=f"Error encoding the message for reason [{str(ex)}]"
+            )
+
+    def decode(self, *, data: bytes) -> DecodingMessageError | dict[str, Any]:
+        try:
+            decoded_data = msgpack.unpackb(data, raw=False)
+            if not isinstance(decoded_data, dict):
+                return DecodingMessageError(
+                    error=f"The decoded message is not a map but [{type(decoded_data).__name__}] !"
+                )
+            return decoded_data
+        except Exception as ex:
+            return DecodingMessageError(
+                error=f"Error decoding the message for reason [{str(ex)}]"
+            )
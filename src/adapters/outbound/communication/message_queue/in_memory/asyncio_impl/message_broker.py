@@ -0,0 +1,53 @@
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Any, Coroutine
+
+from src.domain.entity.message_queue.queue_message import QueueMessage
+
+
+class AsyncioInMemoryMessageBroker:
+    """An in-process broker keeping the same semantics the RabbitMQ adapters rely on: a fanout
+    exchange per topic, durable named queues bound to it (shared by competing consumers) and
+    messages being dropped when published to an exchange that has no bound queues yet.
+    The exchanges and queues live on a dedicated event loop thread, so the producers and the
+    consumers (from any thread of the process) share them
+    """
+
+    def __init__(self) -> None:
+        self.__bindings: defaultdict[str, set[str]] = defaultdict(set)
+        self.__queues: dict[str, asyncio.Queue[QueueMessage]] = {}
+        self.__loop = asyncio.new_event_loop()
+        self.__loop_thread = threading.Thread(
+            target=self.__run_event_loop,
+            name=f"{self.__class__.__name__}-event-loop",
+            daemon=True,
+        )
+        self.__loop_thread.start()
+
+    def __run_event_loop(self) -> None:
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    def run_coroutine[T](self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.__loop)
+
+    def get_bound_queue(
+        self, *, exchange_name: str, queue_name: str
+    ) -> asyncio.Queue[QueueMessage]:
+        """Declaring (if needed) a queue bound to an exchange, it must be called from the broker's event loop"""
+        queue = self.__queues.setdefault(queue_name, asyncio.Queue())
+        self.__bindings[exchange_name].add(queue_name)
+        return queue
+
+    def publish(self, *, exchange_name: str, message: QueueMessage) -> None:
+        """Publishing a message to all the queues bound to an exchange, it must be called from the broker's event loop"""
+        for queue_name in self.__bindings.get(exchange_name, ()):
+            self.__queues[queue_name].put_nowait(message)
+
+    def close(self) -> None:
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__loop_thread.join(timeout=5)
+        if not self.__loop_thread.is_alive():
+            self.__loop.close()
@@ -0,0 +1,412 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine
+
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from src.domain.entity.error.message_queue import ConsumingMessageError
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.ports.outbound.communication.message_queue.message_consumer import (
+    MessageConsumerInterface,
+)
+
+
+class AsyncioInMemoryMessageConsumer(MessageConsumerInterface):
+    """Consuming from the in-process broker, there is no connection that can be lost so the
+    retry options are accepted (to keep the same interface) but never used
+    """
+
+    def __init__(self, *, message_broker: AsyncioInMemoryMessageBroker) -> None:
+        self.__message_broker = message_broker
+        self.__stopping_event = threading.Event()
+        self.__consumptions_lock = threading.Lock()
+        self.__consumptions: set[Future[ConsumingMessageError | None]] = set()
+
+    def __consume_until_stopped(
+        self, *, consumption: Coroutine[Any, Any, ConsumingMessageError | None]
+    ) -> ConsumingMessageError | None:
+        # Running the consumption on the broker's event loop, where it can be cancelled by `stop_consuming`
+        with self.__consumptions_lock:
+            if self.__stopping_event.is_set():
+                consumption.close()
+                return None
+            consumption_future = self.__message_broker.run_coroutine(consumption)
+            self.__consumptions.add(consumption_future)
+        try:
+            return consumption_future.result()
+        except CancelledError:
+            return None
+        finally:
+            with self.__consumptions_lock:
+                self.__consumptions.discard(consumption_future)
+
+    async def __process_message[T](
+        self,
+        *,
+        queue_message: QueueMessage,
+        deserialization_function: Callable[[QueueMessage], T],
+        callback_function: Callable[[T], Any],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        if inspect.iscoroutinefunction(callback_function):
+            await callback_function(deserialization_function(queue_message))
+            return None
+
+        await asyncio.get_running_loop().run_in_executor(
+            executor,
+            lambda: callback_function(deserialization_function(queue_message)),
+        )
+
+    async def __process_message_safely[T](
+        self,
+        *,
+        queue_message: QueueMessage,
+        subscription: MessageSubscription[T],
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            await self.__process_message(
+                queue_message=queue_message,
+                deserialization_function=subscription.deserialization_function,
+                callback_function=subscription.callback_function,
+                executor=executor,
+            )
+        except Exception as ex:
+            # Dropped, this in-process broker doesn't outlive its process so unlike
+            # the RabbitMQ and SQLite consumers it doesn't retry or park the failed messages
+            print(
+                f" [x] Error processing message from [{subscription.queue_topic}] for reason [{str(ex)}] ..."
+            )
+        finally:
+            workers_semaphore.release()
+
+    async def __consume_subscription(
+        self,
+        *,
+        queue: asyncio.Queue[QueueMessage],
+        subscription: MessageSubscription,
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+        processing_tasks: set[asyncio.Task],
+    ) -> None:
+        while True:
+            # Only taking a message from the queue when there is a free worker for it,
+            # so the other consumers of the same queue can take it meanwhile
+            await workers_semaphore.acquire()
+            queue_message = await queue.get()
+            processing_task = asyncio.create_task(
+                self.__process_message_safely(
+                    queue_message=queue_message,
+                    subscription=subscription,
+                    executor=executor,
+                    workers_semaphore=workers_semaphore,
+                )
+            )
+            processing_tasks.add(processing_task)
+            processing_task.add_done_callback(processing_tasks.discard)
+
+    async def __consume_one_message(
+        self,
+        *,
+        queues: list[asyncio.Queue[QueueMessage]],
+        subscriptions: list[MessageSubscription],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        getting_tasks = [asyncio.create_task(queue.get()) for queue in queues]
+        done_tasks, pending_tasks = await asyncio.wait(
+            getting_tasks, return_when=asyncio.FIRST_COMPLETED
+        )
+        for pending_task in pending_tasks:
+            pending_task.cancel()
+
+        first_message_processed: bool = False
+        for getting_task, queue, subscription in zip(
+            getting_tasks, queues, subscriptions
+        ):
+            if getting_task not in done_tasks:
+                continue
+            if first_message_processed:
+                # Giving back the messages got at the same time as the first one
+                queue.put_nowait(getting_task.result())
+                continue
+
+            first_message_processed = True
+            await self.__process_message(
+                queue_message=getting_task.result(),
+                deserialization_function=subscription.deserialization_function,
+                callback_function=subscription.callback_function,
+                executor=executor,
+            )
+
+    async def __process_consume_messages(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        try:
+            queues = [
+                self.__message_broker.get_bound_queue(
+                    exchange_name=subscription.exchange_name,
+                    queue_name=subscription.queue_topic,
+                )
+                for subscription in subscriptions
+            ]
+
+            for subscription in subscriptions:
+                print(
+                    f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+                )
+
+            reserved_concurrencies = [
+                subscription.max_concurrency
+                for subscription in subscriptions
+                if subscription.max_concurrency is not None
+            ]
+            with ThreadPoolExecutor(
+                max_workers=max_concurrency + sum(reserved_concurrencies),
+                thread_name_prefix=self.__class__.__name__,
+            ) as executor:
+                if not consume_forever:
+                    await self.__consume_one_message(
+                        queues=queues, subscriptions=subscriptions, executor=executor
+                    )
+                    return None
+
+                # The subscriptions with their own max concurrency (like the interactive/bulk lanes)
+                # get reserved workers, the others share the consumer's ones
+                shared_workers_semaphore = asyncio.Semaphore(max_concurrency)
+                processing_tasks: set[asyncio.Task] = set()
+                try:
+                    await asyncio.gather(
+                        *(
+                            self.__consume_subscription(
+                                queue=queue,
+                                subscription=subscription,
+                                executor=executor,
+                                workers_semaphore=(
+                                    shared_workers_semaphore
+                                    if subscription.max_concurrency is None
+                                    else asyncio.Semaphore(subscription.max_concurrency)
+                                ),
+                                processing_tasks=processing_tasks,
+                            )
+                            for queue, subscription in zip(queues, subscriptions)
+                        )
+                    )
+                finally:
+                    await asyncio.gather(*processing_tasks, return_exceptions=True)
+        except Exception as ex:
+            return ConsumingMessageError(error=str(ex))
+
+    async def __collect_batch(
+        self,
+        *,
+        queue: asyncio.Queue[QueueMessage],
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> list[QueueMessage]:
+        # Waiting as long as needed for the first message, then up to the batch timeout for the rest
+        batch = [await queue.get()]
+        batch_deadline = asyncio.get_running_loop().time() + batch_timeout_in_ms / 1000
+        while len(batch) < batch_size:
+            remaining_time = batch_deadline - asyncio.get_running_loop().time()
+            if remaining_time <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(queue.get(), timeout=remaining_time)
+                )
+            except TimeoutError:
+                break
+        return batch
+
+    async def __process_batch[T](
+        self,
+        *,
+        queue: asyncio.Queue[QueueMessage],
+        batch: list[QueueMessage],
+        subscription: MessageBatchSubscription[T],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        messages_with_data: list[tuple[QueueMessage, T]] = []
+        for queue_message in batch:
+            try:
+                messages_with_data.append(
+                    (
+                        queue_message,
+                        subscription.deserialization_function(queue_message),
+                    )
+                )
+            except Exception as ex:
+                # A message that can't be deserialized will never be, so it's dropped
+                print(
+                    f" [x] Error deserializing message from [{subscription.queue_topic}]"
+                    + f" for reason [{str(ex)}] ..."
+                )
+
+        if not messages_with_data:
+            return None
+
+        data_items = [data for _, data in messages_with_data]
+        try:
+            if inspect.iscoroutinefunction(subscription.batch_callback_function):
+                is_processed = await subscription.batch_callback_function(data_items)
+            else:
+                is_processed = await asyncio.get_running_loop().run_in_executor(
+                    executor, subscription.batch_callback_function, data_items
+                )
+        except Exception as ex:
+            print(
+                f" [x] Error processing a batch of [{len(data_items)}] messages from [{subscription.queue_topic}]"
+                + f" for reason [{str(ex)}] ..."
+            )
+            is_processed = False
+
+        if not is_processed:
+            # Requeuing the whole batch
+            for queue_message, _ in messages_with_data:
+                queue.put_nowait(queue_message)
+
+    async def __consume_batch_subscription(
+        self,
+        *,
+        subscription: MessageBatchSubscription,
+        executor: ThreadPoolExecutor,
+        consume_forever: bool,
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> None:
+        queue = self.__message_broker.get_bound_queue(
+            exchange_name=subscription.exchange_name,
+            queue_name=subscription.queue_topic,
+        )
+
+        print(
+            f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+        )
+
+        while True:
+            await self.__process_batch(
+                queue=queue,
+                batch=await self.__collect_batch(
+                    queue=queue,
+                    batch_size=batch_size,
+                    batch_timeout_in_ms=batch_timeout_in_ms,
+                ),
+                subscription=subscription,
+                executor=executor,
+            )
+            if not consume_forever:
+                return None
+
+    async def __process_consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(subscriptions),
+                thread_name_prefix=self.__class__.__name__,
+            ) as executor:
+                await asyncio.gather(
+                    *(
+                        self.__consume_batch_subscription(
+                            subscription=subscription,
+                            executor=executor,
+                            consume_forever=consume_forever,
+                            batch_size=batch_size,
+                            batch_timeout_in_ms=batch_timeout_in_ms,
+                        )
+                        for subscription in subscriptions
+                    )
+                )
+        except Exception as ex:
+            return ConsumingMessageError(error=str(ex))
+
+    def consume_messages[T](
+        self,
+        *,
+        exchange_name: str,
+        queue_topic: str,
+        deserialization_function: Callable[[QueueMessage], T],
+        callback_function: Callable[[T], Any],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        return self.consume_subscriptions(
+            subscriptions=[
+                MessageSubscription(
+                    exchange_name=exchange_name,
+                    queue_topic=queue_topic,
+                    deserialization_function=deserialization_function,
+                    callback_function=callback_function,
+                )
+            ],
+            consume_forever=consume_forever,
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
+        )
+
+    def consume_subscriptions(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        # The messages are handed over straight from the queues, so there is nothing to prefetch
+        return self.__consume_until_stopped(
+            consumption=self.__process_consume_messages(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    def consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        return self.__consume_until_stopped(
+            consumption=self.__process_consume_batches(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                batch_size=batch_size,
+                batch_timeout_in_ms=batch_timeout_in_ms,
+            )
+        )
+
+    def stop_consuming(self) -> None:
+        with self.__consumptions_lock:
+            self.__stopping_event.set()
+            consumptions = list(self.__consumptions)
+        for consumption_future in consumptions:
+            consumption_future.cancel()
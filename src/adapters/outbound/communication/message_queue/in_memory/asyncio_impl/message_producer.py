@@ -0,0 +1,133 @@
+from src.domain.entity.error.message_queue import ProducingMessageError
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.ports.outbound.communication.message_queue.message_producer import (
+    MessageProducerInterface,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from typing import Any, Iterable
+import asyncio
+
+
+class AsyncioInMemoryMessageProducer(MessageProducerInterface):
+    """Producing to the in-memory broker, its queues are FIFO so the priority of the messages is accepted
+    (to keep the same interface) but ignored, the bulk lanes still keep them apart from the interactive ones
+    """
+
+    def __init__(
+        self,
+        *,
+        message_broker: AsyncioInMemoryMessageBroker,
+        producing_timeout: int = 30,
+    ) -> None:
+        self.__message_broker = message_broker
+        self.__producing_timeout = producing_timeout
+        self.__is_closed: bool = False
+
+    async def __process_sending_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> list[ProducingMessageError | None]:
+        results: list[ProducingMessageError | None] = []
+        for data in data_items:
+            try:
+                self.__message_broker.publish(
+                    exchange_name=topic,
+                    message=QueueMessage(
+                        body=data,
+                        content_type=content_type,
+                        headers=dict(headers or {}),
+                    ),
+                )
+                results.append(None)
+            except Exception as ex:
+                results.append(ProducingMessageError(error=str(ex)))
+        return results
+
+    def produce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        return self.produce_messages(
+            topic=topic, data_items=[data], content_type=content_type, headers=headers
+        )[0]
+
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        if self.__is_closed:
+            return [
+                ProducingMessageError(error="This message producer is closed !")
+                for _ in data_items
+            ]
+
+        data_items = list(data_items)
+        try:
+            return self.__message_broker.run_coroutine(
+                self.__process_sending_messages(
+                    topic=topic,
+                    data_items=data_items,
+                    content_type=content_type,
+                    headers=headers,
+                )
+            ).result(timeout=self.__producing_timeout)
+        except Exception as ex:
+            return [
+                ProducingMessageError(
+                    error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+                )
+                for _ in data_items
+            ]
+
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        if self.__is_closed:
+            return ProducingMessageError(error="This message producer is closed !")
+
+        try:
+            # Awaiting the broker's loop from the caller's loop without blocking it
+            producing_statuses = await asyncio.wait_for(
+                asyncio.wrap_future(
+                    self.__message_broker.run_coroutine(
+                        self.__process_sending_messages(
+                            topic=topic,
+                            data_items=[data],
+                            content_type=content_type,
+                            headers=headers,
+                        )
+                    )
+                ),
+                timeout=self.__producing_timeout,
+            )
+            return producing_statuses[0]
+        except Exception as ex:
+            return ProducingMessageError(
+                error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+            )
+
+    def close(self) -> None:
+        # The broker is shared by the other producers/consumers of the process, so it's left running
+        self.__is_closed = True
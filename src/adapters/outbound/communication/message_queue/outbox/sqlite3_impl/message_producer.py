@@ -0,0 +1,326 @@
+from src.domain.entity.error.message_queue import ProducingMessageError
+from src.ports.outbound.communication.message_queue.message_producer import (
+    MessageProducerInterface,
+)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import groupby
+from typing import Any, Generator, Iterable
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+import time
+
+
+class Sqlite3OutboxMessageProducer(MessageProducerInterface):
+    """Producing the messages to a durable local outbox (a SQLite WAL file) first, so the callers get
+    acknowledged as soon as the messages are committed locally whatever the state of the broker is.
+    A background relay then flushes the outbox in batches to the wrapped (broker) producer, retrying
+    the messages that failed with an exponential backoff until they get delivered.
+
+    The relay leases the messages it's sending, so many processes can share the same outbox file
+    without sending a message twice, and the messages of a process that died are sent again
+    once their lease expires
+    """
+
+    def __init__(
+        self,
+        *,
+        message_producer: MessageProducerInterface,
+        database_path: str,
+        relay_batch_size: int = 256,
+        relay_interval_in_ms: int = 100,
+        relay_lease_timeout_in_s: float = 60,
+        max_retry_backoff_in_s: float = 30,
+        busy_timeout_in_ms: int = 5000,
+        closing_timeout: int = 5,
+    ) -> None:
+        self.__message_producer = message_producer
+        self.__database_path = database_path
+        self.__relay_batch_size = relay_batch_size
+        self.__relay_interval_in_s = relay_interval_in_ms / 1000
+        self.__relay_lease_timeout_in_s = relay_lease_timeout_in_s
+        self.__max_retry_backoff_in_s = max_retry_backoff_in_s
+        self.__busy_timeout_in_ms = busy_timeout_in_ms
+        self.__closing_timeout = closing_timeout
+
+        # All the statements run on one dedicated thread (and connection), SQLite has a single writer anyway
+        self.__connection: sqlite3.Connection | None = None
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.__class__.__name__
+        )
+        self.__executor.submit(self.__create_tables).result()
+
+        self.__is_closed: bool = False
+        self.__has_new_messages = threading.Event()
+        self.__relay_thread = threading.Thread(
+            target=self.__run_relay,
+            name=f"{self.__class__.__name__}-relay",
+            daemon=True,
+        )
+        self.__relay_thread.start()
+
+    def __get_connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.__connection = sqlite3.connect(
+                self.__database_path,
+                isolation_level=None,
+                timeout=self.__busy_timeout_in_ms / 1000,
+            )
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute("PRAGMA synchronous=NORMAL")
+        return self.__connection
+
+    @contextmanager
+    def __transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        connection = self.__get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def __create_tables(self) -> None:
+        with self.__transaction() as connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS outbox_messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    topic TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    content_type TEXT,
+                    headers TEXT NOT NULL,
+                    priority INTEGER,
+                    leased_until REAL NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_messages_leased_until ON outbox_messages (leased_until, id)"
+            )
+
+    def __append(
+        self,
+        *,
+        topic: str,
+        data_items: list[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> None:
+        encoded_headers = json.dumps(headers or {})
+        with self.__transaction() as connection:
+            connection.executemany(
+                "INSERT INTO outbox_messages (topic, body, content_type, headers, priority) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (topic, data, content_type, encoded_headers, priority)
+                    for data in data_items
+                ),
+            )
+        self.__has_new_messages.set()
+
+    def __lease_messages(
+        self,
+    ) -> list[tuple[int, str, bytes, str | None, str, int | None, int]]:
+        now = time.time()
+        with self.__transaction() as connection:
+            outbox_messages = connection.execute(
+                """SELECT id, topic, body, content_type, headers, priority, attempts FROM outbox_messages
+                WHERE leased_until <= ? ORDER BY id LIMIT ?""",
+                (now, self.__relay_batch_size),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE outbox_messages SET leased_until = ? WHERE id = ?",
+                (
+                    (now + self.__relay_lease_timeout_in_s, message_id)
+                    for message_id, *_ in outbox_messages
+                ),
+            )
+            return outbox_messages
+
+    def __complete_messages(
+        self, *, sent_message_ids: list[int], failed_messages: list[tuple[int, int]]
+    ) -> None:
+        now = time.time()
+        with self.__transaction() as connection:
+            connection.executemany(
+                "DELETE FROM outbox_messages WHERE id = ?",
+                ((message_id,) for message_id in sent_message_ids),
+            )
+            # Retrying the failed messages later with an exponential backoff (and some jitter,
+            # so the messages of all the processes don't hit the recovering broker at once)
+            connection.executemany(
+                "UPDATE outbox_messages SET leased_until = ?, attempts = ? WHERE id = ?",
+                (
+                    (
+                        now
+                        + random.uniform(0.5, 1)
+                        * min(2**attempts, self.__max_retry_backoff_in_s),
+                        attempts + 1,
+                        message_id,
+                    )
+                    for message_id, attempts in failed_messages
+                ),
+            )
+
+    def __relay_messages(self) -> int:
+        """Sending a batch of the outbox messages to the broker, returning how many have been leased"""
+        outbox_messages = self.__executor.submit(self.__lease_messages).result()
+
+        sent_message_ids: list[int] = []
+        failed_messages: list[tuple[int, int]] = []
+        # Producing the consecutive messages of the same topic (and content type/headers/priority) together
+        for (topic, content_type, headers, priority), grouped_messages in groupby(
+            outbox_messages,
+            key=lambda outbox_message: (
+                outbox_message[1],
+                outbox_message[3],
+                outbox_message[4],
+                outbox_message[5],
+            ),
+        ):
+            topic_messages = list(grouped_messages)
+            producing_statuses = self.__message_producer.produce_messages(
+                topic=topic,
+                data_items=[body for _, _, body, *_ in topic_messages],
+                content_type=content_type,
+                headers=json.loads(headers),
+                priority=priority,
+            )
+            for (message_id, *_, attempts), producing_status in zip(
+                topic_messages, producing_statuses
+            ):
+                match producing_status:
+                    case ProducingMessageError() as error:
+                        print(
+                            f" [x] Error relaying an outbox message to topic [{topic}] for reason [{error.error}],"
+                            + f" attempts [{attempts + 1}] ..."
+                        )
+                        failed_messages.append((message_id, attempts))
+                    case _:
+                        sent_message_ids.append(message_id)
+
+        if outbox_messages:
+            self.__executor.submit(
+                self.__complete_messages,
+                sent_message_ids=sent_message_ids,
+                failed_messages=failed_messages,
+            ).result()
+        return len(outbox_messages)
+
+    def __run_relay(self) -> None:
+        while True:
+            # The messages appended by the other processes are picked up on the next interval
+            self.__has_new_messages.wait(timeout=self.__relay_interval_in_s)
+            self.__has_new_messages.clear()
+            try:
+                while self.__relay_messages() == self.__relay_batch_size:
+                    pass
+            except Exception as ex:
+                print(
+                    f" [x] Error relaying the outbox messages for reason [{str(ex)}] ..."
+                )
+            if self.__is_closed:
+                return None
+
+    def produce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        return self.produce_messages(
+            topic=topic,
+            data_items=[data],
+            content_type=content_type,
+            headers=headers,
+            priority=priority,
+        )[0]
+
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        data_items = list(data_items)
+        if self.__is_closed:
+            return [
+                ProducingMessageError(error="This message producer is closed !")
+                for _ in data_items
+            ]
+
+        try:
+            self.__executor.submit(
+                self.__append,
+                topic=topic,
+                data_items=data_items,
+                content_type=content_type,
+                headers=headers,
+                priority=priority,
+            ).result()
+            return [None for _ in data_items]
+        except Exception as ex:
+            return [
+                ProducingMessageError(
+                    error=f"Error appending the message for topic [{topic}] to the outbox for reason [{str(ex)}]"
+                )
+                for _ in data_items
+            ]
+
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        if self.__is_closed:
+            return ProducingMessageError(error="This message producer is closed !")
+
+        try:
+            # Awaiting the outbox's thread from the caller's loop without blocking it
+            await asyncio.wrap_future(
+                self.__executor.submit(
+                    self.__append,
+                    topic=topic,
+                    data_items=[data],
+                    content_type=content_type,
+                    headers=headers,
+                    priority=priority,
+                )
+            )
+            return None
+        except Exception as ex:
+            return ProducingMessageError(
+                error=f"Error appending the message for topic [{topic}] to the outbox for reason [{str(ex)}]"
+            )
+
+    def close(self) -> None:
+        if self.__is_closed:
+            return None
+        self.__is_closed = True
+
+        # Letting the relay flush what it can before closing, the rest is sent on the next start
+        self.__has_new_messages.set()
+        self.__relay_thread.join(timeout=self.__closing_timeout)
+        self.__message_producer.close()
+
+        def __close_connection() -> None:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+        self.__executor.submit(__close_connection).result()
+        self.__executor.shutdown()
@@ -1,17 +1,41 @@
 import asyncio
-import datetime
-import pickle
+import inspect
+import random
+import threading
 import time
-from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine
 
-from aio_pika import ExchangeType, connect_robust
+from aio_pika import DeliveryMode, Message, connect_robust
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractIncomingMessage,
+    AbstractRobustConnection,
+)
+from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.topology_cache import (
+    PikaRabbitMqTopologyCache,
+)
 from src.domain.entity.error.message_queue import ConsumingMessageError
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
 from src.ports.outbound.communication.message_queue.message_consumer import (
     MessageConsumerInterface,
 )
 
 
 class PikaRabbitMqMessageConsumer(MessageConsumerInterface):
+    """Consuming from RabbitMQ, the messages that fail to be processed are moved through delayed retry
+    queues (`<queue>.retry.<delay>ms`, holding them for their TTL before dead-lettering them back to
+    their queue) and finally to a parking queue (`<queue>.parking`) to be inspected, so a failing message
+    neither gets lost nor stalls its queue nor hot-loops the broker
+    """
+
+    RETRY_COUNT_HEADER: str = "x-retry-count"
+    LAST_ERROR_HEADER: str = "x-last-error"
+
     def __init__(
         self,
         *,
@@ -20,106 +44,673 @@ class PikaRabbitMqMessageConsumer(MessageConsumerInterface):
         rabbitmq_host: str,
         rabbitmq_port: int,
         connection_timeout: int = 5,
+        heartbeat: int = 60,
+        retry_delays_in_ms: tuple[int, ...] = (5_000, 30_000, 300_000),
+        max_retry_timeout: int = 60,
     ) -> None:
         self.__rabbitmq_username = rabbitmq_username
         self.__rabbitmq_password = rabbitmq_password
         self.__rabbitmq_host = rabbitmq_host
         self.__rabbitmq_port = rabbitmq_port
         self.__connection_timeout = connection_timeout
+        self.__heartbeat = heartbeat
+        self.__retry_delays_in_ms = retry_delays_in_ms
+        self.__max_retry_timeout = max_retry_timeout
+        self.__stopping_event = threading.Event()
+        self.__consumptions_lock = threading.Lock()
+        self.__consumptions: set[
+            tuple[asyncio.AbstractEventLoop, asyncio.Task[Any] | None]
+        ] = set()
 
-    async def __process_consume_messages[T](
+    @staticmethod
+    def __get_queue_arguments(
+        *, subscription: MessageSubscription
+    ) -> dict[str, Any] | None:
+        # Redeclaring an existing queue with other arguments is refused by the broker (PRECONDITION_FAILED)
+        if subscription.max_priority is None:
+            return None
+        return {"x-max-priority": subscription.max_priority}
+
+    async def __settle_failed_message(
         self,
         *,
-        exchange_name: str,
-        queue_topic: str,
-        deserialization_function: Callable[[dict[str, Any]], T],
-        callback_function: Callable[[T], Any],
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        message: AbstractIncomingMessage,
+        queue_name: str,
+        error: str,
+        is_retryable: bool = True,
+    ) -> None:
+        retry_count = int(message.headers.get(self.RETRY_COUNT_HEADER) or 0)
+        if is_retryable and retry_count < len(self.__retry_delays_in_ms):
+            retry_delay_in_ms = self.__retry_delays_in_ms[retry_count]
+            target_queue_name = f"{queue_name}.retry.{retry_delay_in_ms}ms"
+            # Expired messages are dead-lettered through the default exchange straight back to their queue
+            target_queue_arguments: dict[str, Any] | None = {
+                "x-message-ttl": retry_delay_in_ms,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": queue_name,
+            }
+        else:
+            target_queue_name = f"{queue_name}.parking"
+            target_queue_arguments = None
+
+        await topology_cache.get_queue(
+            channel=channel,
+            queue_name=target_queue_name,
+            arguments=target_queue_arguments,
+        )
+        # The message is only acked once the broker has confirmed having its copy,
+        # which keeps the properties of the original (like its priority lane when retried)
+        await channel.default_exchange.publish(
+            message=Message(
+                message.body,
+                content_type=message.content_type,
+                content_encoding=message.content_encoding,
+                headers={
+                    **message.headers,
+                    self.RETRY_COUNT_HEADER: retry_count + 1,
+                    self.LAST_ERROR_HEADER: error[:1000],
+                },
+                delivery_mode=DeliveryMode.PERSISTENT,
+                priority=message.priority,
+                correlation_id=message.correlation_id,
+                message_id=message.message_id,
+                timestamp=message.timestamp,
+                type=message.type,
+                app_id=message.app_id,
+            ),
+            routing_key=target_queue_name,
+        )
+        await message.ack()
+        print(
+            f" [x] Moved message [{message.message_id}] from [{queue_name}] to [{target_queue_name}]"
+            + f" for reason [{error}] ..."
+        )
+
+    async def __process_message[T](
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        message: AbstractIncomingMessage,
+        subscription: MessageSubscription[T],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        try:
+            data = subscription.deserialization_function(
+                QueueMessage(
+                    body=message.body,
+                    content_type=message.content_type,
+                    headers=dict(message.headers),
+                )
+            )
+        except Exception as ex:
+            # A message that can't be deserialized will never be, so it's parked right away
+            await self.__settle_failed_message(
+                channel=channel,
+                topology_cache=topology_cache,
+                message=message,
+                queue_name=subscription.queue_topic,
+                error=f"Error deserializing the message for reason [{str(ex)}]",
+                is_retryable=False,
+            )
+            return None
+
+        # The message is only acked once its callback has completed
+        try:
+            if inspect.iscoroutinefunction(subscription.callback_function):
+                await subscription.callback_function(data)
+            else:
+                # Blocking callbacks (e.g. downloads) run off the event loop so it keeps
+                # servicing the connection heartbeats while they are running
+                await asyncio.get_running_loop().run_in_executor(
+                    executor, subscription.callback_function, data
+                )
+        except Exception as ex:
+            await self.__settle_failed_message(
+                channel=channel,
+                topology_cache=topology_cache,
+                message=message,
+                queue_name=subscription.queue_topic,
+                error=str(ex),
+            )
+            return None
+
+        await message.ack()
+
+    async def __process_message_safely[T](
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        message: AbstractIncomingMessage,
+        subscription: MessageSubscription[T],
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            await self.__process_message(
+                channel=channel,
+                topology_cache=topology_cache,
+                message=message,
+                subscription=subscription,
+                executor=executor,
+            )
+        except Exception as ex:
+            # The message is left unacked, so it's redelivered once the channel is recovered
+            print(
+                f" [x] Error processing message [{message.message_id}] from [{message.routing_key}]"
+                + f" for reason [{str(ex)}] ..."
+            )
+        finally:
+            workers_semaphore.release()
+
+    async def __consume_subscription(
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        subscription: MessageSubscription,
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+        processing_tasks: set[asyncio.Task],
+    ) -> None:
+        queue = await topology_cache.get_bound_queue(
+            channel=channel,
+            exchange_name=subscription.exchange_name,
+            queue_name=subscription.queue_topic,
+            arguments=self.__get_queue_arguments(subscription=subscription),
+            durable=not subscription.is_transient,
+            auto_delete=subscription.is_transient,
+        )
+
+        print(
+            f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+        )
+
+        async with queue.iterator() as queue_iter:
+            async for message in queue_iter:
+                # Waiting for a free worker before dispatching the next message
+                await workers_semaphore.acquire()
+                processing_task = asyncio.create_task(
+                    self.__process_message_safely(
+                        channel=channel,
+                        topology_cache=topology_cache,
+                        message=message,
+                        subscription=subscription,
+                        executor=executor,
+                        workers_semaphore=workers_semaphore,
+                    )
+                )
+                processing_tasks.add(processing_task)
+                processing_task.add_done_callback(processing_tasks.discard)
+
+    async def __consume_one_message(
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        subscriptions: list[MessageSubscription],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        queues = [
+            await topology_cache.get_bound_queue(
+                channel=channel,
+                exchange_name=subscription.exchange_name,
+                queue_name=subscription.queue_topic,
+                arguments=self.__get_queue_arguments(subscription=subscription),
+                durable=not subscription.is_transient,
+                auto_delete=subscription.is_transient,
+            )
+            for subscription in subscriptions
+        ]
+
+        for subscription in subscriptions:
+            print(
+                f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+            )
+
+        # Processing the first message delivered from any of the queues
+        first_message: asyncio.Future[
+            tuple[MessageSubscription, AbstractIncomingMessage]
+        ] = asyncio.get_running_loop().create_future()
+
+        def __on_message_wrapper(subscription: MessageSubscription):
+            async def __on_message(message: AbstractIncomingMessage) -> None:
+                if first_message.done():
+                    await message.nack(requeue=True)
+                else:
+                    first_message.set_result((subscription, message))
+
+            return __on_message
+
+        consumer_tags = [
+            (
+                queue,
+                await queue.consume(__on_message_wrapper(subscription)),
+            )
+            for queue, subscription in zip(queues, subscriptions)
+        ]
+        try:
+            subscription, message = await first_message
+        finally:
+            for queue, consumer_tag in consumer_tags:
+                await queue.cancel(consumer_tag)
+
+        await self.__process_message(
+            channel=channel,
+            topology_cache=topology_cache,
+            message=message,
+            subscription=subscription,
+            executor=executor,
+        )
+
+    async def __connect(self) -> AbstractRobustConnection:
+        return await connect_robust(
+            host=self.__rabbitmq_host,
+            port=self.__rabbitmq_port,
+            login=self.__rabbitmq_username,
+            password=self.__rabbitmq_password,
+            timeout=self.__connection_timeout,
+            heartbeat=self.__heartbeat,
+        )
+
+    async def __process_consume_messages(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
         consume_forever: bool = True,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
     ) -> ConsumingMessageError | None:
         try:
-            connection = await connect_robust(
-                host=self.__rabbitmq_host,
-                port=self.__rabbitmq_port,
-                login=self.__rabbitmq_username,
-                password=self.__rabbitmq_password,
-                timeout=self.__connection_timeout,
-            )
+            connection = await self.__connect()
 
+            # All the subscriptions share the same connection, channel, event loop and workers
             async with connection:
+                topology_cache = PikaRabbitMqTopologyCache()
+                topology_cache.watch_connection(connection=connection)
                 channel = await connection.channel()
-                exchange = await channel.declare_exchange(
-                    name=exchange_name, type=ExchangeType.FANOUT
+                topology_cache.watch_channel(channel=channel)
+                reserved_concurrencies = [
+                    subscription.max_concurrency
+                    for subscription in subscriptions
+                    if subscription.max_concurrency is not None
+                ]
+                # There is no point having less unacked messages than the workers processing them,
+                # the prefetch count applies to each subscription's consumer on its own
+                await channel.set_qos(
+                    prefetch_count=max(
+                        prefetch_count, max_concurrency, *reserved_concurrencies
+                    )
                 )
-                queue = await channel.declare_queue(name=queue_topic, durable=True)
-                await queue.bind(exchange)
 
-                print(
-                    f" [*] Waiting for messages from [{queue_topic}]. To exit press CTRL+C"
+                with ThreadPoolExecutor(
+                    max_workers=max_concurrency + sum(reserved_concurrencies),
+                    thread_name_prefix=self.__class__.__name__,
+                ) as executor:
+                    if not consume_forever:
+                        await self.__consume_one_message(
+                            channel=channel,
+                            topology_cache=topology_cache,
+                            subscriptions=subscriptions,
+                            executor=executor,
+                        )
+                        return None
+
+                    # The subscriptions with their own max concurrency (like the interactive/bulk lanes)
+                    # get reserved workers, the others share the consumer's ones
+                    shared_workers_semaphore = asyncio.Semaphore(max_concurrency)
+                    processing_tasks: set[asyncio.Task] = set()
+                    try:
+                        await asyncio.gather(
+                            *(
+                                self.__consume_subscription(
+                                    channel=channel,
+                                    topology_cache=topology_cache,
+                                    subscription=subscription,
+                                    executor=executor,
+                                    workers_semaphore=(
+                                        shared_workers_semaphore
+                                        if subscription.max_concurrency is None
+                                        else asyncio.Semaphore(
+                                            subscription.max_concurrency
+                                        )
+                                    ),
+                                    processing_tasks=processing_tasks,
+                                )
+                                for subscription in subscriptions
+                            )
+                        )
+                    finally:
+                        await asyncio.gather(*processing_tasks, return_exceptions=True)
+        except Exception as ex:
+            return ConsumingMessageError(error=str(ex))
+
+    async def __collect_batch(
+        self,
+        *,
+        delivered_messages: asyncio.Queue[AbstractIncomingMessage],
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> list[AbstractIncomingMessage]:
+        # Waiting as long as needed for the first message, then up to the batch timeout for the rest
+        batch = [await delivered_messages.get()]
+        batch_deadline = asyncio.get_running_loop().time() + batch_timeout_in_ms / 1000
+        while len(batch) < batch_size:
+            remaining_time = batch_deadline - asyncio.get_running_loop().time()
+            if remaining_time <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(
+                        delivered_messages.get(), timeout=remaining_time
+                    )
                 )
+            except TimeoutError:
+                break
+        return batch
 
-                async with queue.iterator() as queue_iter:
-                    async for message in queue_iter:
-                        async with message.process():
-                            callback_function(
-                                deserialization_function(pickle.loads(message.body))
+    async def __process_batch[T](
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        batch: list[AbstractIncomingMessage],
+        subscription: MessageBatchSubscription[T],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        messages_with_data: list[tuple[AbstractIncomingMessage, T]] = []
+        for message in batch:
+            try:
+                messages_with_data.append(
+                    (
+                        message,
+                        subscription.deserialization_function(
+                            QueueMessage(
+                                body=message.body,
+                                content_type=message.content_type,
+                                headers=dict(message.headers),
+                            )
+                        ),
+                    )
+                )
+            except Exception as ex:
+                # A message that can't be deserialized will never be, so it's parked right away
+                await self.__settle_failed_message(
+                    channel=channel,
+                    topology_cache=topology_cache,
+                    message=message,
+                    queue_name=subscription.queue_topic,
+                    error=f"Error deserializing the message for reason [{str(ex)}]",
+                    is_retryable=False,
+                )
+
+        if not messages_with_data:
+            return None
+
+        data_items = [data for _, data in messages_with_data]
+        try:
+            if inspect.iscoroutinefunction(subscription.batch_callback_function):
+                is_processed = await subscription.batch_callback_function(data_items)
+            else:
+                is_processed = await asyncio.get_running_loop().run_in_executor(
+                    executor, subscription.batch_callback_function, data_items
+                )
+        except Exception as ex:
+            print(
+                f" [x] Error processing a batch of [{len(data_items)}] messages from [{subscription.queue_topic}]"
+                + f" for reason [{str(ex)}] ..."
+            )
+            is_processed = False
+
+        # The whole batch is either acked or retried later, depending on its callback result
+        for message, _ in messages_with_data:
+            if is_processed:
+                await message.ack()
+            else:
+                await self.__settle_failed_message(
+                    channel=channel,
+                    topology_cache=topology_cache,
+                    message=message,
+                    queue_name=subscription.queue_topic,
+                    error="The batch callback failed to process the batch",
+                )
+
+    async def __consume_batch_subscription(
+        self,
+        *,
+        channel: AbstractChannel,
+        topology_cache: PikaRabbitMqTopologyCache,
+        subscription: MessageBatchSubscription,
+        executor: ThreadPoolExecutor,
+        consume_forever: bool,
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> None:
+        queue = await topology_cache.get_bound_queue(
+            channel=channel,
+            exchange_name=subscription.exchange_name,
+            queue_name=subscription.queue_topic,
+        )
+
+        delivered_messages: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+        consumer_tag = await queue.consume(delivered_messages.put)
+
+        print(
+            f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+        )
+
+        try:
+            while True:
+                await self.__process_batch(
+                    channel=channel,
+                    topology_cache=topology_cache,
+                    batch=await self.__collect_batch(
+                        delivered_messages=delivered_messages,
+                        batch_size=batch_size,
+                        batch_timeout_in_ms=batch_timeout_in_ms,
+                    ),
+                    subscription=subscription,
+                    executor=executor,
+                )
+                if not consume_forever:
+                    return None
+        finally:
+            await queue.cancel(consumer_tag)
+
+    async def __process_consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        try:
+            connection = await self.__connect()
+
+            async with connection:
+                topology_cache = PikaRabbitMqTopologyCache()
+                topology_cache.watch_connection(connection=connection)
+                channel = await connection.channel()
+                topology_cache.watch_channel(channel=channel)
+                # Every subscription must be able to get a full batch delivered before acking it
+                await channel.set_qos(prefetch_count=batch_size * len(subscriptions))
+
+                with ThreadPoolExecutor(
+                    max_workers=len(subscriptions),
+                    thread_name_prefix=self.__class__.__name__,
+                ) as executor:
+                    await asyncio.gather(
+                        *(
+                            self.__consume_batch_subscription(
+                                channel=channel,
+                                topology_cache=topology_cache,
+                                subscription=subscription,
+                                executor=executor,
+                                consume_forever=consume_forever,
+                                batch_size=batch_size,
+                                batch_timeout_in_ms=batch_timeout_in_ms,
                             )
-                            if not consume_forever:
-                                return None
+                            for subscription in subscriptions
+                        )
+                    )
         except Exception as ex:
             return ConsumingMessageError(error=str(ex))
 
+    async def __consume_until_stopped(
+        self,
+        *,
+        consume_function: Callable[
+            [], Coroutine[Any, Any, ConsumingMessageError | None]
+        ],
+    ) -> ConsumingMessageError | None:
+        # Registering the consumption, so it can be cancelled from another thread by `stop_consuming`
+        consumption = (asyncio.get_running_loop(), asyncio.current_task())
+        with self.__consumptions_lock:
+            if self.__stopping_event.is_set():
+                return None
+            self.__consumptions.add(consumption)
+        try:
+            return await consume_function()
+        except asyncio.CancelledError:
+            if not self.__stopping_event.is_set():
+                raise
+            return None
+        finally:
+            with self.__consumptions_lock:
+                self.__consumptions.discard(consumption)
+
+    def __consume_with_retries(
+        self,
+        *,
+        queue_topics: str,
+        consume_function: Callable[
+            [], Coroutine[Any, Any, ConsumingMessageError | None]
+        ],
+        retry_attempts: int,
+        retry_timeout: int,
+    ) -> ConsumingMessageError | None:
+        attempt = 0
+        while True:
+            consumption_started_at = time.monotonic()
+            consumption_status = asyncio.run(
+                self.__consume_until_stopped(consume_function=consume_function)
+            )
+            if consumption_status is None:
+                return None
+
+            print(
+                f" [x] Error consuming messages for topic [{queue_topics}] for reason [{consumption_status.error}] ..."
+            )
+            # A consumption that has been running fine for a while gets all its retry attempts back
+            if time.monotonic() - consumption_started_at > 60:
+                attempt = 0
+            if attempt >= retry_attempts:
+                print(
+                    f" [x] Exhausted all retry attempts consuming messages from topic [{queue_topics}] ..."
+                )
+                return consumption_status
+
+            # Exponential backoff with some jitter, so the consumers don't all reconnect at once
+            backoff = random.uniform(0.5, 1) * min(
+                retry_timeout * 2**attempt, self.__max_retry_timeout
+            )
+            attempt += 1
+            print(
+                f" [x] Retrying again in [{backoff:.1f}] seconds, Remaining attempts [{retry_attempts - attempt}] ..."
+            )
+            if self.__stopping_event.wait(backoff):
+                return None
+
     def consume_messages[T](
         self,
         *,
         exchange_name: str,
         queue_topic: str,
-        deserialization_function: Callable[[dict[str, Any]], T],
+        deserialization_function: Callable[[QueueMessage], T],
         callback_function: Callable[[T], Any],
         consume_forever: bool = True,
         retry_attempts: int = 5,
         retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
     ) -> ConsumingMessageError | None:
-        def __process(*, initial_time: datetime.datetime, initial_retry_attempts: int):
-            consumption_status = asyncio.run(
-                self.__process_consume_messages(
+        return self.consume_subscriptions(
+            subscriptions=[
+                MessageSubscription(
                     exchange_name=exchange_name,
                     queue_topic=queue_topic,
                     deserialization_function=deserialization_function,
                     callback_function=callback_function,
-                    consume_forever=consume_forever,
                 )
-            )
-            current_retry_attempts = retry_attempts
-            if isinstance(consumption_status, ConsumingMessageError):
-                print(
-                    f" [x] Error consuming messages for topic [{queue_topic}] for reason [{consumption_status.error}] ..."
-                )
-                delta_time = datetime.datetime.now() - initial_time
-                if (
-                    delta_time.seconds > 60
-                ):  # if error is more than 1 min, repeat the retry attempts since it's not circular ;)
-                    current_retry_attempts = initial_retry_attempts
-
-                if current_retry_attempts > 0:
-                    print(
-                        f" [x] Retrying again in [{retry_timeout}] seconds, Remaining attempts [{retry_attempts-1}] ..."
-                    )
-                    time.sleep(retry_timeout)
-                    return self.consume_messages(
-                        exchange_name=exchange_name,
-                        queue_topic=queue_topic,
-                        deserialization_function=deserialization_function,
-                        callback_function=callback_function,
-                        consume_forever=consume_forever,
-                        retry_attempts=retry_attempts - 1,
-                        retry_timeout=retry_timeout,
-                    )
-                else:
-                    print(
-                        f" [x] Exhausted all retry attempts consuming messages from topic [{queue_topic}] ..."
-                    )
-                    return consumption_status
+            ],
+            consume_forever=consume_forever,
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
+        )
 
-        return __process(
-            initial_retry_attempts=retry_attempts, initial_time=datetime.datetime.now()
+    def consume_subscriptions(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 5,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        return self.__consume_with_retries(
+            queue_topics=", ".join(
+                subscription.queue_topic for subscription in subscriptions
+            ),
+            consume_function=lambda: self.__process_consume_messages(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                prefetch_count=prefetch_count,
+                max_concurrency=max_concurrency,
+            ),
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
         )
+
+    def consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 5,
+        retry_timeout: int = 3,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        return self.__consume_with_retries(
+            queue_topics=", ".join(
+                subscription.queue_topic for subscription in subscriptions
+            ),
+            consume_function=lambda: self.__process_consume_batches(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                batch_size=batch_size,
+                batch_timeout_in_ms=batch_timeout_in_ms,
+            ),
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+        )
+
+    def stop_consuming(self) -> None:
+        with self.__consumptions_lock:
+            self.__stopping_event.set()
+            consumptions = list(self.__consumptions)
+        for loop, consumption_task in consumptions:
+            if consumption_task is None:
+                continue
+            try:
+                loop.call_soon_threadsafe(consumption_task.cancel)
+            except RuntimeError:
+                # The event loop of the consumption has already been closed
+                continue
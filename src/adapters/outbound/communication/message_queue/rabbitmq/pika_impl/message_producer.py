@@ -2,8 +2,17 @@ from src.domain.entity.error.message_queue import ProducingMessageError
 from src.ports.outbound.communication.message_queue.message_producer import (
     MessageProducerInterface,
 )
-from aio_pika import DeliveryMode, ExchangeType, Message, connect_robust
+from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.topology_cache import (
+    PikaRabbitMqTopologyCache,
+)
+from aio_pika import DeliveryMode, Message, connect_robust
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+from itertools import batched
+from typing import Any, Iterable
 import asyncio
+import math
+import threading
 
 
 class PikaRabbitMqMessageProducer(MessageProducerInterface):
@@ -15,32 +24,92 @@ class PikaRabbitMqMessageProducer(MessageProducerInterface):
         rabbitmq_host: str,
         rabbitmq_port: int,
         connection_timeout: int = 5,
+        producing_timeout: int = 30,
+        channel_pool_size: int = 4,
+        max_in_flight_messages: int = 256,
     ) -> None:
         self.__rabbitmq_username = rabbitmq_username
         self.__rabbitmq_password = rabbitmq_password
         self.__rabbitmq_host = rabbitmq_host
         self.__rabbitmq_port = rabbitmq_port
         self.__connection_timeout = connection_timeout
+        self.__producing_timeout = producing_timeout
+        self.__channel_pool_size = channel_pool_size
+        self.__max_in_flight_messages = max_in_flight_messages
+
+        # The connection and its channels live on a dedicated event loop thread
+        # so every `produce_message` call (from any thread or loop) reuses them
+        self.__connection: AbstractRobustConnection | None = None
+        self.__channel_pool: Pool[AbstractChannel] | None = None
+        self.__connection_lock: asyncio.Lock | None = None
+        self.__topology_cache = PikaRabbitMqTopologyCache()
+        self.__is_closed: bool = False
+        self.__loop = asyncio.new_event_loop()
+        self.__loop_thread = threading.Thread(
+            target=self.__run_event_loop,
+            name=f"{self.__class__.__name__}-event-loop",
+            daemon=True,
+        )
+        self.__loop_thread.start()
+
+    def __run_event_loop(self) -> None:
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    async def __create_channel(self) -> AbstractChannel:
+        assert self.__connection is not None
+        channel = await self.__connection.channel(publisher_confirms=True)
+        self.__topology_cache.watch_channel(channel=channel)
+        return channel
+
+    async def __get_channel_pool(self) -> Pool[AbstractChannel]:
+        # Only touched from the producer's own event loop, so a lazily created lock is enough
+        if self.__connection_lock is None:
+            self.__connection_lock = asyncio.Lock()
+
+        async with self.__connection_lock:
+            if self.__channel_pool is None:
+                # The robust connection reconnects (and restores its channels) by itself
+                self.__connection = await connect_robust(
+                    host=self.__rabbitmq_host,
+                    port=self.__rabbitmq_port,
+                    login=self.__rabbitmq_username,
+                    password=self.__rabbitmq_password,
+                    timeout=self.__connection_timeout,
+                )
+                self.__topology_cache.clear()
+                self.__topology_cache.watch_connection(connection=self.__connection)
+                self.__channel_pool = Pool(
+                    self.__create_channel, max_size=self.__channel_pool_size
+                )
+            return self.__channel_pool
 
     async def __process_sending_message(
-        self, *, topic: str, data: bytes
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> ProducingMessageError | None:
         try:
-            connection = await connect_robust(
-                host=self.__rabbitmq_host,
-                port=self.__rabbitmq_port,
-                login=self.__rabbitmq_username,
-                password=self.__rabbitmq_password,
-                timeout=self.__connection_timeout,
-            )
+            channel_pool = await self.__get_channel_pool()
 
-            async with connection:
-                channel = await connection.channel()
-                exchange = await channel.declare_exchange(
-                    name=topic, type=ExchangeType.FANOUT
+            async with channel_pool.acquire() as channel:
+                if channel.is_closed:
+                    await channel.reopen()
+                exchange = await self.__topology_cache.get_exchange(
+                    channel=channel, exchange_name=topic
                 )
                 await exchange.publish(
-                    message=Message(data, delivery_mode=DeliveryMode.PERSISTENT),
+                    message=Message(
+                        data,
+                        content_type=content_type,
+                        headers=headers,
+                        priority=priority,
+                        delivery_mode=DeliveryMode.PERSISTENT,
+                    ),
                     routing_key="",
                 )
                 return None
@@ -48,9 +117,188 @@ class PikaRabbitMqMessageProducer(MessageProducerInterface):
             print(ex)
             return ProducingMessageError(error=str(ex))
 
+    async def __process_sending_messages(
+        self,
+        *,
+        topic: str,
+        data_items: list[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        results: list[ProducingMessageError | None] = []
+        try:
+            channel_pool = await self.__get_channel_pool()
+
+            async with channel_pool.acquire() as channel:
+                if channel.is_closed:
+                    await channel.reopen()
+                exchange = await self.__topology_cache.get_exchange(
+                    channel=channel, exchange_name=topic
+                )
+
+                # Publishing a window of messages at once and awaiting their confirms together
+                for data_items_window in batched(
+                    data_items, self.__max_in_flight_messages
+                ):
+                    publishing_statuses = await asyncio.gather(
+                        *(
+                            exchange.publish(
+                                message=Message(
+                                    data,
+                                    content_type=content_type,
+                                    headers=headers,
+                                    priority=priority,
+                                    delivery_mode=DeliveryMode.PERSISTENT,
+                                ),
+                                routing_key="",
+                                timeout=self.__producing_timeout,
+                            )
+                            for data in data_items_window
+                        ),
+                        return_exceptions=True,
+                    )
+                    results.extend(
+                        (
+                            ProducingMessageError(error=str(publishing_status))
+                            if isinstance(publishing_status, BaseException)
+                            else None
+                        )
+                        for publishing_status in publishing_statuses
+                    )
+        except Exception as ex:
+            # Failing the messages that haven't been published yet
+            results.extend(
+                ProducingMessageError(error=str(ex))
+                for _ in range(len(data_items) - len(results))
+            )
+        return results
+
+    async def __close_connection(self) -> None:
+        if self.__channel_pool is not None:
+            await self.__channel_pool.close()
+        if self.__connection is not None:
+            await self.__connection.close()
+        self.__channel_pool = None
+        self.__connection = None
+
     def produce_message(
-        self, *, topic: str, data: bytes
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> ProducingMessageError | None:
-        return asyncio.run(
-            self.__process_sending_message(topic=topic, data=data),
+        if self.__is_closed:
+            return ProducingMessageError(error="This message producer is closed !")
+
+        try:
+            return asyncio.run_coroutine_threadsafe(
+                self.__process_sending_message(
+                    topic=topic,
+                    data=data,
+                    content_type=content_type,
+                    headers=headers,
+                    priority=priority,
+                ),
+                self.__loop,
+            ).result(timeout=self.__producing_timeout)
+        except Exception as ex:
+            return ProducingMessageError(
+                error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+            )
+
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        data_items = list(data_items)
+        if self.__is_closed:
+            return [
+                ProducingMessageError(error="This message producer is closed !")
+                for _ in data_items
+            ]
+
+        # Bounding the whole call (connecting, getting a channel, declaring the exchange
+        # and publishing every window of messages) by the producing timeout of each window
+        producing_future = asyncio.run_coroutine_threadsafe(
+            self.__process_sending_messages(
+                topic=topic,
+                data_items=data_items,
+                content_type=content_type,
+                headers=headers,
+                priority=priority,
+            ),
+            self.__loop,
         )
+        try:
+            return producing_future.result(
+                timeout=self.__producing_timeout
+                * max(1, math.ceil(len(data_items) / self.__max_in_flight_messages))
+            )
+        except Exception as ex:
+            producing_future.cancel()
+            return [
+                ProducingMessageError(
+                    error=f"Error producing the messages to topic [{topic}] for reason [{str(ex) or type(ex).__name__}]"
+                )
+                for _ in data_items
+            ]
+
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        if self.__is_closed:
+            return ProducingMessageError(error="This message producer is closed !")
+
+        try:
+            # Awaiting the producer's loop from the caller's loop without blocking it
+            return await asyncio.wait_for(
+                asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(
+                        self.__process_sending_message(
+                            topic=topic,
+                            data=data,
+                            content_type=content_type,
+                            headers=headers,
+                            priority=priority,
+                        ),
+                        self.__loop,
+                    )
+                ),
+                timeout=self.__producing_timeout,
+            )
+        except Exception as ex:
+            return ProducingMessageError(
+                error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+            )
+
+    def close(self) -> None:
+        if self.__is_closed:
+            return None
+        self.__is_closed = True
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self.__close_connection(), self.__loop
+            ).result(timeout=self.__connection_timeout)
+        except Exception as ex:
+            print(f" [x] Error closing the message producer for reason [{str(ex)}] ...")
+        finally:
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__loop_thread.join(timeout=self.__connection_timeout)
+            if not self.__loop_thread.is_alive():
+                self.__loop.close()
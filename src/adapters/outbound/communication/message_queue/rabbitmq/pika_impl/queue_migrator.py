@@ -0,0 +1,98 @@
+from typing import Any
+
+from aio_pika import DeliveryMode, ExchangeType, Message, connect_robust
+from aio_pika.exceptions import ChannelNotFoundEntity
+
+
+class PikaRabbitMqQueueMigrator:
+    """Moving the messages of a queue that can't be redeclared with its new arguments (RabbitMQ refuses
+    it with PRECONDITION_FAILED) to the new queue replacing it, then deleting the old one
+    """
+
+    def __init__(
+        self,
+        *,
+        rabbitmq_username: str,
+        rabbitmq_password: str,
+        rabbitmq_host: str,
+        rabbitmq_port: int,
+        connection_timeout: int = 5,
+    ) -> None:
+        self.__rabbitmq_username = rabbitmq_username
+        self.__rabbitmq_password = rabbitmq_password
+        self.__rabbitmq_host = rabbitmq_host
+        self.__rabbitmq_port = rabbitmq_port
+        self.__connection_timeout = connection_timeout
+
+    async def migrate_queue(
+        self,
+        *,
+        exchange_name: str,
+        old_queue_name: str,
+        new_queue_name: str,
+        new_queue_arguments: dict[str, Any] | None = None,
+    ) -> int:
+        """Migrating a queue bound to an exchange, its consumers must have been stopped before
+
+        Args:
+            exchange_name (str): The exchange both queues are bound to
+            old_queue_name (str): The queue to drain and delete, nothing is done when it doesn't exist
+            new_queue_name (str): The queue to move the messages to, declared (and bound) if needed
+            new_queue_arguments (dict[str, Any] | None): The arguments of the new queue, like its max priority
+
+        Returns:
+            int: The count of the moved messages
+        """
+        connection = await connect_robust(
+            host=self.__rabbitmq_host,
+            port=self.__rabbitmq_port,
+            login=self.__rabbitmq_username,
+            password=self.__rabbitmq_password,
+            timeout=self.__connection_timeout,
+        )
+        async with connection:
+            channel = await connection.channel()
+            exchange = await channel.declare_exchange(
+                name=exchange_name, type=ExchangeType.FANOUT
+            )
+            new_queue = await channel.declare_queue(
+                name=new_queue_name, durable=True, arguments=new_queue_arguments
+            )
+            await new_queue.bind(exchange)
+
+            try:
+                # A failed passive declaration closes its channel, so it gets one of its own
+                old_queue = await (await connection.channel()).declare_queue(
+                    name=old_queue_name, passive=True
+                )
+            except ChannelNotFoundEntity:
+                return 0
+
+            # Stopping the flow of the new messages first, the new queue is already getting them
+            await old_queue.unbind(exchange)
+            moved_messages_count = 0
+            while (
+                message := await old_queue.get(no_ack=False, fail=False)
+            ) is not None:
+                # The message is only acked once the broker has confirmed having its copy
+                await channel.default_exchange.publish(
+                    message=Message(
+                        message.body,
+                        content_type=message.content_type,
+                        content_encoding=message.content_encoding,
+                        headers=message.headers,
+                        delivery_mode=DeliveryMode.PERSISTENT,
+                        priority=message.priority,
+                        correlation_id=message.correlation_id,
+                        message_id=message.message_id,
+                        timestamp=message.timestamp,
+                        type=message.type,
+                        app_id=message.app_id,
+                    ),
+                    routing_key=new_queue_name,
+                )
+                await message.ack()
+                moved_messages_count += 1
+
+            await old_queue.delete(if_unused=True, if_empty=True)
+            return moved_messages_count
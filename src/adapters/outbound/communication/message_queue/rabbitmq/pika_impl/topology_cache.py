@@ -0,0 +1,93 @@
+from typing import Any
+
+from aio_pika import ExchangeType
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractQueue,
+    AbstractRobustConnection,
+)
+
+
+class PikaRabbitMqTopologyCache:
+    """Remembering the exchanges/queues that have been declared over a connection, so publishing
+    or consuming again doesn't pay a declaration round trip to the broker every time.
+    The cache is cleared whenever the connection reconnects or a channel gets closed/reopened
+    since the broker may have lost (or never got) the declarations by then
+    """
+
+    def __init__(self) -> None:
+        self.__declared_exchanges: set[str] = set()
+        self.__declared_bound_queues: set[tuple[str, str]] = set()
+        self.__declared_queues: set[str] = set()
+
+    def clear(self, *_: Any) -> None:
+        self.__declared_exchanges.clear()
+        self.__declared_bound_queues.clear()
+        self.__declared_queues.clear()
+
+    def watch_connection(self, *, connection: AbstractRobustConnection) -> None:
+        connection.reconnect_callbacks.add(self.clear)
+
+    def watch_channel(self, *, channel: AbstractChannel) -> None:
+        channel.close_callbacks.add(self.clear)
+
+    async def get_exchange(
+        self,
+        *,
+        channel: AbstractChannel,
+        exchange_name: str,
+        exchange_type: ExchangeType = ExchangeType.FANOUT,
+    ) -> AbstractExchange:
+        if exchange_name in self.__declared_exchanges:
+            return await channel.get_exchange(name=exchange_name, ensure=False)
+
+        exchange = await channel.declare_exchange(
+            name=exchange_name, type=exchange_type
+        )
+        self.__declared_exchanges.add(exchange_name)
+        return exchange
+
+    async def get_bound_queue(
+        self,
+        *,
+        channel: AbstractChannel,
+        exchange_name: str,
+        queue_name: str,
+        arguments: dict[str, Any] | None = None,
+        durable: bool = True,
+        auto_delete: bool = False,
+    ) -> AbstractQueue:
+        if (exchange_name, queue_name) in self.__declared_bound_queues:
+            return await channel.get_queue(name=queue_name, ensure=False)
+
+        exchange = await self.get_exchange(channel=channel, exchange_name=exchange_name)
+        queue = await channel.declare_queue(
+            name=queue_name,
+            durable=durable,
+            auto_delete=auto_delete,
+            arguments=arguments,
+        )
+        await queue.bind(exchange)
+        self.__declared_bound_queues.add((exchange_name, queue_name))
+        return queue
+
+    async def get_queue(
+        self,
+        *,
+        channel: AbstractChannel,
+        queue_name: str,
+        arguments: dict[str, Any] | None = None,
+        durable: bool = True,
+    ) -> AbstractQueue:
+        """Getting a queue that isn't bound to any exchange, its messages are published to it directly
+        through the default exchange (with the queue name as the routing key)
+        """
+        if queue_name in self.__declared_queues:
+            return await channel.get_queue(name=queue_name, ensure=False)
+
+        queue = await channel.declare_queue(
+            name=queue_name, durable=durable, arguments=arguments
+        )
+        self.__declared_queues.add(queue_name)
+        return queue
@@ -0,0 +1,543 @@
+import json
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Generator
+
+from src.domain.entity.message_queue.queue_message import QueueMessage
+
+
+class Sqlite3MessageBroker:
+    """A durable broker on a local SQLite (WAL) file keeping the same semantics the RabbitMQ adapters
+    rely on: a fanout exchange per topic, named queues bound to it (shared by competing consumers, even
+    from different processes) and messages being dropped when published to an exchange that has no
+    bound queues yet.
+
+    Every message is stored once per exchange and each bound queue keeps a cursor over it, a claimed
+    message becomes an in-flight delivery that is invisible to the other consumers until it's acknowledged
+    or its visibility timeout expires (then it's redelivered), so a crashed consumer never loses messages.
+    A message that keeps failing is delivered again after growing delays, then moved to the parked
+    messages of its queue to be inspected, like the retry and parking queues of the RabbitMQ adapters.
+    A transient queue is leased to its consumer, which keeps renewing it, so the queue of a consumer that
+    died (without unbinding it) expires along with its pending messages instead of keeping the messages
+    of its exchange forever.
+    All the statements run on one dedicated thread (and connection) of the process, since SQLite has a
+    single writer anyway, and the methods return futures so both sync and async callers can wait for them
+    """
+
+    def __init__(
+        self,
+        *,
+        database_path: str,
+        visibility_timeout_in_s: float = 30,
+        busy_timeout_in_ms: int = 5000,
+    ) -> None:
+        self.__database_path = database_path
+        self.__visibility_timeout_in_s = visibility_timeout_in_s
+        self.__busy_timeout_in_ms = busy_timeout_in_ms
+        self.__connection: sqlite3.Connection | None = None
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.__class__.__name__
+        )
+        self.__executor.submit(self.__create_tables).result()
+
+    def get_visibility_timeout_in_s(self) -> float:
+        return self.__visibility_timeout_in_s
+
+    def __get_connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            # Managing the transactions explicitly, so claiming takes the write lock right away
+            self.__connection = sqlite3.connect(
+                self.__database_path,
+                isolation_level=None,
+                timeout=self.__busy_timeout_in_ms / 1000,
+            )
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            # A committed message survives a crash of the process, only an OS crash may lose the last ones
+            self.__connection.execute("PRAGMA synchronous=NORMAL")
+        return self.__connection
+
+    @contextmanager
+    def __transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        connection = self.__get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def __create_tables(self) -> None:
+        with self.__transaction() as connection:
+            # AUTOINCREMENT never reuses the ids of deleted messages, which the cursors rely on
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    exchange_name TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    content_type TEXT,
+                    headers TEXT NOT NULL
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS messages_exchange_name_id ON messages (exchange_name, id)"
+            )
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS bindings (
+                    exchange_name TEXT NOT NULL,
+                    queue_name TEXT NOT NULL,
+                    last_message_id INTEGER NOT NULL,
+                    -- NULL for the durable queues, the transient ones are deleted once expired
+                    expires_at REAL,
+                    PRIMARY KEY (exchange_name, queue_name)
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS bindings_expires_at ON bindings (expires_at)"
+            )
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS deliveries (
+                    queue_name TEXT NOT NULL,
+                    message_id INTEGER NOT NULL,
+                    visible_at REAL NOT NULL,
+                    delivery_count INTEGER NOT NULL,
+                    PRIMARY KEY (queue_name, message_id)
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS deliveries_queue_name_visible_at ON deliveries (queue_name, visible_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS deliveries_message_id ON deliveries (message_id)"
+            )
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS parked_messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    queue_name TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    content_type TEXT,
+                    headers TEXT NOT NULL,
+                    parked_at REAL NOT NULL
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS parked_messages_queue_name_id ON parked_messages (queue_name, id)"
+            )
+
+    def __bind_queue(
+        self, *, exchange_name: str, queue_name: str, is_transient: bool
+    ) -> None:
+        with self.__transaction() as connection:
+            self.__delete_expired_bindings(connection=connection)
+            # A new queue only gets the messages published after its binding, like on RabbitMQ
+            connection.execute(
+                """INSERT INTO bindings (exchange_name, queue_name, last_message_id, expires_at)
+                VALUES (?, ?, (SELECT COALESCE(MAX(id), 0) FROM messages), ?)
+                ON CONFLICT (exchange_name, queue_name) DO UPDATE SET expires_at = excluded.expires_at""",
+                (
+                    exchange_name,
+                    queue_name,
+                    time.time() + self.__visibility_timeout_in_s
+                    if is_transient
+                    else None,
+                ),
+            )
+
+    @staticmethod
+    def __delete_binding(
+        *, connection: sqlite3.Connection, exchange_name: str, queue_name: str
+    ) -> None:
+        connection.execute(
+            "DELETE FROM bindings WHERE exchange_name = ? AND queue_name = ?",
+            (exchange_name, queue_name),
+        )
+        connection.execute("DELETE FROM deliveries WHERE queue_name = ?", (queue_name,))
+        # Deleting the messages that were only kept for this queue
+        connection.execute(
+            """DELETE FROM messages
+            WHERE exchange_name = ?
+            AND id <= COALESCE(
+                (SELECT MIN(last_message_id) FROM bindings WHERE exchange_name = ?),
+                (SELECT MAX(id) FROM messages)
+            )
+            AND NOT EXISTS (SELECT 1 FROM deliveries WHERE deliveries.message_id = messages.id)""",
+            (exchange_name, exchange_name),
+        )
+
+    def __delete_expired_bindings(self, *, connection: sqlite3.Connection) -> None:
+        for exchange_name, queue_name in connection.execute(
+            "SELECT exchange_name, queue_name FROM bindings WHERE expires_at <= ?",
+            (time.time(),),
+        ).fetchall():
+            print(
+                f" [*] Deleting the expired transient queue [{queue_name}] of [{exchange_name}] ..."
+            )
+            self.__delete_binding(
+                connection=connection,
+                exchange_name=exchange_name,
+                queue_name=queue_name,
+            )
+
+    def __unbind_queue(self, *, exchange_name: str, queue_name: str) -> None:
+        with self.__transaction() as connection:
+            self.__delete_binding(
+                connection=connection,
+                exchange_name=exchange_name,
+                queue_name=queue_name,
+            )
+
+    def __renew_transient_queues(self, *, queue_names: list[str]) -> None:
+        with self.__transaction() as connection:
+            connection.executemany(
+                "UPDATE bindings SET expires_at = ? WHERE queue_name = ? AND expires_at IS NOT NULL",
+                (
+                    (time.time() + self.__visibility_timeout_in_s, queue_name)
+                    for queue_name in queue_names
+                ),
+            )
+            # Every live consumer takes part in deleting the queues of the dead ones
+            self.__delete_expired_bindings(connection=connection)
+
+    def __publish(self, *, exchange_name: str, messages: list[QueueMessage]) -> None:
+        with self.__transaction() as connection:
+            if (
+                connection.execute(
+                    "SELECT 1 FROM bindings WHERE exchange_name = ? LIMIT 1",
+                    (exchange_name,),
+                ).fetchone()
+                is None
+            ):
+                return None
+
+            connection.executemany(
+                "INSERT INTO messages (exchange_name, body, content_type, headers) VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        exchange_name,
+                        message.body,
+                        message.content_type,
+                        json.dumps(message.headers),
+                    )
+                    for message in messages
+                ),
+            )
+
+    def __has_deliverable_messages(self, *, queue_name: str, now: float) -> bool:
+        # A read doesn't wait for the writers in WAL mode, so idle consumers polling don't take the write lock
+        return (
+            self.__get_connection()
+            .execute(
+                """SELECT EXISTS (
+                    SELECT 1 FROM deliveries WHERE queue_name = ? AND visible_at <= ?
+                ) OR EXISTS (
+                    SELECT 1 FROM bindings
+                    JOIN messages ON messages.exchange_name = bindings.exchange_name
+                        AND messages.id > bindings.last_message_id
+                    WHERE bindings.queue_name = ?
+                )""",
+                (queue_name, now, queue_name),
+            )
+            .fetchone()[0]
+            == 1
+        )
+
+    def __claim(
+        self, *, queue_name: str, max_messages: int
+    ) -> list[tuple[int, QueueMessage]]:
+        now = time.time()
+        if not self.__has_deliverable_messages(queue_name=queue_name, now=now):
+            return []
+
+        visible_at = now + self.__visibility_timeout_in_s
+        with self.__transaction() as connection:
+            # Redelivering first the messages whose visibility timeout has expired (or were requeued)
+            message_ids: list[int] = [
+                message_id
+                for (message_id,) in connection.execute(
+                    """SELECT message_id FROM deliveries WHERE queue_name = ? AND visible_at <= ?
+                    ORDER BY message_id LIMIT ?""",
+                    (queue_name, now, max_messages),
+                )
+            ]
+            connection.executemany(
+                """UPDATE deliveries SET visible_at = ?, delivery_count = delivery_count + 1
+                WHERE queue_name = ? AND message_id = ?""",
+                ((visible_at, queue_name, message_id) for message_id in message_ids),
+            )
+
+            # Then moving the queue's cursors forward over the new messages of its exchanges
+            for exchange_name, last_message_id in connection.execute(
+                "SELECT exchange_name, last_message_id FROM bindings WHERE queue_name = ?",
+                (queue_name,),
+            ).fetchall():
+                if len(message_ids) >= max_messages:
+                    break
+                new_message_ids: list[int] = [
+                    message_id
+                    for (message_id,) in connection.execute(
+                        "SELECT id FROM messages WHERE exchange_name = ? AND id > ? ORDER BY id LIMIT ?",
+                        (
+                            exchange_name,
+                            last_message_id,
+                            max_messages - len(message_ids),
+                        ),
+                    )
+                ]
+                if not new_message_ids:
+                    continue
+                connection.executemany(
+                    """INSERT INTO deliveries (queue_name, message_id, visible_at, delivery_count)
+                    VALUES (?, ?, ?, 1)""",
+                    (
+                        (queue_name, message_id, visible_at)
+                        for message_id in new_message_ids
+                    ),
+                )
+                connection.execute(
+                    "UPDATE bindings SET last_message_id = ? WHERE exchange_name = ? AND queue_name = ?",
+                    (new_message_ids[-1], exchange_name, queue_name),
+                )
+                message_ids.extend(new_message_ids)
+
+            if not message_ids:
+                return []
+
+            return [
+                (
+                    message_id,
+                    QueueMessage(
+                        body=body,
+                        content_type=content_type,
+                        headers=json.loads(headers),
+                    ),
+                )
+                for message_id, body, content_type, headers in connection.execute(
+                    f"""SELECT id, body, content_type, headers FROM messages
+                    WHERE id IN ({", ".join("?" * len(message_ids))}) ORDER BY id""",
+                    message_ids,
+                )
+            ]
+
+    def __extend_visibility(self, *, queue_name: str, message_ids: list[int]) -> None:
+        visible_at = time.time() + self.__visibility_timeout_in_s
+        with self.__transaction() as connection:
+            connection.executemany(
+                "UPDATE deliveries SET visible_at = ? WHERE queue_name = ? AND message_id = ?",
+                ((visible_at, queue_name, message_id) for message_id in message_ids),
+            )
+
+    def __acknowledge(self, *, queue_name: str, message_ids: list[int]) -> None:
+        with self.__transaction() as connection:
+            self.__delete_deliveries(
+                connection=connection, queue_name=queue_name, message_ids=message_ids
+            )
+
+    @staticmethod
+    def __delete_deliveries(
+        *, connection: sqlite3.Connection, queue_name: str, message_ids: list[int]
+    ) -> None:
+        connection.executemany(
+            "DELETE FROM deliveries WHERE queue_name = ? AND message_id = ?",
+            ((queue_name, message_id) for message_id in message_ids),
+        )
+        # Deleting the messages that every queue bound to their exchange is done with
+        connection.execute(
+            f"""DELETE FROM messages
+            WHERE id IN ({", ".join("?" * len(message_ids))})
+            AND id <= (
+                SELECT MIN(last_message_id) FROM bindings
+                WHERE bindings.exchange_name = messages.exchange_name
+            )
+            AND NOT EXISTS (SELECT 1 FROM deliveries WHERE deliveries.message_id = messages.id)""",
+            message_ids,
+        )
+
+    def __retry_or_park(
+        self,
+        *,
+        queue_name: str,
+        message_id: int,
+        error: str,
+        retry_delays_in_s: tuple[float, ...],
+        retry_count_header: str,
+        last_error_header: str,
+    ) -> bool:
+        with self.__transaction() as connection:
+            delivery = connection.execute(
+                "SELECT delivery_count FROM deliveries WHERE queue_name = ? AND message_id = ?",
+                (queue_name, message_id),
+            ).fetchone()
+            if delivery is None:
+                return False
+
+            # Every delivery (even the ones of a consumer that died meanwhile) counts as an attempt
+            (delivery_count,) = delivery
+            if delivery_count <= len(retry_delays_in_s):
+                connection.execute(
+                    "UPDATE deliveries SET visible_at = ? WHERE queue_name = ? AND message_id = ?",
+                    (
+                        time.time() + retry_delays_in_s[delivery_count - 1],
+                        queue_name,
+                        message_id,
+                    ),
+                )
+                return False
+
+            body, content_type, headers = connection.execute(
+                "SELECT body, content_type, headers FROM messages WHERE id = ?",
+                (message_id,),
+            ).fetchone()
+            connection.execute(
+                """INSERT INTO parked_messages (queue_name, body, content_type, headers, parked_at)
+                VALUES (?, ?, ?, ?, ?)""",
+                (
+                    queue_name,
+                    body,
+                    content_type,
+                    json.dumps(
+                        json.loads(headers)
+                        | {
+                            retry_count_header: delivery_count,
+                            last_error_header: error[:1000],
+                        }
+                    ),
+                    time.time(),
+                ),
+            )
+            self.__delete_deliveries(
+                connection=connection, queue_name=queue_name, message_ids=[message_id]
+            )
+            return True
+
+    def __get_parked_messages(
+        self, *, queue_name: str, limit: int
+    ) -> list[QueueMessage]:
+        return [
+            QueueMessage(
+                body=body, content_type=content_type, headers=json.loads(headers)
+            )
+            for body, content_type, headers in self.__get_connection().execute(
+                """SELECT body, content_type, headers FROM parked_messages
+                WHERE queue_name = ? ORDER BY id LIMIT ?""",
+                (queue_name, limit),
+            )
+        ]
+
+    def __requeue(self, *, queue_name: str, message_ids: list[int]) -> None:
+        with self.__transaction() as connection:
+            connection.executemany(
+                "UPDATE deliveries SET visible_at = 0 WHERE queue_name = ? AND message_id = ?",
+                ((queue_name, message_id) for message_id in message_ids),
+            )
+
+    def bind_queue(
+        self, *, exchange_name: str, queue_name: str, is_transient: bool = False
+    ) -> Future[None]:
+        """Declaring (if needed) a queue bound to an exchange, a transient one expires after the visibility
+        timeout unless its consumer keeps renewing it (see `renew_transient_queues`)
+        """
+        return self.__executor.submit(
+            self.__bind_queue,
+            exchange_name=exchange_name,
+            queue_name=queue_name,
+            is_transient=is_transient,
+        )
+
+    def renew_transient_queues(self, *, queue_names: list[str]) -> Future[None]:
+        """Keeping the transient queues of a live consumer for another visibility timeout (like a heartbeat),
+        and deleting the expired ones of the consumers that died
+        """
+        return self.__executor.submit(
+            self.__renew_transient_queues, queue_names=queue_names
+        )
+
+    def unbind_queue(self, *, exchange_name: str, queue_name: str) -> Future[None]:
+        """Deleting a queue (with its pending messages) from an exchange, like a transient queue
+        whose consumer is gone
+        """
+        return self.__executor.submit(
+            self.__unbind_queue, exchange_name=exchange_name, queue_name=queue_name
+        )
+
+    def publish(
+        self, *, exchange_name: str, messages: list[QueueMessage]
+    ) -> Future[None]:
+        """Publishing messages (all or none of them) to all the queues bound to an exchange"""
+        return self.__executor.submit(
+            self.__publish, exchange_name=exchange_name, messages=messages
+        )
+
+    def claim(
+        self, *, queue_name: str, max_messages: int
+    ) -> Future[list[tuple[int, QueueMessage]]]:
+        """Claiming up to `max_messages` deliverable messages (with their ids) from a queue, they stay
+        invisible to the other consumers for the visibility timeout
+        """
+        return self.__executor.submit(
+            self.__claim, queue_name=queue_name, max_messages=max_messages
+        )
+
+    def extend_visibility(
+        self, *, queue_name: str, message_ids: list[int]
+    ) -> Future[None]:
+        """Keeping claimed messages invisible for another visibility timeout while they are still being processed"""
+        return self.__executor.submit(
+            self.__extend_visibility, queue_name=queue_name, message_ids=message_ids
+        )
+
+    def acknowledge(self, *, queue_name: str, message_ids: list[int]) -> Future[None]:
+        """Removing claimed messages from a queue, whether they were processed or rejected"""
+        return self.__executor.submit(
+            self.__acknowledge, queue_name=queue_name, message_ids=message_ids
+        )
+
+    def retry_or_park(
+        self,
+        *,
+        queue_name: str,
+        message_id: int,
+        error: str,
+        retry_delays_in_s: tuple[float, ...],
+        retry_count_header: str = "x-retry-count",
+        last_error_header: str = "x-last-error",
+    ) -> Future[bool]:
+        """Delivering a claimed message that failed to be processed again after the delay of its attempt,
+        or parking it (with its attempts count and error in its headers) once all the delays are exhausted
+
+        Returns:
+            Future[bool]: Whether the message has been parked
+        """
+        return self.__executor.submit(
+            self.__retry_or_park,
+            queue_name=queue_name,
+            message_id=message_id,
+            error=error,
+            retry_delays_in_s=retry_delays_in_s,
+            retry_count_header=retry_count_header,
+            last_error_header=last_error_header,
+        )
+
+    def get_parked_messages(
+        self, *, queue_name: str, limit: int = 100
+    ) -> Future[list[QueueMessage]]:
+        """Getting the oldest parked messages of a queue, to be inspected"""
+        return self.__executor.submit(
+            self.__get_parked_messages, queue_name=queue_name, limit=limit
+        )
+
+    def requeue(self, *, queue_name: str, message_ids: list[int]) -> Future[None]:
+        """Making claimed messages deliverable again right away"""
+        return self.__executor.submit(
+            self.__requeue, queue_name=queue_name, message_ids=message_ids
+        )
+
+    def close(self) -> None:
+        def __close_connection() -> None:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+        self.__executor.submit(__close_connection).result()
+        self.__executor.shutdown()
@@ -0,0 +1,672 @@
+import asyncio
+import inspect
+import random
+import threading
+from collections import deque
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine
+
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_broker import (
+    Sqlite3MessageBroker,
+)
+from src.domain.entity.error.message_queue import ConsumingMessageError
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.ports.outbound.communication.message_queue.message_consumer import (
+    MessageConsumerInterface,
+)
+
+
+class Sqlite3MessageConsumer(MessageConsumerInterface):
+    """Consuming from the SQLite broker by polling its queues, the claimed messages are kept invisible
+    to the other consumers while they are being processed, then acknowledged (or requeued). The messages
+    that fail to be processed are delivered again after each of the retry delays, then parked
+    """
+
+    RETRY_COUNT_HEADER: str = "x-retry-count"
+    LAST_ERROR_HEADER: str = "x-last-error"
+
+    def __init__(
+        self,
+        *,
+        message_broker: Sqlite3MessageBroker,
+        polling_interval_in_ms: int = 100,
+        retry_delays_in_ms: tuple[int, ...] = (5_000, 30_000, 300_000),
+        max_retry_timeout: int = 60,
+    ) -> None:
+        self.__message_broker = message_broker
+        self.__polling_interval_in_s = polling_interval_in_ms / 1000
+        self.__retry_delays_in_s = tuple(
+            retry_delay_in_ms / 1000 for retry_delay_in_ms in retry_delays_in_ms
+        )
+        self.__max_retry_timeout = max_retry_timeout
+        self.__stopping_event = threading.Event()
+        self.__consumptions_lock = threading.Lock()
+        self.__consumptions: set[
+            tuple[asyncio.AbstractEventLoop, asyncio.Task[Any] | None]
+        ] = set()
+
+    async def __claim(
+        self, *, queue_name: str, max_messages: int
+    ) -> list[tuple[int, QueueMessage]]:
+        return await asyncio.wrap_future(
+            self.__message_broker.claim(
+                queue_name=queue_name, max_messages=max_messages
+            )
+        )
+
+    async def __acknowledge(self, *, queue_name: str, message_ids: list[int]) -> None:
+        await asyncio.wrap_future(
+            self.__message_broker.acknowledge(
+                queue_name=queue_name, message_ids=message_ids
+            )
+        )
+
+    async def __settle_failed_message(
+        self, *, queue_name: str, message_id: int, error: str
+    ) -> None:
+        is_parked = await asyncio.wrap_future(
+            self.__message_broker.retry_or_park(
+                queue_name=queue_name,
+                message_id=message_id,
+                error=error,
+                retry_delays_in_s=self.__retry_delays_in_s,
+                retry_count_header=self.RETRY_COUNT_HEADER,
+                last_error_header=self.LAST_ERROR_HEADER,
+            )
+        )
+        print(
+            f" [x] {'Parked' if is_parked else 'Retrying later'} message [{message_id}] from [{queue_name}]"
+            + f" for reason [{error}] ..."
+        )
+
+    async def __keep_messages_invisible(
+        self,
+        *,
+        in_flight_message_ids: dict[str, set[int]],
+        transient_queue_names: list[str],
+    ) -> None:
+        # Extending the visibility timeout of the messages still being processed and the lease
+        # of the transient queues (like a heartbeat), so only the messages and the transient queues
+        # of a consumer that died are being redelivered or deleted
+        while True:
+            await asyncio.sleep(self.__message_broker.get_visibility_timeout_in_s() / 3)
+            try:
+                await asyncio.wrap_future(
+                    self.__message_broker.renew_transient_queues(
+                        queue_names=transient_queue_names
+                    )
+                )
+            except Exception as ex:
+                print(
+                    f" [x] Error renewing the transient queues [{transient_queue_names}] for reason [{str(ex)}] ..."
+                )
+            for queue_name, message_ids in in_flight_message_ids.items():
+                if not message_ids:
+                    continue
+                try:
+                    await asyncio.wrap_future(
+                        self.__message_broker.extend_visibility(
+                            queue_name=queue_name, message_ids=list(message_ids)
+                        )
+                    )
+                except Exception as ex:
+                    print(
+                        f" [x] Error extending the visibility of messages from [{queue_name}] for reason [{str(ex)}] ..."
+                    )
+
+    async def __process_message[T](
+        self,
+        *,
+        queue_message: QueueMessage,
+        deserialization_function: Callable[[QueueMessage], T],
+        callback_function: Callable[[T], Any],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        if inspect.iscoroutinefunction(callback_function):
+            await callback_function(deserialization_function(queue_message))
+            return None
+
+        await asyncio.get_running_loop().run_in_executor(
+            executor,
+            lambda: callback_function(deserialization_function(queue_message)),
+        )
+
+    async def __process_message_safely[T](
+        self,
+        *,
+        message_id: int,
+        queue_message: QueueMessage,
+        subscription: MessageSubscription[T],
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+        in_flight_message_ids: set[int],
+    ) -> None:
+        error: str | None = None
+        try:
+            await self.__process_message(
+                queue_message=queue_message,
+                deserialization_function=subscription.deserialization_function,
+                callback_function=subscription.callback_function,
+                executor=executor,
+            )
+        except Exception as ex:
+            error = str(ex)
+            print(
+                f" [x] Error processing message from [{subscription.queue_topic}] for reason [{error}] ..."
+            )
+        finally:
+            try:
+                if error is None:
+                    await self.__acknowledge(
+                        queue_name=subscription.queue_topic, message_ids=[message_id]
+                    )
+                else:
+                    await self.__settle_failed_message(
+                        queue_name=subscription.queue_topic,
+                        message_id=message_id,
+                        error=error,
+                    )
+            except Exception as ex:
+                print(
+                    f" [x] Error settling message from [{subscription.queue_topic}] for reason [{str(ex)}],"
+                    + " it will be redelivered after its visibility timeout ..."
+                )
+            finally:
+                in_flight_message_ids.discard(message_id)
+                workers_semaphore.release()
+
+    async def __consume_subscription(
+        self,
+        *,
+        subscription: MessageSubscription,
+        executor: ThreadPoolExecutor,
+        workers_semaphore: asyncio.Semaphore,
+        prefetch_count: int,
+        in_flight_message_ids: set[int],
+        processing_tasks: set[asyncio.Task],
+    ) -> None:
+        prefetched_messages: deque[tuple[int, QueueMessage]] = deque()
+        while True:
+            if not prefetched_messages:
+                claimed_messages = await self.__claim(
+                    queue_name=subscription.queue_topic, max_messages=prefetch_count
+                )
+                if not claimed_messages:
+                    await asyncio.sleep(self.__polling_interval_in_s)
+                    continue
+                prefetched_messages.extend(claimed_messages)
+                in_flight_message_ids.update(
+                    message_id for message_id, _ in claimed_messages
+                )
+
+            await workers_semaphore.acquire()
+            message_id, queue_message = prefetched_messages.popleft()
+            processing_task = asyncio.create_task(
+                self.__process_message_safely(
+                    message_id=message_id,
+                    queue_message=queue_message,
+                    subscription=subscription,
+                    executor=executor,
+                    workers_semaphore=workers_semaphore,
+                    in_flight_message_ids=in_flight_message_ids,
+                )
+            )
+            processing_tasks.add(processing_task)
+            processing_task.add_done_callback(processing_tasks.discard)
+
+    async def __consume_one_message(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        executor: ThreadPoolExecutor,
+        in_flight_message_ids: dict[str, set[int]],
+    ) -> None:
+        while True:
+            for subscription in subscriptions:
+                claimed_messages = await self.__claim(
+                    queue_name=subscription.queue_topic, max_messages=1
+                )
+                if not claimed_messages:
+                    continue
+
+                message_id, queue_message = claimed_messages[0]
+                in_flight_message_ids[subscription.queue_topic].add(message_id)
+                try:
+                    await self.__process_message(
+                        queue_message=queue_message,
+                        deserialization_function=subscription.deserialization_function,
+                        callback_function=subscription.callback_function,
+                        executor=executor,
+                    )
+                except Exception as ex:
+                    in_flight_message_ids[subscription.queue_topic].discard(message_id)
+                    await self.__settle_failed_message(
+                        queue_name=subscription.queue_topic,
+                        message_id=message_id,
+                        error=str(ex),
+                    )
+                    raise
+                in_flight_message_ids[subscription.queue_topic].discard(message_id)
+                await self.__acknowledge(
+                    queue_name=subscription.queue_topic, message_ids=[message_id]
+                )
+                return None
+
+            await asyncio.sleep(self.__polling_interval_in_s)
+
+    async def __process_consume_messages(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        try:
+            for subscription in subscriptions:
+                await asyncio.wrap_future(
+                    self.__message_broker.bind_queue(
+                        exchange_name=subscription.exchange_name,
+                        queue_name=subscription.queue_topic,
+                        is_transient=subscription.is_transient,
+                    )
+                )
+                print(
+                    f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+                )
+
+            in_flight_message_ids: dict[str, set[int]] = {
+                subscription.queue_topic: set() for subscription in subscriptions
+            }
+            visibility_task = asyncio.create_task(
+                self.__keep_messages_invisible(
+                    in_flight_message_ids=in_flight_message_ids,
+                    transient_queue_names=[
+                        subscription.queue_topic
+                        for subscription in subscriptions
+                        if subscription.is_transient
+                    ],
+                )
+            )
+            reserved_concurrencies = [
+                subscription.max_concurrency
+                for subscription in subscriptions
+                if subscription.max_concurrency is not None
+            ]
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=max_concurrency + sum(reserved_concurrencies),
+                    thread_name_prefix=self.__class__.__name__,
+                ) as executor:
+                    if not consume_forever:
+                        await self.__consume_one_message(
+                            subscriptions=subscriptions,
+                            executor=executor,
+                            in_flight_message_ids=in_flight_message_ids,
+                        )
+                        return None
+
+                    # The subscriptions with their own max concurrency (like the interactive/bulk lanes)
+                    # get reserved workers, the others share the consumer's ones
+                    shared_workers_semaphore = asyncio.Semaphore(max_concurrency)
+                    processing_tasks: set[asyncio.Task] = set()
+                    try:
+                        await asyncio.gather(
+                            *(
+                                self.__consume_subscription(
+                                    subscription=subscription,
+                                    executor=executor,
+                                    workers_semaphore=(
+                                        shared_workers_semaphore
+                                        if subscription.max_concurrency is None
+                                        else asyncio.Semaphore(
+                                            subscription.max_concurrency
+                                        )
+                                    ),
+                                    # The concurrent workers can't be fed with less messages than their count
+                                    prefetch_count=max(
+                                        prefetch_count,
+                                        subscription.max_concurrency or max_concurrency,
+                                    ),
+                                    in_flight_message_ids=in_flight_message_ids[
+                                        subscription.queue_topic
+                                    ],
+                                    processing_tasks=processing_tasks,
+                                )
+                                for subscription in subscriptions
+                            )
+                        )
+                    finally:
+                        await asyncio.gather(*processing_tasks, return_exceptions=True)
+            finally:
+                # Waiting for the visibility task, so it's not left pending (nor touching the broker)
+                # once the consumption returns
+                visibility_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await visibility_task
+                # The transient queues don't outlive their consumer, like on RabbitMQ
+                for subscription in subscriptions:
+                    if subscription.is_transient:
+                        await asyncio.wrap_future(
+                            self.__message_broker.unbind_queue(
+                                exchange_name=subscription.exchange_name,
+                                queue_name=subscription.queue_topic,
+                            )
+                        )
+        except Exception as ex:
+            return ConsumingMessageError(error=str(ex))
+
+    async def __collect_batch(
+        self,
+        *,
+        queue_name: str,
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> list[tuple[int, QueueMessage]]:
+        # Waiting as long as needed for the first messages, then up to the batch timeout for the rest
+        batch = await self.__claim(queue_name=queue_name, max_messages=batch_size)
+        while not batch:
+            await asyncio.sleep(self.__polling_interval_in_s)
+            batch = await self.__claim(queue_name=queue_name, max_messages=batch_size)
+
+        batch_deadline = asyncio.get_running_loop().time() + batch_timeout_in_ms / 1000
+        while len(batch) < batch_size:
+            remaining_time = batch_deadline - asyncio.get_running_loop().time()
+            if remaining_time <= 0:
+                break
+            await asyncio.sleep(min(self.__polling_interval_in_s, remaining_time))
+            batch.extend(
+                await self.__claim(
+                    queue_name=queue_name, max_messages=batch_size - len(batch)
+                )
+            )
+        return batch
+
+    async def __process_batch[T](
+        self,
+        *,
+        batch: list[tuple[int, QueueMessage]],
+        subscription: MessageBatchSubscription[T],
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        message_ids_with_data: list[tuple[int, T]] = []
+        undeserializable_message_ids: list[int] = []
+        for message_id, queue_message in batch:
+            try:
+                message_ids_with_data.append(
+                    (message_id, subscription.deserialization_function(queue_message))
+                )
+            except Exception as ex:
+                # A message that can't be deserialized will never be, so it's dropped
+                print(
+                    f" [x] Error deserializing message from [{subscription.queue_topic}]"
+                    + f" for reason [{str(ex)}] ..."
+                )
+                undeserializable_message_ids.append(message_id)
+
+        if undeserializable_message_ids:
+            await self.__acknowledge(
+                queue_name=subscription.queue_topic,
+                message_ids=undeserializable_message_ids,
+            )
+
+        if not message_ids_with_data:
+            return None
+
+        data_items = [data for _, data in message_ids_with_data]
+        try:
+            if inspect.iscoroutinefunction(subscription.batch_callback_function):
+                is_processed = await subscription.batch_callback_function(data_items)
+            else:
+                is_processed = await asyncio.get_running_loop().run_in_executor(
+                    executor, subscription.batch_callback_function, data_items
+                )
+        except Exception as ex:
+            print(
+                f" [x] Error processing a batch of [{len(data_items)}] messages from [{subscription.queue_topic}]"
+                + f" for reason [{str(ex)}] ..."
+            )
+            is_processed = False
+
+        message_ids = [message_id for message_id, _ in message_ids_with_data]
+        if is_processed:
+            await self.__acknowledge(
+                queue_name=subscription.queue_topic, message_ids=message_ids
+            )
+        else:
+            await asyncio.wrap_future(
+                self.__message_broker.requeue(
+                    queue_name=subscription.queue_topic, message_ids=message_ids
+                )
+            )
+
+    async def __consume_batch_subscription(
+        self,
+        *,
+        subscription: MessageBatchSubscription,
+        executor: ThreadPoolExecutor,
+        in_flight_message_ids: set[int],
+        consume_forever: bool,
+        batch_size: int,
+        batch_timeout_in_ms: int,
+    ) -> None:
+        await asyncio.wrap_future(
+            self.__message_broker.bind_queue(
+                exchange_name=subscription.exchange_name,
+                queue_name=subscription.queue_topic,
+            )
+        )
+
+        print(
+            f" [*] Waiting for messages from [{subscription.queue_topic}]. To exit press CTRL+C"
+        )
+
+        while True:
+            batch = await self.__collect_batch(
+                queue_name=subscription.queue_topic,
+                batch_size=batch_size,
+                batch_timeout_in_ms=batch_timeout_in_ms,
+            )
+            in_flight_message_ids.update(message_id for message_id, _ in batch)
+            try:
+                await self.__process_batch(
+                    batch=batch, subscription=subscription, executor=executor
+                )
+            finally:
+                in_flight_message_ids.difference_update(
+                    message_id for message_id, _ in batch
+                )
+            if not consume_forever:
+                return None
+
+    async def __process_consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        try:
+            in_flight_message_ids: dict[str, set[int]] = {
+                subscription.queue_topic: set() for subscription in subscriptions
+            }
+            visibility_task = asyncio.create_task(
+                self.__keep_messages_invisible(
+                    in_flight_message_ids=in_flight_message_ids,
+                    transient_queue_names=[],
+                )
+            )
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=len(subscriptions),
+                    thread_name_prefix=self.__class__.__name__,
+                ) as executor:
+                    await asyncio.gather(
+                        *(
+                            self.__consume_batch_subscription(
+                                subscription=subscription,
+                                executor=executor,
+                                in_flight_message_ids=in_flight_message_ids[
+                                    subscription.queue_topic
+                                ],
+                                consume_forever=consume_forever,
+                                batch_size=batch_size,
+                                batch_timeout_in_ms=batch_timeout_in_ms,
+                            )
+                            for subscription in subscriptions
+                        )
+                    )
+            finally:
+                visibility_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await visibility_task
+        except Exception as ex:
+            return ConsumingMessageError(error=str(ex))
+
+    async def __consume_until_stopped(
+        self,
+        *,
+        consume_function: Callable[
+            [], Coroutine[Any, Any, ConsumingMessageError | None]
+        ],
+    ) -> ConsumingMessageError | None:
+        # Registering the consumption, so it can be cancelled from another thread by `stop_consuming`
+        consumption = (asyncio.get_running_loop(), asyncio.current_task())
+        with self.__consumptions_lock:
+            if self.__stopping_event.is_set():
+                return None
+            self.__consumptions.add(consumption)
+        try:
+            return await consume_function()
+        except asyncio.CancelledError:
+            if not self.__stopping_event.is_set():
+                raise
+            return None
+        finally:
+            with self.__consumptions_lock:
+                self.__consumptions.discard(consumption)
+
+    def __consume_with_retries(
+        self,
+        *,
+        queue_topics: list[str],
+        consume_function: Callable[
+            [], Coroutine[Any, Any, ConsumingMessageError | None]
+        ],
+        retry_attempts: int,
+        retry_timeout: int,
+    ) -> ConsumingMessageError | None:
+        # The database can stay locked by another process longer than the busy timeout
+        consumption_status = asyncio.run(
+            self.__consume_until_stopped(consume_function=consume_function)
+        )
+        for attempt in range(retry_attempts):
+            if consumption_status is None:
+                return None
+            print(
+                f" [x] Error consuming messages from topic [{queue_topics}] for reason [{consumption_status.error}] ..."
+            )
+            backoff = random.uniform(0.5, 1) * min(
+                retry_timeout * 2**attempt, self.__max_retry_timeout
+            )
+            print(
+                f" [x] Retrying again in [{backoff:.1f}] seconds, Remaining attempts [{retry_attempts - attempt - 1}] ..."
+            )
+            if self.__stopping_event.wait(backoff):
+                return None
+            consumption_status = asyncio.run(
+                self.__consume_until_stopped(consume_function=consume_function)
+            )
+        return consumption_status
+
+    def consume_messages[T](
+        self,
+        *,
+        exchange_name: str,
+        queue_topic: str,
+        deserialization_function: Callable[[QueueMessage], T],
+        callback_function: Callable[[T], Any],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        return self.consume_subscriptions(
+            subscriptions=[
+                MessageSubscription(
+                    exchange_name=exchange_name,
+                    queue_topic=queue_topic,
+                    deserialization_function=deserialization_function,
+                    callback_function=callback_function,
+                )
+            ],
+            consume_forever=consume_forever,
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
+        )
+
+    def consume_subscriptions(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        return self.__consume_with_retries(
+            queue_topics=[subscription.queue_topic for subscription in subscriptions],
+            consume_function=lambda: self.__process_consume_messages(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                prefetch_count=prefetch_count,
+                max_concurrency=max_concurrency,
+            ),
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+        )
+
+    def consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        return self.__consume_with_retries(
+            queue_topics=[subscription.queue_topic for subscription in subscriptions],
+            consume_function=lambda: self.__process_consume_batches(
+                subscriptions=subscriptions,
+                consume_forever=consume_forever,
+                batch_size=batch_size,
+                batch_timeout_in_ms=batch_timeout_in_ms,
+            ),
+            retry_attempts=retry_attempts,
+            retry_timeout=retry_timeout,
+        )
+
+    def stop_consuming(self) -> None:
+        with self.__consumptions_lock:
+            self.__stopping_event.set()
+            consumptions = list(self.__consumptions)
+        for loop, consumption_task in consumptions:
+            if consumption_task is None:
+                continue
+            try:
+                loop.call_soon_threadsafe(consumption_task.cancel)
+            except RuntimeError:
+                # The event loop of the consumption has already been closed
+                continue
@@ -0,0 +1,111 @@
+from src.domain.entity.error.message_queue import ProducingMessageError
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.ports.outbound.communication.message_queue.message_producer import (
+    MessageProducerInterface,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_broker import (
+    Sqlite3MessageBroker,
+)
+from typing import Any, Iterable
+import asyncio
+
+
+class Sqlite3MessageProducer(MessageProducerInterface):
+    """Producing to the SQLite broker, its queues are FIFO so the priority of the messages is accepted
+    (to keep the same interface) but ignored, the bulk lanes still keep them apart from the interactive ones
+    """
+
+    def __init__(
+        self,
+        *,
+        message_broker: Sqlite3MessageBroker,
+        producing_timeout: int = 30,
+    ) -> None:
+        self.__message_broker = message_broker
+        self.__producing_timeout = producing_timeout
+        self.__is_closed: bool = False
+
+    def produce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        return self.produce_messages(
+            topic=topic, data_items=[data], content_type=content_type, headers=headers
+        )[0]
+
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        if self.__is_closed:
+            return [
+                ProducingMessageError(error="This message producer is closed !")
+                for _ in data_items
+            ]
+
+        messages = [
+            QueueMessage(body=data, content_type=content_type, headers=headers or {})
+            for data in data_items
+        ]
+        try:
+            # All the messages are committed in one transaction
+            self.__message_broker.publish(
+                exchange_name=topic, messages=messages
+            ).result(timeout=self.__producing_timeout)
+            return [None for _ in messages]
+        except Exception as ex:
+            return [
+                ProducingMessageError(
+                    error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+                )
+                for _ in messages
+            ]
+
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        if self.__is_closed:
+            return ProducingMessageError(error="This message producer is closed !")
+
+        try:
+            # Awaiting the broker's thread from the caller's loop without blocking it
+            await asyncio.wait_for(
+                asyncio.wrap_future(
+                    self.__message_broker.publish(
+                        exchange_name=topic,
+                        messages=[
+                            QueueMessage(
+                                body=data,
+                                content_type=content_type,
+                                headers=headers or {},
+                            )
+                        ],
+                    )
+                ),
+                timeout=self.__producing_timeout,
+            )
+            return None
+        except Exception as ex:
+            return ProducingMessageError(
+                error=f"Error producing the message to topic [{topic}] for reason [{str(ex)}]"
+            )
+
+    def close(self) -> None:
+        # The broker is shared by the other producers/consumers of the process, so it's left open
+        self.__is_closed = True
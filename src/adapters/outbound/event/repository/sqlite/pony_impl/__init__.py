@@ -15,6 +15,12 @@ from src.domain.entity.events.video.youtube.persisted_youtube_video_event import
     PersistedYouTubeVideoEvent,
     RepositoryYouTubeVideo,
 )
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
+)
 
 
 class PonySqliteEventRepository(EventRepositoryInterface):
@@ -37,12 +43,70 @@ class PonySqliteEventRepository(EventRepositoryInterface):
             error_message: str = str(ex)
 
             if "IntegrityError: UNIQUE constraint failed" in error_message:
-                error_message = "This event is already existed in the database !"
+                return SavingEventError(
+                    error="This event is already existed in the database !",
+                    event=event,
+                    is_duplicate=True,
+                )
             else:
                 error_message = f"Error persisting the video for the reason [{str(ex)}]"
 
             return SavingEventError(error=error_message, event=event)
 
+    def save_events(
+        self, *, events: list[GenericEvent]
+    ) -> list[SavingEventError | None]:
+        saving_statuses: list[SavingEventError | None] = [None] * len(events)
+        try:
+            with db_session:
+                created_at_iso_formats = [
+                    event.created_at_iso_format for event in events
+                ]
+                # Fetching the already saved events' keys with one query instead of one per event
+                saved_keys: set[tuple[str, str, str]] = {
+                    (
+                        saved_event.topic,
+                        saved_event.created_at_iso_format,
+                        saved_event.event_data_class_name,
+                    )
+                    for saved_event in self.__event_model.select(
+                        lambda e: e.created_at_iso_format in created_at_iso_formats
+                    )
+                }
+                for index, event in enumerate(events):
+                    key = (
+                        event.get_topic(),
+                        event.created_at_iso_format,
+                        event.get_topic(),
+                    )
+                    # Duplicates are reported per event instead of failing the whole transaction
+                    if key in saved_keys:
+                        saving_statuses[index] = SavingEventError(
+                            error="This event is already existed in the database !",
+                            event=event,
+                            is_duplicate=True,
+                        )
+                        continue
+
+                    saved_keys.add(key)
+                    self.__event_model(
+                        topic=event.get_topic(),
+                        created_at_iso_format=event.created_at_iso_format,
+                        event_data_class_name=event.get_topic(),
+                        event_data_json=asdict(event),
+                    )
+        except Exception as ex:
+            return [
+                saving_status
+                or SavingEventError(
+                    error=f"Error persisting the events for the reason [{str(ex)}]",
+                    event=event,
+                )
+                for saving_status, event in zip(saving_statuses, events)
+            ]
+
+        return saving_statuses
+
     def get_events_by_topic(self, *, topic: str) -> list[GenericEvent]:
         try:
             with db_session:
@@ -60,6 +124,8 @@ class PonySqliteEventRepository(EventRepositoryInterface):
                                     downloaded_video=DownloadedYouTubeVideo(
                                         **event.event_data_json["downloaded_video"]
                                     ),
+                                    batch_id=event.event_data_json.get("batch_id"),
+                                    job_id=event.event_data_json.get("job_id"),
                                 )
                             )
                         case "PersistedYouTubeVideoEvent":
@@ -83,6 +149,18 @@ class PonySqliteEventRepository(EventRepositoryInterface):
                                     ),
                                 )
                             )
+                        case "FailedDownloadingYouTubeVideoEvent":
+                            res.append(
+                                FailedDownloadingYouTubeVideoEvent(
+                                    **event.event_data_json
+                                )
+                            )
+                        case "FannedOutYouTubeVideosBatchEvent":
+                            res.append(
+                                FannedOutYouTubeVideosBatchEvent(
+                                    **event.event_data_json
+                                )
+                            )
                 return res
         except Exception as ex:
             print(f"Error fetching commands to topic [{topic}] for reason [{str(ex)}]")
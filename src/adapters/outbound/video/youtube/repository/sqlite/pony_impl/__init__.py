@@ -1,4 +1,4 @@
-from pony.orm import Database, db_session
+from pony.orm import Database, db_session, flush
 from src.adapters.outbound.video.youtube.repository.sqlite.pony_impl.models.youtube_video import (
     register_video_model,
 )
@@ -52,7 +52,11 @@ class SqlitePonyYouTubeVideoRepository(YouTubeVideoRepositoryInterface):
             error_message: str = str(ex)
 
             if "IntegrityError: UNIQUE constraint failed" in error_message:
-                error_message = "This video is already existed in the database !"
+                return SavingYouTubeVideoError(
+                    error="This video is already existed in the database !",
+                    video=video,
+                    is_duplicate=True,
+                )
             else:
                 error_message = f"Error persisting the video for the reason [{str(ex)}]"
 
@@ -61,6 +65,72 @@ class SqlitePonyYouTubeVideoRepository(YouTubeVideoRepositoryInterface):
                 video=video,
             )
 
+    def save_videos(
+        self, *, videos: list[DownloadedYouTubeVideo]
+    ) -> list[SavingYouTubeVideoError | RepositoryYouTubeVideo]:
+        saving_statuses: list[SavingYouTubeVideoError | None] = [None] * len(videos)
+        try:
+            with db_session:
+                urls = [video.url for video in videos]
+                # Fetching the already saved videos with one query instead of one per video
+                saved_urls: set[str] = {
+                    saved_video.url
+                    for saved_video in self.__video_model.select(
+                        lambda v: v.url in urls
+                    )
+                }
+                persisted_videos = {}
+                for index, video in enumerate(videos):
+                    if video.url in saved_urls:
+                        saving_statuses[index] = SavingYouTubeVideoError(
+                            error="This video is already existed in the database !",
+                            video=video,
+                            is_duplicate=True,
+                        )
+                        continue
+
+                    saved_urls.add(video.url)
+                    persisted_videos[index] = self.__video_model(
+                        url=video.url,
+                        resolution=video.resolution,
+                        download_path=video.download_path,
+                        downloaded_file=video.downloaded_file,
+                        title=video.title,
+                        height=video.height,
+                        width=video.width,
+                        duration=video.duration,
+                        published_date_str=video.published_date_str,
+                        average_rating=video.average_rating,
+                        thumbnail=video.thumbnail,
+                        tags=video.tags,
+                        channel_id=video.channel_id,
+                        channel_name=video.channel_name,
+                        channel_url=video.channel_url,
+                    )
+                # Inserting the whole batch at once to get the videos' generated uuids
+                flush()
+
+                return [
+                    saving_status
+                    or RepositoryYouTubeVideo(
+                        uuid=persisted_videos[index].uuid,
+                        created_at=persisted_videos[index].created_at,
+                        video=video,
+                    )
+                    for index, (saving_status, video) in enumerate(
+                        zip(saving_statuses, videos)
+                    )
+                ]
+        except Exception as ex:
+            return [
+                saving_status
+                or SavingYouTubeVideoError(
+                    error=f"Error persisting the videos for the reason [{str(ex)}]",
+                    video=video,
+                )
+                for saving_status, video in zip(saving_statuses, videos)
+            ]
+
     def get_video_by_uuid(
         self, *, uuid: str
     ) -> GettingYouTubeVideoError | RepositoryYouTubeVideo:
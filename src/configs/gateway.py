@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+import os
+from dotenv import find_dotenv, load_dotenv
+
+
+class GatewayConfigs:
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Production:
+        load_dotenv(dotenv_path=find_dotenv("src/configs/prod.env"), override=True)
+        workers: str = os.getenv("GATEWAY_WORKERS", "1")
+        port: str = os.getenv("GATEWAY_PORT", "8000")
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+import os
+from dotenv import find_dotenv, load_dotenv
+
+
+class MessageQueueConfigs:
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Production:
+        load_dotenv(dotenv_path=find_dotenv("src/configs/prod.env"), override=True)
+        # Either `rabbitmq`, `sqlite` (a local durable queue) or `in_memory` (for running everything in one process)
+        broker: str = os.getenv("MESSAGE_QUEUE_BROKER", "rabbitmq")
+        sqlite_database_path: str = os.getenv("MESSAGE_QUEUE_SQLITE_DB_PATH", "")
+        # Producing through a local outbox file (if set) that is relayed to the broker in the background
+        outbox_database_path: str = os.getenv("MESSAGE_QUEUE_OUTBOX_DB_PATH", "")
+
+    @dataclass(frozen=True, slots=True, kw_only=True)
+    class Testing:
+        load_dotenv(dotenv_path=find_dotenv("src/configs/qa.env"), override=True)
+        broker: str = os.getenv("MESSAGE_QUEUE_BROKER", "rabbitmq")
+        sqlite_database_path: str = os.getenv("MESSAGE_QUEUE_SQLITE_DB_PATH", "")
+        outbox_database_path: str = os.getenv("MESSAGE_QUEUE_OUTBOX_DB_PATH", "")
@@ -11,6 +11,14 @@ class RabbitMQConfigs:
         port: str = os.getenv("RABBITMQ_PORT", "")
         username: str = os.getenv("RABBITMQ_USERNAME", "")
         password: str = os.getenv("RABBITMQ_PASSWORD", "")
+        consumer_prefetch_count: str = os.getenv("RABBITMQ_CONSUMER_PREFETCH_COUNT", "1")
+        consumer_max_concurrency: str = os.getenv(
+            "RABBITMQ_CONSUMER_MAX_CONCURRENCY", "1"
+        )
+        # The workers reserved to the bulk lane, on top of the (interactive) max concurrency
+        consumer_bulk_max_concurrency: str = os.getenv(
+            "RABBITMQ_CONSUMER_BULK_MAX_CONCURRENCY", "1"
+        )
 
     @dataclass(frozen=True, slots=True, kw_only=True)
     class Testing:
@@ -19,3 +27,11 @@ class RabbitMQConfigs:
         port: str = os.getenv("RABBITMQ_PORT", "")
         username: str = os.getenv("RABBITMQ_USERNAME", "")
         password: str = os.getenv("RABBITMQ_PASSWORD", "")
+        consumer_prefetch_count: str = os.getenv("RABBITMQ_CONSUMER_PREFETCH_COUNT", "1")
+        consumer_max_concurrency: str = os.getenv(
+            "RABBITMQ_CONSUMER_MAX_CONCURRENCY", "1"
+        )
+        # The workers reserved to the bulk lane, on top of the (interactive) max concurrency
+        consumer_bulk_max_concurrency: str = os.getenv(
+            "RABBITMQ_CONSUMER_BULK_MAX_CONCURRENCY", "1"
+        )
@@ -1,10 +1,32 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class GenericCommand:
+    # From 0 to MAX_PRIORITY (the highest), the commands below INTERACTIVE_PRIORITY go over the bulk lane
+    BULK_PRIORITY: ClassVar[int] = 0
+    INTERACTIVE_PRIORITY: ClassVar[int] = 5
+    MAX_PRIORITY: ClassVar[int] = 9
+
     created_at_iso_format: str
+    priority: int = INTERACTIVE_PRIORITY
+    # The id of the job (requested through the gateway) this command is part of, if any
+    job_id: str | None = None
 
     @classmethod
     def get_topic(cls) -> str:
         return cls.__name__
+
+    @classmethod
+    def get_bulk_topic(cls) -> str:
+        return f"{cls.get_topic()}.bulk"
+
+    def is_bulk(self) -> bool:
+        return self.priority < self.INTERACTIVE_PRIORITY
+
+    def get_lane_topic(self) -> str:
+        """Getting the topic of the lane this command goes over, so the bulk commands never hold back
+        the interactive ones that are consumed by their own (reserved) workers
+        """
+        return self.get_bulk_topic() if self.is_bulk() else self.get_topic()
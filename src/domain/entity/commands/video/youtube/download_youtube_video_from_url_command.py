@@ -8,3 +8,5 @@ class DownloadYouTubeVideoFromUrlCommand(GenericCommand):
     url: str
     resolution: int = 1080
     desired_download_path: str
+    # The id of the txt file batch this command has been fanned out from, if any
+    batch_id: str | None = None
@@ -18,9 +18,21 @@ class ConsumingMessageError:
 class SavingCommandError:
     error: str
     command: GenericCommand
+    is_duplicate: bool = False
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SavingEventError:
     error: str
     event: GenericEvent
+    is_duplicate: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EncodingMessageError:
+    error: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DecodingMessageError:
+    error: str
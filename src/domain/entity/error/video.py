@@ -19,6 +19,7 @@ class GettingYouTubeVideoInfoError:
 class SavingYouTubeVideoError:
     error: str
     video: DownloadedYouTubeVideo
+    is_duplicate: bool = False
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
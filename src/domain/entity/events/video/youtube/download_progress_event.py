@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from src.domain.entity.events.generic import GenericEvent
+from src.domain.entity.video.download_progress import VideoDownloadProgressSnapshot
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DownloadProgressEvent(GenericEvent):
+    """Produced by a download worker on every reporting tick, with the latest progress of each
+    of its downloads that progressed since the previous tick
+    """
+
+    worker_id: str
+    snapshots: list[VideoDownloadProgressSnapshot]
@@ -7,3 +7,5 @@ from src.domain.entity.video.youtube import DownloadedYouTubeVideo
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DownloadedYouTubeVideoEvent(GenericEvent):
     downloaded_video: DownloadedYouTubeVideo
+    batch_id: str | None = None
+    job_id: str | None = None
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from src.domain.entity.events.generic import GenericEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FailedDownloadingYouTubeVideoEvent(GenericEvent):
+    url: str
+    error: str
+    batch_id: str | None = None
+    job_id: str | None = None
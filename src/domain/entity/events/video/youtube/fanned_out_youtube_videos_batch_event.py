@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from src.domain.entity.events.generic import GenericEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FannedOutYouTubeVideosBatchEvent(GenericEvent):
+    """Produced once all the urls of a txt file have been fanned out as commands of their own"""
+
+    batch_id: str
+    txt_file_path: str
+    urls_count: int
+    job_id: str | None = None
+    # Why the txt file couldn't be fanned out (then it has no urls), carried by the same event
+    # so its failure can't be missed by the ones finishing the batch on its urls count
+    error: str | None = None
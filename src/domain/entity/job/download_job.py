@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Literal
+
+from src.domain.entity.video.download_progress import VideosDownloadProgress
+
+type DownloadJobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DownloadJob:
+    """A download requested through the gateway, tracked out of the events of its command
+    (and of the url commands it has been fanned out into)
+    """
+
+    job_id: str
+    # Unknown for the jobs that have been requested through another gateway worker
+    topic: str | None = None
+    created_at_iso_format: str
+    updated_at_iso_format: str
+    # 1 for a url, unknown until all the urls of a txt file have been fanned out
+    urls_count: int | None = None
+    downloaded_count: int = 0
+    failed_count: int = 0
+    last_error: str | None = None
+    # The combined progress of its downloads that are still running
+    progress: VideosDownloadProgress = field(default_factory=VideosDownloadProgress)
+
+    def get_done_count(self) -> int:
+        return self.downloaded_count + self.failed_count
+
+    def is_finished(self) -> bool:
+        return self.urls_count is not None and self.get_done_count() >= self.urls_count
+
+    def get_status(self) -> DownloadJobStatus:
+        if self.is_finished():
+            # Like a txt file that couldn't be fanned out, failing without any url
+            return (
+                "failed"
+                if self.downloaded_count == 0
+                and (self.failed_count > 0 or self.last_error is not None)
+                else "completed"
+            )
+        if self.get_done_count() > 0 or self.progress.downloads_count > 0:
+            return "running"
+        return "queued"
@@ -0,0 +1,182 @@
+from dataclasses import fields, is_dataclass
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+from src.domain.entity.commands.generic_command import GenericCommand
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_command import (
+    DownloadYouTubeVideoFromUrlCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_command import (
+    DownloadYouTubeVideoFromTxtFileCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+)
+from src.domain.entity.events.generic import GenericEvent
+from src.domain.entity.events.video.youtube.download_progress_event import (
+    DownloadProgressEvent,
+)
+from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
+    DownloadedYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
+)
+from src.domain.entity.events.video.youtube.persisted_youtube_video_event import (
+    PersistedYouTubeVideoEvent,
+)
+
+type Converter = Callable[[Any], Any]
+
+
+class MessageRegistry:
+    """Mapping each topic to its command/event class with an encoder/decoder that is computed once
+    per class (at registration), so converting a message from/to primitives (dicts, lists, ...)
+    doesn't need to inspect the dataclass (or deep-copy it like `asdict`) every time
+    """
+
+    SCHEMA_VERSION_HEADER: str = "x-schema-version"
+    MESSAGE_TYPE_HEADER: str = "x-message-type"
+
+    def __init__(self) -> None:
+        self.__message_classes: dict[str, type[GenericCommand | GenericEvent]] = {}
+        self.__schema_versions: dict[str, int] = {}
+        self.__encoders: dict[str, Converter] = {}
+        self.__decoders: dict[str, Converter] = {}
+
+    def register(
+        self,
+        *,
+        message_class: type[GenericCommand | GenericEvent],
+        schema_version: int = 1,
+    ) -> None:
+        topic = message_class.get_topic()
+        encoder, decoder = self.__build_dataclass_converters(data_class=message_class)
+        self.__message_classes[topic] = message_class
+        self.__schema_versions[topic] = schema_version
+        self.__encoders[topic] = encoder
+        self.__decoders[topic] = decoder
+
+    def get_topics(self) -> list[str]:
+        return list(self.__message_classes.keys())
+
+    def get_message_class(
+        self, *, topic: str
+    ) -> type[GenericCommand | GenericEvent] | None:
+        return self.__message_classes.get(topic)
+
+    def get_schema_version(self, *, topic: str) -> int | None:
+        return self.__schema_versions.get(topic)
+
+    def get_headers(self, *, topic: str) -> dict[str, Any]:
+        return {
+            self.MESSAGE_TYPE_HEADER: topic,
+            self.SCHEMA_VERSION_HEADER: self.__schema_versions[topic],
+        }
+
+    def to_primitive(self, *, message: GenericCommand | GenericEvent) -> dict[str, Any]:
+        return self.__encoders[message.get_topic()](message)
+
+    def from_primitive[T: GenericCommand | GenericEvent](
+        self, *, message_class: type[T], data: dict[str, Any]
+    ) -> T:
+        return self.__decoders[message_class.get_topic()](data)
+
+    def __build_converters(
+        self, *, type_hint: Any
+    ) -> tuple[Converter, Converter] | None:
+        """Building (encoder, decoder) for a type hint or None if the value can be used as-is"""
+        if is_dataclass(type_hint) and isinstance(type_hint, type):
+            return self.__build_dataclass_converters(data_class=type_hint)
+
+        origin = get_origin(type_hint)
+        arguments = get_args(type_hint)
+
+        if origin is list and arguments:
+            item_converters = self.__build_converters(type_hint=arguments[0])
+            if item_converters is None:
+                return None
+            item_encoder, item_decoder = item_converters
+            return (
+                lambda values: [item_encoder(value) for value in values],
+                lambda values: [item_decoder(value) for value in values],
+            )
+
+        if origin in (Union, UnionType) and NoneType in arguments:
+            non_none_arguments = [arg for arg in arguments if arg is not NoneType]
+            if len(non_none_arguments) != 1:
+                return None
+            optional_converters = self.__build_converters(
+                type_hint=non_none_arguments[0]
+            )
+            if optional_converters is None:
+                return None
+            optional_encoder, optional_decoder = optional_converters
+            return (
+                lambda value: None if value is None else optional_encoder(value),
+                lambda value: None if value is None else optional_decoder(value),
+            )
+
+        return None
+
+    def __build_dataclass_converters(
+        self, *, data_class: type
+    ) -> tuple[Converter, Converter]:
+        type_hints = get_type_hints(data_class)
+        field_converters: tuple[tuple[str, tuple[Converter, Converter] | None], ...] = (
+            tuple(
+                (field.name, self.__build_converters(type_hint=type_hints[field.name]))
+                for field in fields(data_class)
+            )
+        )
+
+        def __encode(message: Any) -> dict[str, Any]:
+            return {
+                name: (
+                    getattr(message, name)
+                    if converters is None
+                    else converters[0](getattr(message, name))
+                )
+                for name, converters in field_converters
+            }
+
+        def __decode(data: dict[str, Any]) -> Any:
+            # Only passing the known fields that are present, so older payloads fall back to
+            # the fields' defaults and newer payloads' extra fields are being ignored
+            return data_class(
+                **{
+                    name: data[name]
+                    if converters is None
+                    else converters[1](data[name])
+                    for name, converters in field_converters
+                    if name in data
+                }
+            )
+
+        return __encode, __decode
+
+
+@cache
+def get_default_message_registry() -> MessageRegistry:
+    """Getting the registry of all the commands/events that are going over the message queue"""
+    message_registry = MessageRegistry()
+    for message_class in [
+        DownloadYouTubeVideoFromUrlCommand,
+        DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+        DownloadYouTubeVideoFromTxtFileCommand,
+        DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+        DownloadedYouTubeVideoEvent,
+        PersistedYouTubeVideoEvent,
+        FailedDownloadingYouTubeVideoEvent,
+        FannedOutYouTubeVideosBatchEvent,
+        DownloadProgressEvent,
+    ]:
+        message_registry.register(message_class=message_class)
+    return message_registry
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.domain.entity.message_queue.queue_message import QueueMessage
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MessageSubscription[T]:
+    exchange_name: str
+    queue_topic: str
+    deserialization_function: Callable[[QueueMessage], T]
+    callback_function: Callable[[T], Any]
+    # Declaring the queue as a priority queue (from 0 to max_priority), when the broker supports it
+    max_priority: int | None = None
+    # Reserving workers to this subscription instead of sharing the consumer's ones with the others
+    max_concurrency: int | None = None
+    # Declaring the queue as a non-durable one that is deleted with its consumer (when the broker
+    # supports it), for the consumers that only want the messages while they're running
+    is_transient: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MessageBatchSubscription[T]:
+    exchange_name: str
+    queue_topic: str
+    deserialization_function: Callable[[QueueMessage], T]
+    # Returning whether the whole batch has been processed (acked) or not (requeued)
+    batch_callback_function: Callable[[list[T]], bool]
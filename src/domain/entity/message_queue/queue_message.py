@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class QueueMessage:
+    body: bytes
+    content_type: str | None = None
+    headers: dict[str, Any] = field(default_factory=dict)
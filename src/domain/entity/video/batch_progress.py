@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideosBatchProgress:
+    batch_id: str
+    # Unknown until all the urls of the batch have been fanned out
+    urls_count: int | None = None
+    downloaded_count: int = 0
+    failed_count: int = 0
+
+    def get_done_count(self) -> int:
+        return self.downloaded_count + self.failed_count
+
+    def is_completed(self) -> bool:
+        return self.urls_count is not None and self.get_done_count() >= self.urls_count
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoDownloadProgressSnapshot:
+    """The latest progress of a download, with the batch and the job it belongs to (if any)"""
+
+    status: OnProgressDownloadingVideoStatus
+    batch_id: str | None = None
+    job_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideosDownloadProgress:
+    """The combined progress of the active downloads of a batch (or of a worker)"""
+
+    downloads_count: int = 0
+    downloaded_bytes: int = 0
+    # Only of the downloads whose total is known
+    total_bytes: int = 0
+    unknown_total_downloads_count: int = 0
+    speed_in_bytes_per_s: float = 0
+
+    @classmethod
+    def from_statuses(
+        cls, statuses: Iterable[OnProgressDownloadingVideoStatus]
+    ) -> "VideosDownloadProgress":
+        downloads_count: int = 0
+        downloaded_bytes: int = 0
+        total_bytes: int = 0
+        unknown_total_downloads_count: int = 0
+        speed_in_bytes_per_s: float = 0
+        for status in statuses:
+            downloads_count += 1
+            downloaded_bytes += status.downloaded_bytes
+            if status.total_bytes is None:
+                unknown_total_downloads_count += 1
+            else:
+                total_bytes += status.total_bytes
+            speed_in_bytes_per_s += status.speed_in_bytes_per_s or 0
+        return cls(
+            downloads_count=downloads_count,
+            downloaded_bytes=downloaded_bytes,
+            total_bytes=total_bytes,
+            unknown_total_downloads_count=unknown_total_downloads_count,
+            speed_in_bytes_per_s=speed_in_bytes_per_s,
+        )
+
+    def get_downloaded_ratio(self) -> float | None:
+        if self.unknown_total_downloads_count > 0 or not self.total_bytes:
+            return None
+        return min(self.downloaded_bytes / self.total_bytes, 1.0)
+
+    def get_eta_in_s(self) -> float | None:
+        """Getting the time left for all the downloads at their combined speed"""
+        if self.unknown_total_downloads_count > 0 or not self.speed_in_bytes_per_s:
+            return None
+        return (
+            max(self.total_bytes - self.downloaded_bytes, 0) / self.speed_in_bytes_per_s
+        )
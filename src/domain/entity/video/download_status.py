@@ -5,12 +5,21 @@ from dataclasses import dataclass
 class OnProgressDownloadingVideoStatus:
     url: str
     title: str
-    size_in_bytes: str
     height: int
     width: int
-    download_speed_in_bytes: str
-    download_eta_in_seconds: str
-    downloaded_ratio: str
+    downloaded_bytes: int
+    # Estimated for the fragmented downloads, and unknown for some of the live ones
+    total_bytes: int | None = None
+    speed_in_bytes_per_s: float | None = None
+    eta_in_s: float | None = None
+    # Only for the fragmented (HLS/DASH) downloads
+    fragment_index: int | None = None
+    fragments_count: int | None = None
+
+    def get_downloaded_ratio(self) -> float | None:
+        if not self.total_bytes:
+            return None
+        return min(self.downloaded_bytes / self.total_bytes, 1.0)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
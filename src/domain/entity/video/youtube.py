@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -32,6 +33,8 @@ class YouTubeVideoInfo:
     channel_id: str
     channel_name: str
     channel_url: str
+    # The raw info that the video has been extracted into, so it can be downloaded without extracting it again
+    raw_info: dict[str, Any] | None = field(default=None, repr=False, compare=False)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
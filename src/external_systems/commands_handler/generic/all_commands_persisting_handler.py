@@ -1,9 +1,9 @@
 import os
 import sys
 import time
-from typing import Any, Callable, Type
-from src.domain.entity.error.message_queue import ConsumingMessageError
-from src.configs.rabbitmq import RabbitMQConfigs
+from typing import Callable, Type
+from src.configs.sqlite import SqliteDatabaseConfigs
+from src.domain.entity.error.message_queue import SavingCommandError
 from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
     DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
 )
@@ -13,89 +13,79 @@ from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_f
 from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_to_channel_name_dir_command import (
     DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
 )
-from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.external_systems.utils import get_message_queue_service
 from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_command import (
     DownloadYouTubeVideoFromUrlCommand,
     GenericCommand,
 )
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
-    PikaRabbitMqMessageProducer,
+from src.services.command import CommandService
+from src.adapters.outbound.command.repository.sqlite.pony_impl import (
+    PonySqliteCommandRepository,
 )
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
-    PikaRabbitMqMessageConsumer,
-)
-from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import cpu_count
 import nest_asyncio
 
 nest_asyncio.apply()
 
 
-def process_command__wrapper() -> Callable[[GenericCommand], None]:
-    def __process_command(
-        command: GenericCommand,
-    ) -> None:
-        print(f" [*] Got a new [{command.get_topic()}] request [{command}] ...")
+def process_commands__wrapper(
+    *, command_service: CommandService
+) -> Callable[[list[GenericCommand]], bool]:
+    def __process_commands(
+        commands: list[GenericCommand],
+    ) -> bool:
+        print(f" [*] Got a new batch of [{len(commands)}] commands ...")
+        # The whole batch is committed in a single transaction
+        saving_commands_statuses = command_service.save_commands(commands=commands)
+        is_batch_persisted: bool = True
+        for command, saving_command_status in zip(commands, saving_commands_statuses):
+            match saving_command_status:
+                case SavingCommandError(is_duplicate=True):
+                    print(f" [x] Command [{command}] is already persisted ...")
+                case SavingCommandError() as error:
+                    is_batch_persisted = False
+                    print(
+                        f" [x] Error persisting command [{command}] for reason [{error.error}] ..."
+                    )
+                case _:
+                    print(f" [x] Successfully persisting command [{command}] ...")
+
+        return is_batch_persisted
 
-    return __process_command
+    return __process_commands
 
 
 def main() -> None:
-    rabbitmq_configs = RabbitMQConfigs.Production()
+    sqlite_configs = SqliteDatabaseConfigs.Production()
 
-    message_producer = PikaRabbitMqMessageProducer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-    message_consumer = PikaRabbitMqMessageConsumer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
+    message_queue_service = get_message_queue_service()
 
-    message_queue_service = MessageQueueCommunicationService(
-        message_producer=message_producer, message_consumer=message_consumer
+    command_repository = PonySqliteCommandRepository(
+        database_path=sqlite_configs.database_path
     )
+    command_service = CommandService(command_repository=command_repository)
 
-    commands_with_serializations: list[
-        tuple[Type[GenericCommand], Callable[[dict[str, Any]], GenericCommand]]
-    ] = [
-        (
-            DownloadYouTubeVideoFromUrlCommand,
-            lambda data: DownloadYouTubeVideoFromUrlCommand(**data),
-        ),
-        (
-            DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
-            lambda data: DownloadYouTubeVideoFromUrlToChannelNameDirCommand(**data),
-        ),
-        (
-            DownloadYouTubeVideoFromTxtFileCommand,
-            lambda data: DownloadYouTubeVideoFromTxtFileCommand(**data),
-        ),
-        (
-            DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
-            lambda data: DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand(**data),
-        ),
+    commands: list[Type[GenericCommand]] = [
+        DownloadYouTubeVideoFromUrlCommand,
+        DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+        DownloadYouTubeVideoFromTxtFileCommand,
+        DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
     ]
 
-    def process_parallel_exec(
-        command_with_serialization_tuple: tuple[
-            Type[GenericCommand], Callable[[dict[str, Any]], GenericCommand]
-        ],
-    ) -> ConsumingMessageError | None:
-        command, serialization_function = command_with_serialization_tuple
-        return message_queue_service.consume_messages(
-            exchange_name=command.get_topic(),
-            queue_topic=f"{command.get_topic()}_{os.path.basename(__file__).strip(".py")}",
-            deserialization_function=serialization_function,
-            callback_function=process_command__wrapper(),
-        )
-
-    with ThreadPoolExecutor(max_workers=cpu_count() + 1) as exec_pool:
-        exec_pool.map(process_parallel_exec, commands_with_serializations)
+    # All the topics (and the bulk lanes of the commands) are consumed over one connection and one event loop
+    message_queue_service.consume_batches(
+        subscriptions=[
+            message_queue_service.get_domain_message_batch_subscription(
+                message_class=command,
+                exchange_name=topic,
+                queue_topic=f"{topic}_{os.path.basename(__file__).strip(".py")}",
+                batch_callback_function=process_commands__wrapper(
+                    command_service=command_service
+                ),
+            )
+            for command in commands
+            for topic in (command.get_topic(), command.get_bulk_topic())
+        ]
+    )
 
 
 def entry(*, retry_attempts: int = 3, retry_timeout: int = 3) -> None:
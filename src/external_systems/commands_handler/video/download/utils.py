@@ -1,24 +1,345 @@
+import datetime
 import os
+import socket
+import uuid
+from itertools import batched
+from typing import Callable
+from src.domain.entity.commands.generic_command import GenericCommand
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_command import (
+    DownloadYouTubeVideoFromUrlCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_command import (
+    DownloadYouTubeVideoFromTxtFileCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+)
+from src.domain.entity.error.message_queue import ProducingMessageError
+from src.domain.entity.error.video import DownloadingYouTubeVideoError
+from src.domain.entity.events.video.youtube.download_progress_event import (
+    DownloadProgressEvent,
+)
+from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
+    DownloadedYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
+)
+from src.domain.entity.video.download_progress import (
+    VideoDownloadProgressSnapshot,
+    VideosDownloadProgress,
+)
 from src.domain.entity.video.download_status import (
     OnCompleteDownloadingVideoStatus,
     OnProgressDownloadingVideoStatus,
 )
+from src.domain.entity.video.youtube import DownloadedYouTubeVideo
+from src.services.command.deduplication import CommandsDeduplicationService
+from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.services.video.download_progress import (
+    VideosDownloadProgressReporterService,
+)
+from src.services.video.youtube import YouTubeVideoService
 
 
-def on_progress(status: OnProgressDownloadingVideoStatus) -> None:
-    os.system("clear")
-    print(
-        f"""
-Downloading:: [{status.title.lstrip().lstrip()}]
-Downloaded:: [{status.downloaded_ratio.lstrip().strip()}]
-Speed:: [{status.download_speed_in_bytes.lstrip().strip()}]
-ETA:: [{status.download_eta_in_seconds.lstrip().strip()}]
-Resolution:: [{status.height}]P
-"""
+def __format_ratio(ratio: float | None) -> str:
+    return f"{ratio:.1%}" if ratio is not None else "NA"
+
+
+def __format_speed(speed_in_bytes_per_s: float | None) -> str:
+    if speed_in_bytes_per_s is None:
+        return "NA"
+    return f"{speed_in_bytes_per_s / 1024 / 1024:.2f}MiB/s"
+
+
+def __format_eta(eta_in_s: float | None) -> str:
+    if eta_in_s is None:
+        return "NA"
+    minutes, seconds = divmod(int(eta_in_s), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def __render_downloads_progress(
+    snapshots: list[VideoDownloadProgressSnapshot],
+) -> None:
+    for snapshot in snapshots:
+        status = snapshot.status
+        print(
+            f" [*] Downloading [{status.title.strip()}] [{__format_ratio(status.get_downloaded_ratio())}]"
+            + f" at [{__format_speed(status.speed_in_bytes_per_s)}] ETA [{__format_eta(status.eta_in_s)}]"
+            + f" Resolution [{status.height}P] ..."
+        )
+    if len(snapshots) > 1:
+        worker_progress = VideosDownloadProgress.from_statuses(
+            snapshot.status for snapshot in snapshots
+        )
+        print(
+            f" [*] Downloading [{worker_progress.downloads_count}] videos [{__format_ratio(worker_progress.get_downloaded_ratio())}]"
+            + f" at [{__format_speed(worker_progress.speed_in_bytes_per_s)}] ETA [{__format_eta(worker_progress.get_eta_in_s())}] ..."
+        )
+
+
+def get_downloads_progress_reporter(
+    *,
+    message_queue_service: MessageQueueCommunicationService,
+    reporting_interval_in_s: float = 1,
+) -> VideosDownloadProgressReporterService:
+    """Getting the progress reporter of a download worker, which renders the progress of its downloads
+    and produces it as one DownloadProgressEvent per reporting tick (holding all the downloads
+    that progressed since the previous tick), so the broker gets at most one message per worker per tick
+    """
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    def __report_downloads_progress(
+        snapshots: list[VideoDownloadProgressSnapshot],
+    ) -> None:
+        __render_downloads_progress(snapshots)
+        match message_queue_service.produce_domain_message(
+            message=DownloadProgressEvent(
+                created_at_iso_format=datetime.datetime.now().isoformat(),
+                worker_id=worker_id,
+                snapshots=snapshots,
+            )
+        ):
+            case ProducingMessageError() as error:
+                print(
+                    f" [*] Error producing [{DownloadProgressEvent.get_topic()}]"
+                    + f" event for the reason [{error.error}] ..."
+                )
+
+    return VideosDownloadProgressReporterService(
+        report_function=__report_downloads_progress,
+        reporting_interval_in_s=reporting_interval_in_s,
     )
 
 
-def on_complete(status: OnCompleteDownloadingVideoStatus) -> None:
+def on_progress(
+    status: OnProgressDownloadingVideoStatus,
+    *,
+    downloads_progress_reporter: VideosDownloadProgressReporterService,
+    batch_id: str | None = None,
+    job_id: str | None = None,
+) -> None:
+    downloads_progress_reporter.add_progress(status, batch_id=batch_id, job_id=job_id)
+
+
+def on_complete(
+    status: OnCompleteDownloadingVideoStatus,
+    *,
+    downloads_progress_reporter: VideosDownloadProgressReporterService,
+) -> None:
+    downloads_progress_reporter.remove_progress(url=status.url)
     print(
         f"Downloaded complete of [{status.title}] to destination [{status.downloaded_file_dst}] ..."
     )
+
+
+def on_failure(
+    error: DownloadingYouTubeVideoError,
+    *,
+    downloads_progress_reporter: VideosDownloadProgressReporterService,
+) -> None:
+    # A failed download never completes, so its progress is removed here instead
+    downloads_progress_reporter.remove_progress(url=error.url)
+    print(f" [*] Error downloading video with reason [{error.error}] ...")
+
+
+def get_lane_queue_topic(*, lane_topic: str, handler_file_path: str) -> str:
+    """Getting the (priority) queue of a download handler for a lane. It doesn't reuse the plain queue
+    the handler had before the lanes, since RabbitMQ refuses redeclaring an existing queue with a max
+    priority (see `migrate_download_priority_queues.py` to drain and delete the old ones)
+    """
+    return (
+        f"{lane_topic}_{os.path.basename(handler_file_path).strip(".py")}_prioritized"
+    )
+
+
+def get_batch_id(*, command: GenericCommand) -> str:
+    """Getting the same batch id for the redeliveries of a command, so fanning it out again
+    is still aggregated as the same batch
+    """
+    return str(
+        uuid.uuid5(
+            uuid.NAMESPACE_URL, f"{command.get_topic()}/{command.created_at_iso_format}"
+        )
+    )
+
+
+def deduplicate_batch_url_commands[
+    T: DownloadYouTubeVideoFromUrlCommand
+    | DownloadYouTubeVideoFromUrlToChannelNameDirCommand
+](
+    *,
+    process_function: Callable[[T], None],
+    commands_deduplication_service: CommandsDeduplicationService,
+) -> Callable[[T], None]:
+    """Skipping the url commands of a batch that are already being (or have been) processed,
+    since fanning out a txt file again produces the same url commands again.
+
+    The deduplication is per worker and best-effort: the keys live in this worker's memory, so a duplicate
+    consumed by another worker (or after a restart, or once its key has been forgotten) is still processed.
+    The progress aggregators count every url of a batch once whatever processed it
+    """
+
+    def __process_deduplicated_command(command: T) -> None:
+        if command.batch_id is None:
+            return process_function(command)
+
+        # The urls of a batch are unique (the duplicated lines of a txt file are skipped)
+        key = f"{command.get_topic()}/{command.batch_id}/{command.url}"
+        if not commands_deduplication_service.start_processing(key=key):
+            print(
+                f" [*] Skipping the duplicated [{command.get_topic()}] command of url [{command.url}]"
+                + f" of batch [{command.batch_id}] ..."
+            )
+            return None
+
+        is_processed = False
+        try:
+            process_function(command)
+            is_processed = True
+        finally:
+            commands_deduplication_service.finish_processing(
+                key=key, is_processed=is_processed
+            )
+
+    return __process_deduplicated_command
+
+
+def fan_out_txt_file_command(
+    *,
+    message_queue_service: MessageQueueCommunicationService,
+    command: DownloadYouTubeVideoFromTxtFileCommand
+    | DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+    url_command_class: type[DownloadYouTubeVideoFromUrlCommand]
+    | type[DownloadYouTubeVideoFromUrlToChannelNameDirCommand],
+    chunk_size: int = 500,
+) -> None:
+    """Fanning out every url of a txt file as a command of its own (with the batch id and the priority
+    of the txt file command), so any number of workers can share the downloads of the same file.
+
+    Fanning out the same txt file command again (when it's redelivered or retried) produces the same url
+    commands again, their creation dates are derived from the txt file command's one and the url's index,
+    and they are skipped (on a best-effort basis) by the url handlers (see `deduplicate_batch_url_commands`)
+    and counted once by the progress aggregators
+
+    Raises:
+        Exception: When some of the url commands couldn't be produced, so the txt file command
+            is retried
+    """
+    batch_id = get_batch_id(command=command)
+    urls_count = 0
+    error: str | None = None
+    if not os.path.exists(command.txt_file_path):
+        error = f"This urls txt file path [{command.txt_file_path}] doesn't exist !"
+        print(f" [x] Error fanning out batch [{batch_id}] for reason [{error}] ...")
+    else:
+        fanned_out_at = datetime.datetime.fromisoformat(command.created_at_iso_format)
+        for urls in batched(
+            YouTubeVideoService.get_urls_from_txt_file(
+                urls_txt_file_path=command.txt_file_path
+            ),
+            chunk_size,
+        ):
+            url_commands = [
+                url_command_class(
+                    # Keeping the commands' creation dates (part of their persistence key) unique
+                    # and the same whenever the txt file is fanned out
+                    created_at_iso_format=(
+                        fanned_out_at
+                        + datetime.timedelta(microseconds=urls_count + index)
+                    ).isoformat(),
+                    url=url,
+                    resolution=command.resolution,
+                    desired_download_path=command.desired_download_path,
+                    priority=command.priority,
+                    batch_id=batch_id,
+                    job_id=command.job_id,
+                )
+                for index, url in enumerate(urls)
+            ]
+            producing_errors = [
+                producing_status
+                for producing_status in message_queue_service.produce_domain_messages(
+                    message_class=url_command_class, messages=url_commands
+                )
+                if isinstance(producing_status, ProducingMessageError)
+            ]
+            if producing_errors:
+                raise Exception(
+                    f"Error producing [{len(producing_errors)}] [{url_command_class.get_topic()}]"
+                    + f" commands of batch [{batch_id}] for reason [{producing_errors[0].error}]"
+                )
+            urls_count += len(url_commands)
+            print(
+                f" [*] Fanned out [{urls_count}] url(s) of batch [{batch_id}] so far ..."
+            )
+
+    match message_queue_service.produce_domain_message(
+        message=FannedOutYouTubeVideosBatchEvent(
+            created_at_iso_format=datetime.datetime.now().isoformat(),
+            batch_id=batch_id,
+            txt_file_path=command.txt_file_path,
+            urls_count=urls_count,
+            job_id=command.job_id,
+            error=error,
+        )
+    ):
+        case ProducingMessageError() as producing_error:
+            print(
+                f" [*] Error producing [{FannedOutYouTubeVideosBatchEvent.get_topic()}]"
+                + f" event for the reason [{producing_error.error}] ..."
+            )
+        case None:
+            print(
+                f" [*] Successfully fanned out [{urls_count}] url(s) of batch [{batch_id}] ..."
+            )
+
+
+def produce_download_status_event(
+    *,
+    message_queue_service: MessageQueueCommunicationService,
+    download_status: DownloadingYouTubeVideoError | DownloadedYouTubeVideo,
+    batch_id: str | None = None,
+    job_id: str | None = None,
+) -> None:
+    """Producing a downloaded (or a failed downloading) video event, the failed ones
+    are only produced for the videos of a batch or of a job to aggregate their progress
+    """
+    event: DownloadedYouTubeVideoEvent | FailedDownloadingYouTubeVideoEvent
+    match download_status:
+        case DownloadedYouTubeVideo() as downloaded_video:
+            event = DownloadedYouTubeVideoEvent(
+                created_at_iso_format=datetime.datetime.now().isoformat(),
+                downloaded_video=downloaded_video,
+                batch_id=batch_id,
+                job_id=job_id,
+            )
+        case DownloadingYouTubeVideoError() as error if (
+            batch_id is not None or job_id is not None
+        ):
+            event = FailedDownloadingYouTubeVideoEvent(
+                created_at_iso_format=datetime.datetime.now().isoformat(),
+                url=error.url,
+                error=error.error,
+                batch_id=batch_id,
+                job_id=job_id,
+            )
+        case _:
+            return None
+
+    print(f" [*] Producing [{event.get_topic()}] event ...")
+    match message_queue_service.produce_domain_message(message=event):
+        case ProducingMessageError() as error:
+            print(
+                f" [*] Error producing [{event.get_topic()}]"
+                + f" event for the reason [{error.error}] ..."
+            )
+        case None:
+            print(f" [*] Successfully producing [{event}] ...")
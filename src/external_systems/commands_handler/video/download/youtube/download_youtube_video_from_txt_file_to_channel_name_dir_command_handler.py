@@ -1,42 +1,21 @@
-from dataclasses import asdict
-import datetime
 import os
-import pickle
 import sys
 import time
 from typing import Callable
-from src.configs.sqlite import SqliteDatabaseConfigs
-from src.external_systems.commands_handler.video.download.utils import (
-    on_complete,
-    on_progress,
-)
-from src.configs.rabbitmq import RabbitMQConfigs
-from src.domain.entity.error.message_queue import ProducingMessageError
-from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
-    DownloadedYouTubeVideoEvent,
-)
-from src.domain.entity.error.video import (
-    DownloadedYouTubeVideo,
-    DownloadingYouTubeVideoError,
-)
-from src.services.communication.message_queue import MessageQueueCommunicationService
 from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_to_channel_name_dir_command import (
     DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
 )
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
-    PikaRabbitMqMessageProducer,
-)
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
-    PikaRabbitMqMessageConsumer,
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
 )
-from src.adapters.inbound.video.youtube.downloader.yt_dlp import (
-    YtDlpYouTubeVideoDownloader,
-)
-from src.adapters.inbound.video.youtube.fetcher.yt_dlp import YtDlpYouTubeVideoFetcher
-from src.adapters.outbound.video.youtube.repository.sqlite.pony_impl import (
-    SqlitePonyYouTubeVideoRepository,
+from src.external_systems.commands_handler.video.download.utils import (
+    fan_out_txt_file_command,
+    get_lane_queue_topic,
 )
-from src.services.video.youtube import YouTubeVideoService
+from src.configs.rabbitmq import RabbitMQConfigs
+from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.external_systems.utils import get_message_queue_service
+from src.domain.entity.commands.generic_command import GenericCommand
 import nest_asyncio
 
 nest_asyncio.apply()
@@ -45,97 +24,57 @@ nest_asyncio.apply()
 def __process_download_youtube_video_from_txt_file_to_channel_name_dir_command__wrapper(
     *,
     message_queue_service: MessageQueueCommunicationService,
-    video_downloader_service: YouTubeVideoService,
 ) -> Callable[[DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand], None]:
     def __process_download_youtube_video_from_txt_file_to_channel_name_dir_command(
         command: DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
     ) -> None:
         print(f" [*] Got a new [{command.get_topic()}] request [{command}] ...")
-        # TODO maybe persist the command as well so we get a history of all commands later on?
-        # Maybe this is inside another handler not this one so each handler is doing only one thing ;)
-        download_status: tuple[
-            list[DownloadingYouTubeVideoError], list[DownloadedYouTubeVideo]
-        ] = video_downloader_service.download_youtube_videos_from_txt_file_to_channel_name_dir(
-            urls_txt_file_path=command.txt_file_path,
-            download_root_path=command.desired_download_path,
-            resolution=command.resolution,
-            on_progress_callback=on_progress,
-            on_complete_callback=on_complete,
+        # Each url is downloaded by whichever url command handler (on any node) is free for it
+        fan_out_txt_file_command(
+            message_queue_service=message_queue_service,
+            command=command,
+            url_command_class=DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
         )
 
-        errors: list[DownloadingYouTubeVideoError] = download_status[0]
-        successes: list[DownloadedYouTubeVideo] = download_status[1]
-
-        for error in errors:
-            print(f" [*] Error downloading video with reason [{error.error}] ...")
-
-        # TODO maybe we can do better parallelism here? 😁
-        for downloaded_video in successes:
-            print(f" [*] Successfully Downloaded video [{downloaded_video}] ...")
-            print(
-                f" [*] Producing [{DownloadedYouTubeVideoEvent.get_topic()}] event ..."
-            )
-            event_to_be_sent = DownloadedYouTubeVideoEvent(
-                created_at_iso_format=datetime.datetime.now().isoformat(),
-                downloaded_video=downloaded_video,
-            )
-            producing_message_status: ProducingMessageError | None = (
-                message_queue_service.produce_message(
-                    topic=DownloadedYouTubeVideoEvent.get_topic(),
-                    data=pickle.dumps(asdict(event_to_be_sent)),
-                )
-            )
-            match producing_message_status:
-                case ProducingMessageError() as error:
-                    print(
-                        f" [*] Error producing [{DownloadedYouTubeVideoEvent.get_topic()}]"
-                        + f" event for the reason [{error.error}] ..."
-                    )
-                case None:
-                    print(f" [*] Successfully producing [{event_to_be_sent}] ...")
-
     return __process_download_youtube_video_from_txt_file_to_channel_name_dir_command
 
 
 def main() -> None:
     rabbitmq_configs = RabbitMQConfigs.Production()
-    sqlite_configs = SqliteDatabaseConfigs.Production()
 
-    youtube_video_repository = SqlitePonyYouTubeVideoRepository(
-        database_path=sqlite_configs.database_path
-    )
+    message_queue_service = get_message_queue_service()
 
-    message_producer = PikaRabbitMqMessageProducer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-    message_consumer = PikaRabbitMqMessageConsumer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-
-    message_queue_service = MessageQueueCommunicationService(
-        message_producer=message_producer, message_consumer=message_consumer
+    callback_function = __process_download_youtube_video_from_txt_file_to_channel_name_dir_command__wrapper(
+        message_queue_service=message_queue_service,
     )
 
-    message_queue_service.consume_messages(
-        exchange_name=DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand.get_topic(),
-        queue_topic=f"{DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand.get_topic()}_{os.path.basename(__file__).strip(".py")}",
-        deserialization_function=lambda data: DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand(
-            **data
-        ),
-        callback_function=__process_download_youtube_video_from_txt_file_to_channel_name_dir_command__wrapper(
-            message_queue_service=message_queue_service,
-            video_downloader_service=YouTubeVideoService(
-                youtube_video_downloader=YtDlpYouTubeVideoDownloader(),
-                youtube_video_fetcher=YtDlpYouTubeVideoFetcher(),
-                youtube_video_repository=youtube_video_repository,
-            ),
-        ),
+    # The bulk lane has its own reserved workers, so the bulk commands never hold back the interactive ones
+    message_queue_service.consume_subscriptions(
+        subscriptions=[
+            message_queue_service.get_domain_message_subscription(
+                message_class=DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+                exchange_name=lane_topic,
+                queue_topic=get_lane_queue_topic(
+                    lane_topic=lane_topic, handler_file_path=__file__
+                ),
+                callback_function=callback_function,
+                max_priority=GenericCommand.MAX_PRIORITY,
+                max_concurrency=int(lane_max_concurrency),
+            )
+            for lane_topic, lane_max_concurrency in (
+                (
+                    DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand.get_topic(),
+                    rabbitmq_configs.consumer_max_concurrency,
+                ),
+                (
+                    DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand.get_bulk_topic(),
+                    rabbitmq_configs.consumer_bulk_max_concurrency,
+                ),
+            )
+        ],
+        prefetch_count=int(rabbitmq_configs.consumer_prefetch_count),
+        # All the workers are reserved to the lanes
+        max_concurrency=0,
     )
 
 
@@ -1,7 +1,4 @@
-from dataclasses import asdict
-import datetime
 import os
-import pickle
 import sys
 import time
 from typing import Callable
@@ -9,34 +6,36 @@ from src.adapters.outbound.video.youtube.repository.sqlite.pony_impl import (
     SqlitePonyYouTubeVideoRepository,
 )
 from src.configs.sqlite import SqliteDatabaseConfigs
+from src.services.command.deduplication import CommandsDeduplicationService
 from src.services.video.youtube import YouTubeVideoService
+from src.services.video.download_progress import (
+    VideosDownloadProgressReporterService,
+)
 from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
     DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
 )
 from src.external_systems.commands_handler.video.download.utils import (
+    deduplicate_batch_url_commands,
+    get_downloads_progress_reporter,
     on_complete,
+    on_failure,
     on_progress,
+    produce_download_status_event,
+    get_lane_queue_topic,
 )
 from src.configs.rabbitmq import RabbitMQConfigs
-from src.domain.entity.error.message_queue import ProducingMessageError
-from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
-    DownloadedYouTubeVideoEvent,
-)
 from src.domain.entity.error.video import (
     DownloadedYouTubeVideo,
     DownloadingYouTubeVideoError,
 )
 from src.services.communication.message_queue import MessageQueueCommunicationService
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
-    PikaRabbitMqMessageProducer,
-)
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
-    PikaRabbitMqMessageConsumer,
-)
+from src.external_systems.utils import get_message_queue_service
 from src.adapters.inbound.video.youtube.downloader.yt_dlp import (
     YtDlpYouTubeVideoDownloader,
 )
 from src.adapters.inbound.video.youtube.fetcher.yt_dlp import YtDlpYouTubeVideoFetcher
+from src.adapters.inbound.video.youtube.yt_dlp_pool import YoutubeDLPool
+from src.domain.entity.commands.generic_command import GenericCommand
 import nest_asyncio
 
 nest_asyncio.apply()
@@ -46,6 +45,7 @@ def __process_download_youtube_video_from_url_to_channel_name_dir_command__wrapp
     *,
     message_queue_service: MessageQueueCommunicationService,
     video_downloader_service: YouTubeVideoService,
+    downloads_progress_reporter: VideosDownloadProgressReporterService,
 ) -> Callable[[DownloadYouTubeVideoFromUrlToChannelNameDirCommand], None]:
     def __process_download_youtube_video_from_url_to_channel_name_dir_dir_command(
         command: DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
@@ -58,37 +58,32 @@ def __process_download_youtube_video_from_url_to_channel_name_dir_command__wrapp
                 url=command.url,
                 download_root_path=command.desired_download_path,
                 resolution=command.resolution,
-                on_progress_callback=on_progress,
-                on_complete_callback=on_complete,
+                on_progress_callback=lambda status: on_progress(
+                    status,
+                    downloads_progress_reporter=downloads_progress_reporter,
+                    batch_id=command.batch_id,
+                    job_id=command.job_id,
+                ),
+                on_complete_callback=lambda status: on_complete(
+                    status, downloads_progress_reporter=downloads_progress_reporter
+                ),
             )
         )
 
         match download_status:
             case DownloadingYouTubeVideoError() as error:
-                print(f" [*] Error downloading video with reason [{error.error}] ...")
+                on_failure(
+                    error, downloads_progress_reporter=downloads_progress_reporter
+                )
             case DownloadedYouTubeVideo() as downloaded_video:
                 print(f" [*] Successfully Downloaded video [{downloaded_video}] ...")
-                print(
-                    f" [*] Producing [{DownloadedYouTubeVideoEvent.get_topic()}] event ..."
-                )
-                event_to_be_sent = DownloadedYouTubeVideoEvent(
-                    created_at_iso_format=datetime.datetime.now().isoformat(),
-                    downloaded_video=downloaded_video,
-                )
-                producing_message_status: ProducingMessageError | None = (
-                    message_queue_service.produce_message(
-                        topic=DownloadedYouTubeVideoEvent.get_topic(),
-                        data=pickle.dumps(asdict(event_to_be_sent)),
-                    )
-                )
-                match producing_message_status:
-                    case ProducingMessageError() as error:
-                        print(
-                            f" [*] Error producing [{DownloadedYouTubeVideoEvent.get_topic()}]"
-                            + f" event for the reason [{error.error}] ..."
-                        )
-                    case None:
-                        print(f" [*] Successfully producing [{event_to_be_sent}] ...")
+
+        produce_download_status_event(
+            message_queue_service=message_queue_service,
+            download_status=download_status,
+            batch_id=command.batch_id,
+            job_id=command.job_id,
+        )
 
     return __process_download_youtube_video_from_url_to_channel_name_dir_dir_command
 
@@ -101,37 +96,63 @@ def main() -> None:
         database_path=sqlite_configs.database_path
     )
 
-    message_producer = PikaRabbitMqMessageProducer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-    message_consumer = PikaRabbitMqMessageConsumer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
+    message_queue_service = get_message_queue_service()
 
-    message_queue_service = MessageQueueCommunicationService(
-        message_producer=message_producer, message_consumer=message_consumer
-    )
+    # The downloader and the fetcher share the same warm YoutubeDL instances
+    youtube_dl_pool = YoutubeDLPool()
 
-    message_queue_service.consume_messages(
-        exchange_name=DownloadYouTubeVideoFromUrlToChannelNameDirCommand.get_topic(),
-        queue_topic=f"{DownloadYouTubeVideoFromUrlToChannelNameDirCommand.get_topic()}_{os.path.basename(__file__).strip(".py")}",
-        deserialization_function=lambda data: DownloadYouTubeVideoFromUrlToChannelNameDirCommand(
-            **data
-        ),
-        callback_function=__process_download_youtube_video_from_url_to_channel_name_dir_command__wrapper(
+    process_function = (
+        __process_download_youtube_video_from_url_to_channel_name_dir_command__wrapper(
             message_queue_service=message_queue_service,
+            downloads_progress_reporter=get_downloads_progress_reporter(
+                message_queue_service=message_queue_service
+            ),
             video_downloader_service=YouTubeVideoService(
-                youtube_video_downloader=YtDlpYouTubeVideoDownloader(),
-                youtube_video_fetcher=YtDlpYouTubeVideoFetcher(),
+                youtube_video_downloader=YtDlpYouTubeVideoDownloader(
+                    youtube_dl_pool=youtube_dl_pool
+                ),
+                youtube_video_fetcher=YtDlpYouTubeVideoFetcher(
+                    youtube_dl_pool=youtube_dl_pool
+                ),
                 youtube_video_repository=youtube_video_repository,
             ),
-        ),
+        )
+    )
+
+    # A txt file fanned out again produces the same url commands again, they are skipped by the worker
+    # processing (or having processed) them
+    callback_function = deduplicate_batch_url_commands(
+        process_function=process_function,
+        commands_deduplication_service=CommandsDeduplicationService(),
+    )
+
+    # The bulk lane has its own reserved workers, so the bulk commands never hold back the interactive ones
+    message_queue_service.consume_subscriptions(
+        subscriptions=[
+            message_queue_service.get_domain_message_subscription(
+                message_class=DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+                exchange_name=lane_topic,
+                queue_topic=get_lane_queue_topic(
+                    lane_topic=lane_topic, handler_file_path=__file__
+                ),
+                callback_function=callback_function,
+                max_priority=GenericCommand.MAX_PRIORITY,
+                max_concurrency=int(lane_max_concurrency),
+            )
+            for lane_topic, lane_max_concurrency in (
+                (
+                    DownloadYouTubeVideoFromUrlToChannelNameDirCommand.get_topic(),
+                    rabbitmq_configs.consumer_max_concurrency,
+                ),
+                (
+                    DownloadYouTubeVideoFromUrlToChannelNameDirCommand.get_bulk_topic(),
+                    rabbitmq_configs.consumer_bulk_max_concurrency,
+                ),
+            )
+        ],
+        prefetch_count=int(rabbitmq_configs.consumer_prefetch_count),
+        # All the workers are reserved to the lanes
+        max_concurrency=0,
     )
 
 
@@ -1,11 +1,10 @@
 import os
 import sys
 import time
-from typing import Any, Callable, Type
+from typing import Callable, Type
 from src.configs.sqlite import SqliteDatabaseConfigs
-from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.external_systems.utils import get_message_queue_service
 from src.domain.entity.error.message_queue import (
-    ConsumingMessageError,
     SavingEventError,
 )
 from src.domain.entity.events.generic import GenericEvent
@@ -15,15 +14,12 @@ from src.domain.entity.events.video.youtube.downloaded_youtube_video_event impor
 from src.domain.entity.events.video.youtube.persisted_youtube_video_event import (
     PersistedYouTubeVideoEvent,
 )
-from src.configs.rabbitmq import RabbitMQConfigs
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
-    PikaRabbitMqMessageProducer,
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
 )
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
-    PikaRabbitMqMessageConsumer,
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
 )
-from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import cpu_count
 from src.services.event import EventService
 from src.adapters.outbound.event.repository.sqlite.pony_impl import (
     PonySqliteEventRepository,
@@ -33,73 +29,63 @@ import nest_asyncio
 nest_asyncio.apply()
 
 
-def process_event__wrapper(
+def process_events__wrapper(
     *, event_service: EventService
-) -> Callable[[GenericEvent], None]:
-    def __process_event(
-        event: GenericEvent,
-    ) -> None:
-        print(f" [*] Got a new [{event.get_topic()}] request [{event}] ...")
-        saving_event_status = event_service.save_event(event=event)
-        match saving_event_status:
-            case SavingEventError() as error:
-                print(
-                    f" [x] Error persisting event [{event}] for reason [{error.error}] ..."
-                )
-            case _:
-                print(f" [x] Successfully persisting event [{event}] ...")
-
-    return __process_event
+) -> Callable[[list[GenericEvent]], bool]:
+    def __process_events(
+        events: list[GenericEvent],
+    ) -> bool:
+        print(f" [*] Got a new batch of [{len(events)}] events ...")
+        # The whole batch is committed in a single transaction
+        saving_events_statuses = event_service.save_events(events=events)
+        is_batch_persisted: bool = True
+        for event, saving_event_status in zip(events, saving_events_statuses):
+            match saving_event_status:
+                case SavingEventError(is_duplicate=True):
+                    print(f" [x] Event [{event}] is already persisted ...")
+                case SavingEventError() as error:
+                    is_batch_persisted = False
+                    print(
+                        f" [x] Error persisting event [{event}] for reason [{error.error}] ..."
+                    )
+                case _:
+                    print(f" [x] Successfully persisting event [{event}] ...")
+
+        return is_batch_persisted
+
+    return __process_events
 
 
 def main() -> None:
-    rabbitmq_configs = RabbitMQConfigs.Production()
     sqlite_configs = SqliteDatabaseConfigs.Production()
 
-    message_producer = PikaRabbitMqMessageProducer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-    message_consumer = PikaRabbitMqMessageConsumer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-
-    message_queue_service = MessageQueueCommunicationService(
-        message_producer=message_producer, message_consumer=message_consumer
-    )
+    message_queue_service = get_message_queue_service()
 
     event_repository = PonySqliteEventRepository(
         database_path=sqlite_configs.database_path
     )
     event_service = EventService(event_repository=event_repository)
 
-    events_with_serializations: list[
-        tuple[Type[GenericEvent], Callable[[dict[str, Any]], GenericEvent]]
-    ] = [
-        (DownloadedYouTubeVideoEvent, lambda data: DownloadedYouTubeVideoEvent(**data)),
-        (PersistedYouTubeVideoEvent, lambda data: PersistedYouTubeVideoEvent(**data)),
+    events: list[Type[GenericEvent]] = [
+        DownloadedYouTubeVideoEvent,
+        PersistedYouTubeVideoEvent,
+        FailedDownloadingYouTubeVideoEvent,
+        FannedOutYouTubeVideosBatchEvent,
     ]
 
-    def process_parallel_exec(
-        event_with_serialization_tuple: tuple[
-            Type[GenericEvent], Callable[[dict[str, Any]], GenericEvent]
-        ],
-    ) -> ConsumingMessageError | None:
-        event, serialization_function = event_with_serialization_tuple
-        return message_queue_service.consume_messages(
-            exchange_name=event.get_topic(),
-            queue_topic=f"{event.get_topic()}_{os.path.basename(__file__).strip(".py")}",
-            deserialization_function=serialization_function,
-            callback_function=process_event__wrapper(event_service=event_service),
-        )
-
-    with ThreadPoolExecutor(max_workers=cpu_count() + 1) as exec_pool:
-        exec_pool.map(process_parallel_exec, events_with_serializations)
+    # All the topics are consumed over one connection and one event loop
+    message_queue_service.consume_batches(
+        subscriptions=[
+            message_queue_service.get_domain_message_batch_subscription(
+                message_class=event,
+                queue_topic=f"{event.get_topic()}_{os.path.basename(__file__).strip(".py")}",
+                batch_callback_function=process_events__wrapper(
+                    event_service=event_service
+                ),
+            )
+            for event in events
+        ]
+    )
 
 
 def entry(*, retry_attempts: int = 3, retry_timeout: int = 3) -> None:
@@ -1,28 +1,19 @@
-from dataclasses import asdict
 import datetime
 import os
-import pickle
 import sys
 import time
 from typing import Callable
 from src.domain.entity.error.message_queue import ProducingMessageError
 from src.domain.entity.video.youtube import RepositoryYouTubeVideo
 from src.configs.sqlite import SqliteDatabaseConfigs
-from src.configs.rabbitmq import RabbitMQConfigs
 from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
-    DownloadedYouTubeVideo,
     DownloadedYouTubeVideoEvent,
 )
 from src.domain.entity.error.video import (
     SavingYouTubeVideoError,
 )
 from src.services.communication.message_queue import MessageQueueCommunicationService
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
-    PikaRabbitMqMessageProducer,
-)
-from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
-    PikaRabbitMqMessageConsumer,
-)
+from src.external_systems.utils import get_message_queue_service
 from src.adapters.inbound.video.youtube.downloader.yt_dlp import (
     YtDlpYouTubeVideoDownloader,
 )
@@ -39,92 +30,96 @@ import nest_asyncio
 nest_asyncio.apply()
 
 
-def __process_downloaded_youtube_video_event__wrapper(
+def __process_downloaded_youtube_video_events__wrapper(
     *,
     message_queue_service: MessageQueueCommunicationService,
     video_downloader_service: YouTubeVideoService,
-) -> Callable[[DownloadedYouTubeVideoEvent], None]:
-    def __process_downloaded_youtube_video_event(
-        event: DownloadedYouTubeVideoEvent,
-    ) -> None:
-        print(f" [*] Got a new [{event.get_topic()}] request [{event}] ...")
-
-        saving_video_status = video_downloader_service.save_youtube_video(
-            video=event.downloaded_video
+) -> Callable[[list[DownloadedYouTubeVideoEvent]], bool]:
+    def __process_downloaded_youtube_video_events(
+        events: list[DownloadedYouTubeVideoEvent],
+    ) -> bool:
+        print(
+            f" [*] Got a new batch of [{len(events)}] [{DownloadedYouTubeVideoEvent.get_topic()}] requests ..."
+        )
+
+        # The whole batch of videos is persisted in a single transaction
+        saving_videos_statuses = video_downloader_service.save_youtube_videos(
+            videos=[event.downloaded_video for event in events]
         )
-        match saving_video_status:
-            case SavingYouTubeVideoError() as error:
-                print(
-                    f" [x] Error persisting downloaded video [{event.downloaded_video}] for the reason [{error.error}] ..."
-                )
-            case RepositoryYouTubeVideo() as persisted_video:
-                print(
-                    f" [x] Successfully persisted youtube video [{persisted_video}] ..."
-                )
-
-                print(
-                    f" [*] Producing [{PersistedYouTubeVideoEvent.get_topic()}] event ..."
-                )
-                event_to_be_sent = PersistedYouTubeVideoEvent(
-                    created_at_iso_format=datetime.datetime.now().isoformat(),
-                    persisted_video=persisted_video,
-                )
-                producing_event_status = message_queue_service.produce_message(
-                    topic=PersistedYouTubeVideoEvent.get_topic(),
-                    data=pickle.dumps(asdict(event_to_be_sent)),
-                )
-                match producing_event_status:
-                    case ProducingMessageError() as error:
-                        print(
-                            f" [*] Error producing [{PersistedYouTubeVideoEvent.get_topic()}]"
-                            + f" event for the reason [{error.error}] ..."
+        is_batch_persisted: bool = True
+        events_to_be_sent: list[PersistedYouTubeVideoEvent] = []
+        for event, saving_video_status in zip(events, saving_videos_statuses):
+            match saving_video_status:
+                case SavingYouTubeVideoError(is_duplicate=True):
+                    print(
+                        f" [x] Downloaded video [{event.downloaded_video}] is already persisted ..."
+                    )
+                case SavingYouTubeVideoError() as error:
+                    is_batch_persisted = False
+                    print(
+                        f" [x] Error persisting downloaded video [{event.downloaded_video}] for the reason [{error.error}] ..."
+                    )
+                case RepositoryYouTubeVideo() as persisted_video:
+                    print(
+                        f" [x] Successfully persisted youtube video [{persisted_video}] ..."
+                    )
+                    events_to_be_sent.append(
+                        PersistedYouTubeVideoEvent(
+                            created_at_iso_format=datetime.datetime.now().isoformat(),
+                            persisted_video=persisted_video,
                         )
-                    case None:
-                        print(f" [*] Successfully producing [{event_to_be_sent}] ...")
+                    )
+
+        if not events_to_be_sent:
+            return is_batch_persisted
+
+        print(
+            f" [*] Producing [{len(events_to_be_sent)}] [{PersistedYouTubeVideoEvent.get_topic()}] events ..."
+        )
+        producing_events_statuses = message_queue_service.produce_domain_messages(
+            message_class=PersistedYouTubeVideoEvent, messages=events_to_be_sent
+        )
+        for event_to_be_sent, producing_event_status in zip(
+            events_to_be_sent, producing_events_statuses
+        ):
+            match producing_event_status:
+                case ProducingMessageError() as error:
+                    print(
+                        f" [*] Error producing [{PersistedYouTubeVideoEvent.get_topic()}]"
+                        + f" event for the reason [{error.error}] ..."
+                    )
+                case None:
+                    print(f" [*] Successfully producing [{event_to_be_sent}] ...")
 
-    return __process_downloaded_youtube_video_event
+        return is_batch_persisted
+
+    return __process_downloaded_youtube_video_events
 
 
 def main() -> None:
-    rabbitmq_configs = RabbitMQConfigs.Production()
     sqlite_configs = SqliteDatabaseConfigs.Production()
 
     youtube_video_repository = SqlitePonyYouTubeVideoRepository(
         database_path=sqlite_configs.database_path
     )
 
-    message_producer = PikaRabbitMqMessageProducer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-    message_consumer = PikaRabbitMqMessageConsumer(
-        rabbitmq_host=rabbitmq_configs.host,
-        rabbitmq_port=int(rabbitmq_configs.port),
-        rabbitmq_password=rabbitmq_configs.password,
-        rabbitmq_username=rabbitmq_configs.username,
-    )
-
-    message_queue_service = MessageQueueCommunicationService(
-        message_producer=message_producer, message_consumer=message_consumer
-    )
-
-    message_queue_service.consume_messages(
-        exchange_name=DownloadedYouTubeVideoEvent.get_topic(),
-        queue_topic=f"{DownloadedYouTubeVideoEvent.get_topic()}_{os.path.basename(__file__).strip(".py")}",
-        deserialization_function=lambda data: DownloadedYouTubeVideoEvent(
-            created_at_iso_format=data["created_at_iso_format"],
-            downloaded_video=DownloadedYouTubeVideo(**data["downloaded_video"]),
-        ),
-        callback_function=__process_downloaded_youtube_video_event__wrapper(
-            message_queue_service=message_queue_service,
-            video_downloader_service=YouTubeVideoService(
-                youtube_video_downloader=YtDlpYouTubeVideoDownloader(),
-                youtube_video_fetcher=YtDlpYouTubeVideoFetcher(),
-                youtube_video_repository=youtube_video_repository,
-            ),
-        ),
+    message_queue_service = get_message_queue_service()
+
+    message_queue_service.consume_batches(
+        subscriptions=[
+            message_queue_service.get_domain_message_batch_subscription(
+                message_class=DownloadedYouTubeVideoEvent,
+                queue_topic=f"{DownloadedYouTubeVideoEvent.get_topic()}_{os.path.basename(__file__).strip(".py")}",
+                batch_callback_function=__process_downloaded_youtube_video_events__wrapper(
+                    message_queue_service=message_queue_service,
+                    video_downloader_service=YouTubeVideoService(
+                        youtube_video_downloader=YtDlpYouTubeVideoDownloader(),
+                        youtube_video_fetcher=YtDlpYouTubeVideoFetcher(),
+                        youtube_video_repository=youtube_video_repository,
+                    ),
+                ),
+            )
+        ]
     )
 
 
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+from typing import Callable
+from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
+    DownloadedYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
+)
+from src.domain.entity.video.batch_progress import VideosBatchProgress
+from src.external_systems.utils import get_message_queue_service
+from src.services.video.batch_progress import VideosBatchProgressService
+import nest_asyncio
+
+nest_asyncio.apply()
+
+
+def __print_batch_progress(batch_progress: VideosBatchProgress) -> None:
+    if batch_progress.is_completed():
+        print(
+            f" [*] Completed batch [{batch_progress.batch_id}] with [{batch_progress.downloaded_count}] downloaded"
+            + f" and [{batch_progress.failed_count}] failed video(s) ..."
+        )
+    else:
+        print(
+            f" [*] Batch [{batch_progress.batch_id}] progress [{batch_progress.get_done_count()}"
+            + f"/{batch_progress.urls_count or '?'}], failed [{batch_progress.failed_count}] ..."
+        )
+
+
+def __process_fanned_out_youtube_videos_batch_event__wrapper(
+    *, batch_progress_service: VideosBatchProgressService
+) -> Callable[[FannedOutYouTubeVideosBatchEvent], None]:
+    def __process_fanned_out_youtube_videos_batch_event(
+        event: FannedOutYouTubeVideosBatchEvent,
+    ) -> None:
+        if event.error is not None:
+            print(
+                f" [x] Failed fanning out batch [{event.batch_id}] for reason [{event.error}] ..."
+            )
+        __print_batch_progress(
+            batch_progress_service.add_fanned_out_batch(
+                batch_id=event.batch_id, urls_count=event.urls_count
+            )
+        )
+
+    return __process_fanned_out_youtube_videos_batch_event
+
+
+def __process_downloaded_youtube_video_event__wrapper(
+    *, batch_progress_service: VideosBatchProgressService
+) -> Callable[[DownloadedYouTubeVideoEvent], None]:
+    def __process_downloaded_youtube_video_event(
+        event: DownloadedYouTubeVideoEvent,
+    ) -> None:
+        # The videos that have been requested on their own aren't part of any batch
+        if event.batch_id is not None:
+            __print_batch_progress(
+                batch_progress_service.add_downloaded_video(
+                    batch_id=event.batch_id, url=event.downloaded_video.url
+                )
+            )
+
+    return __process_downloaded_youtube_video_event
+
+
+def __process_failed_downloading_youtube_video_event__wrapper(
+    *, batch_progress_service: VideosBatchProgressService
+) -> Callable[[FailedDownloadingYouTubeVideoEvent], None]:
+    def __process_failed_downloading_youtube_video_event(
+        event: FailedDownloadingYouTubeVideoEvent,
+    ) -> None:
+        print(
+            f" [x] Failed downloading video [{event.url}] of batch [{event.batch_id}] for reason [{event.error}] ..."
+        )
+        if event.batch_id is not None:
+            __print_batch_progress(
+                batch_progress_service.add_failed_video(
+                    batch_id=event.batch_id, url=event.url
+                )
+            )
+
+    return __process_failed_downloading_youtube_video_event
+
+
+def main() -> None:
+    message_queue_service = get_message_queue_service()
+
+    batch_progress_service = VideosBatchProgressService()
+    queue_topic_suffix: str = os.path.basename(__file__).strip(".py")
+
+    # All the topics are consumed over one connection and one event loop
+    message_queue_service.consume_subscriptions(
+        subscriptions=[
+            message_queue_service.get_domain_message_subscription(
+                message_class=FannedOutYouTubeVideosBatchEvent,
+                queue_topic=f"{FannedOutYouTubeVideosBatchEvent.get_topic()}_{queue_topic_suffix}",
+                callback_function=__process_fanned_out_youtube_videos_batch_event__wrapper(
+                    batch_progress_service=batch_progress_service
+                ),
+            ),
+            message_queue_service.get_domain_message_subscription(
+                message_class=DownloadedYouTubeVideoEvent,
+                queue_topic=f"{DownloadedYouTubeVideoEvent.get_topic()}_{queue_topic_suffix}",
+                callback_function=__process_downloaded_youtube_video_event__wrapper(
+                    batch_progress_service=batch_progress_service
+                ),
+            ),
+            message_queue_service.get_domain_message_subscription(
+                message_class=FailedDownloadingYouTubeVideoEvent,
+                queue_topic=f"{FailedDownloadingYouTubeVideoEvent.get_topic()}_{queue_topic_suffix}",
+                callback_function=__process_failed_downloading_youtube_video_event__wrapper(
+                    batch_progress_service=batch_progress_service
+                ),
+            ),
+        ]
+    )
+
+
+def entry(*, retry_attempts: int = 3, retry_timeout: int = 3) -> None:
+    if retry_attempts > 0:
+        try:
+            return main()
+        except Exception as ex:
+            print(f" [x] Error running the event handler for reason: [{str(ex)}] ...")
+            print(
+                f" [x] Retrying again in [{retry_timeout}] seconds, Remaining attempts [{retry_attempts}] ..."
+            )
+            time.sleep(retry_timeout)
+            return entry(retry_attempts=retry_attempts - 1, retry_timeout=retry_timeout)
+    else:
+        print(" [x] Exiting since all retrying attempts has been exhausted ...")
+
+
+if __name__ == "__main__":
+    try:
+        entry()
+    except KeyboardInterrupt:
+        print(" [x] Interrupted ...")
+        try:
+            sys.exit(0)
+        except SystemExit:
+            os._exit(0)
@@ -1,16 +1,44 @@
+import asyncio
+import os
+import random
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import APIRouter, FastAPI
 from importlib.metadata import version
+from src.domain.entity.error.message_queue import ConsumingMessageError
 from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.services.job import DownloadJobsService
+from src.services.job.watchers import DownloadJobsWatchersService
+from src.external_systems.gateway.rest_api.fast_api_impl.events.download_jobs import (
+    get_download_jobs_subscriptions,
+)
 from src.external_systems.gateway.rest_api.fast_api_impl.routers.download.video import (
     get_download_video_router,
 )
+from src.external_systems.gateway.rest_api.fast_api_impl.routers.jobs.download import (
+    get_download_jobs_router,
+)
 
 
 class FastApiGateWay:
     def __init__(
-        self, *, message_queue_service: MessageQueueCommunicationService
+        self,
+        *,
+        message_queue_service: MessageQueueCommunicationService,
+        download_jobs_service: DownloadJobsService | None = None,
+        max_consuming_retry_timeout_in_s: float = 60,
     ) -> None:
         self.__message_queue_service = message_queue_service
+        self.__max_consuming_retry_timeout_in_s = max_consuming_retry_timeout_in_s
+        self.__stopping_event = threading.Event()
+        self.__download_jobs_service = download_jobs_service or DownloadJobsService()
+        # Serving all the clients watching the jobs out of the single events subscription of this worker
+        self.__download_jobs_watchers_service = DownloadJobsWatchersService(
+            download_jobs_service=self.__download_jobs_service
+        )
         self.__current_api_version: int = 1
         self.__base_api: str = f"/api/v{self.__current_api_version}"
         self.__app: FastAPI = FastAPI(
@@ -18,16 +46,83 @@ class FastApiGateWay:
             version=version("homelab-manager"),
             description="This project should be the gateway between the client (browser, mobile, etc)"
             + "and the backend services that will be called to do some commands or get some queries",
+            lifespan=self.__lifespan,
         )
         routers: list[APIRouter] = [
             get_download_video_router(
-                message_queue_service=self.__message_queue_service
+                message_queue_service=self.__message_queue_service,
+                download_jobs_service=self.__download_jobs_service,
+            ),
+            get_download_jobs_router(
+                download_jobs_service=self.__download_jobs_service,
+                download_jobs_watchers_service=self.__download_jobs_watchers_service,
             ),
         ]
 
         for router in routers:
             self.__app.include_router(prefix=self.__base_api, router=router)
 
+    def __consume_download_jobs_events(self) -> None:
+        """Consuming the download jobs events until the gateway shuts down, as its jobs would stop
+        being updated otherwise, the consumption is started again with an exponential backoff
+        whenever it fails or stops on its own
+        """
+        subscriptions = get_download_jobs_subscriptions(
+            message_queue_service=self.__message_queue_service,
+            download_jobs_service=self.__download_jobs_service,
+            queue_topic_suffix=f"gateway_{socket.gethostname()}-{os.getpid()}",
+        )
+        attempt = 0
+        while not self.__stopping_event.is_set():
+            consumption_started_at = time.monotonic()
+            match self.__message_queue_service.consume_subscriptions(
+                subscriptions=subscriptions
+            ):
+                case ConsumingMessageError() as error:
+                    print(
+                        f" [x] Error consuming the download jobs events for reason [{error.error}] ..."
+                    )
+                case _:
+                    print(" [x] The download jobs events consumption stopped ...")
+            if self.__stopping_event.is_set():
+                return None
+
+            # A consumption that has been running fine for a while starts again without waiting long
+            if (
+                time.monotonic() - consumption_started_at
+                > self.__max_consuming_retry_timeout_in_s
+            ):
+                attempt = 0
+            backoff = random.uniform(0.5, 1) * min(
+                2**attempt, self.__max_consuming_retry_timeout_in_s
+            )
+            attempt += 1
+            print(
+                f" [x] Consuming the download jobs events again in [{backoff:.1f}] seconds ..."
+            )
+            if self.__stopping_event.wait(backoff):
+                return None
+
+    @asynccontextmanager
+    async def __lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        # Every gateway worker keeps its own jobs up to date, without blocking the requests
+        consumer_thread = threading.Thread(
+            target=self.__consume_download_jobs_events,
+            name="DownloadJobsEventsConsumer",
+            daemon=True,
+        )
+        consumer_thread.start()
+        yield
+        # Stopping the consumption first, so its transient queues are released by this worker
+        # (the ones of a worker that died expire on their own)
+        self.__stopping_event.set()
+        self.__message_queue_service.stop_consuming()
+        await asyncio.to_thread(consumer_thread.join, 10)
+        if consumer_thread.is_alive():
+            print(" [x] The download jobs events consumer didn't stop in time ...")
+        # releasing the message queue connection(s) when the gateway shuts down
+        await asyncio.to_thread(self.__message_queue_service.close)
+
     def get_app(self) -> FastAPI:
         """getting the api app (FastApi in this case)"""
         return self.__app
@@ -0,0 +1,86 @@
+from src.domain.entity.events.video.youtube.download_progress_event import (
+    DownloadProgressEvent,
+)
+from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
+    DownloadedYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.failed_downloading_youtube_video_event import (
+    FailedDownloadingYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.fanned_out_youtube_videos_batch_event import (
+    FannedOutYouTubeVideosBatchEvent,
+)
+from src.domain.entity.message_queue.message_subscription import MessageSubscription
+from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.services.job import DownloadJobsService
+
+
+def get_download_jobs_subscriptions(
+    *,
+    message_queue_service: MessageQueueCommunicationService,
+    download_jobs_service: DownloadJobsService,
+    queue_topic_suffix: str,
+) -> list[MessageSubscription]:
+    """Getting the subscriptions feeding the download jobs of a gateway worker out of the events
+    carrying their job id, on transient queues of its own (`queue_topic_suffix`), so every gateway
+    worker gets all the events and none of them are left behind when the worker goes away
+    """
+
+    def __process_fanned_out_youtube_videos_batch_event(
+        event: FannedOutYouTubeVideosBatchEvent,
+    ) -> None:
+        if event.job_id is not None:
+            download_jobs_service.add_fanned_out_urls(
+                job_id=event.job_id, urls_count=event.urls_count, error=event.error
+            )
+
+    def __process_downloaded_youtube_video_event(
+        event: DownloadedYouTubeVideoEvent,
+    ) -> None:
+        if event.job_id is not None:
+            download_jobs_service.add_downloaded_video(
+                job_id=event.job_id,
+                url=event.downloaded_video.url,
+                is_batch=event.batch_id is not None,
+            )
+
+    def __process_failed_downloading_youtube_video_event(
+        event: FailedDownloadingYouTubeVideoEvent,
+    ) -> None:
+        if event.job_id is not None:
+            download_jobs_service.add_failed_video(
+                job_id=event.job_id,
+                url=event.url,
+                error=event.error,
+                is_batch=event.batch_id is not None,
+            )
+
+    def __process_download_progress_event(event: DownloadProgressEvent) -> None:
+        download_jobs_service.add_progress_snapshots(snapshots=event.snapshots)
+
+    return [
+        message_queue_service.get_domain_message_subscription(
+            message_class=FannedOutYouTubeVideosBatchEvent,
+            queue_topic=f"{FannedOutYouTubeVideosBatchEvent.get_topic()}_{queue_topic_suffix}",
+            callback_function=__process_fanned_out_youtube_videos_batch_event,
+            is_transient=True,
+        ),
+        message_queue_service.get_domain_message_subscription(
+            message_class=DownloadedYouTubeVideoEvent,
+            queue_topic=f"{DownloadedYouTubeVideoEvent.get_topic()}_{queue_topic_suffix}",
+            callback_function=__process_downloaded_youtube_video_event,
+            is_transient=True,
+        ),
+        message_queue_service.get_domain_message_subscription(
+            message_class=FailedDownloadingYouTubeVideoEvent,
+            queue_topic=f"{FailedDownloadingYouTubeVideoEvent.get_topic()}_{queue_topic_suffix}",
+            callback_function=__process_failed_downloading_youtube_video_event,
+            is_transient=True,
+        ),
+        message_queue_service.get_domain_message_subscription(
+            message_class=DownloadProgressEvent,
+            queue_topic=f"{DownloadProgressEvent.get_topic()}_{queue_topic_suffix}",
+            callback_function=__process_download_progress_event,
+            is_transient=True,
+        ),
+    ]
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from src.domain.entity.commands.generic_command import GenericCommand
+
 
 class DownloadVideoRequest:
     class FromUrl(BaseModel):
@@ -22,6 +24,19 @@ class DownloadVideoRequest:
             frozen=True,
             kw_only=True,
         )
+        priority: int = Field(
+            default=GenericCommand.INTERACTIVE_PRIORITY,
+            ge=0,
+            le=GenericCommand.MAX_PRIORITY,
+            description="The priority of the download, the ones below"
+            + f" {GenericCommand.INTERACTIVE_PRIORITY} go over the bulk lane",
+            examples=[
+                GenericCommand.INTERACTIVE_PRIORITY,
+                GenericCommand.BULK_PRIORITY,
+            ],
+            frozen=True,
+            kw_only=True,
+        )
 
     class FromTxtFile(BaseModel):
         txt_file_path: str = Field(
@@ -43,6 +58,19 @@ class DownloadVideoRequest:
             frozen=True,
             kw_only=True,
         )
+        priority: int = Field(
+            default=GenericCommand.BULK_PRIORITY,
+            ge=0,
+            le=GenericCommand.MAX_PRIORITY,
+            description="The priority of the download, the ones below"
+            + f" {GenericCommand.INTERACTIVE_PRIORITY} go over the bulk lane",
+            examples=[
+                GenericCommand.INTERACTIVE_PRIORITY,
+                GenericCommand.BULK_PRIORITY,
+            ],
+            frozen=True,
+            kw_only=True,
+        )
 
 
 class DownloadVideoResponse:
@@ -53,6 +81,13 @@ class DownloadVideoResponse:
             frozen=True,
             kw_only=True,
         )
+        job_id: str | None = Field(
+            default=None,
+            description="The id of the job to follow the download with",
+            examples=["7b1b8e4e-7f4c-4c8b-9a53-6c1c5e0f3d2a"],
+            frozen=True,
+            kw_only=True,
+        )
 
     class Error(BaseModel):
         message: str = Field(
@@ -0,0 +1,171 @@
+from typing import Literal
+from pydantic import BaseModel, Field
+
+from src.domain.entity.job.download_job import DownloadJob
+
+
+class DownloadJobProgress(BaseModel):
+    downloads_count: int = Field(
+        description="The count of the downloads of the job that are still running",
+        examples=[2],
+        frozen=True,
+        kw_only=True,
+    )
+    downloaded_bytes: int = Field(
+        description="The downloaded bytes of the running downloads",
+        examples=[1048576],
+        frozen=True,
+        kw_only=True,
+    )
+    total_bytes: int = Field(
+        description="The total bytes of the running downloads whose size is known",
+        examples=[4194304],
+        frozen=True,
+        kw_only=True,
+    )
+    downloaded_ratio: float | None = Field(
+        description="The downloaded ratio of the running downloads, when all their sizes are known",
+        examples=[0.25, None],
+        frozen=True,
+        kw_only=True,
+    )
+    speed_in_bytes_per_s: float = Field(
+        description="The combined speed of the running downloads",
+        examples=[524288.0],
+        frozen=True,
+        kw_only=True,
+    )
+    eta_in_s: float | None = Field(
+        description="The time left for the running downloads, when all their sizes are known",
+        examples=[6.0, None],
+        frozen=True,
+        kw_only=True,
+    )
+
+
+class DownloadJobModel(BaseModel):
+    job_id: str = Field(
+        description="The id of the job, as returned when requesting the download",
+        examples=["7b1b8e4e-7f4c-4c8b-9a53-6c1c5e0f3d2a"],
+        frozen=True,
+        kw_only=True,
+    )
+    topic: str | None = Field(
+        description="The topic of the requested command, unknown when it was requested through another gateway worker",
+        examples=["download_youtube_video_from_url", None],
+        frozen=True,
+        kw_only=True,
+    )
+    status: Literal["queued", "running", "completed", "failed"] = Field(
+        description="The status of the job, failed when none of its videos could be downloaded",
+        examples=["running"],
+        frozen=True,
+        kw_only=True,
+    )
+    created_at_iso_format: str = Field(
+        description="When the job was requested",
+        examples=["2024-01-01T00:00:00"],
+        frozen=True,
+        kw_only=True,
+    )
+    updated_at_iso_format: str = Field(
+        description="When the job was last updated",
+        examples=["2024-01-01T00:01:00"],
+        frozen=True,
+        kw_only=True,
+    )
+    urls_count: int | None = Field(
+        description="The count of the videos of the job, unknown until a txt file has been fanned out",
+        examples=[1, None],
+        frozen=True,
+        kw_only=True,
+    )
+    downloaded_count: int = Field(
+        description="The count of the downloaded videos",
+        examples=[1],
+        frozen=True,
+        kw_only=True,
+    )
+    failed_count: int = Field(
+        description="The count of the videos that failed downloading",
+        examples=[0],
+        frozen=True,
+        kw_only=True,
+    )
+    last_error: str | None = Field(
+        description="The error of the latest video that failed downloading",
+        examples=[None],
+        frozen=True,
+        kw_only=True,
+    )
+    progress: DownloadJobProgress = Field(
+        description="The combined progress of the running downloads of the job",
+        frozen=True,
+        kw_only=True,
+    )
+
+    @classmethod
+    def from_download_job(cls, download_job: DownloadJob) -> "DownloadJobModel":
+        return cls(
+            job_id=download_job.job_id,
+            topic=download_job.topic,
+            status=download_job.get_status(),
+            created_at_iso_format=download_job.created_at_iso_format,
+            updated_at_iso_format=download_job.updated_at_iso_format,
+            urls_count=download_job.urls_count,
+            downloaded_count=download_job.downloaded_count,
+            failed_count=download_job.failed_count,
+            last_error=download_job.last_error,
+            progress=DownloadJobProgress(
+                downloads_count=download_job.progress.downloads_count,
+                downloaded_bytes=download_job.progress.downloaded_bytes,
+                total_bytes=download_job.progress.total_bytes,
+                downloaded_ratio=download_job.progress.get_downloaded_ratio(),
+                speed_in_bytes_per_s=download_job.progress.speed_in_bytes_per_s,
+                eta_in_s=download_job.progress.get_eta_in_s(),
+            ),
+        )
+
+
+class DownloadJobResponse:
+    class Success(BaseModel):
+        job: DownloadJobModel = Field(
+            description="The requested job",
+            frozen=True,
+            kw_only=True,
+        )
+
+    class Error(BaseModel):
+        message: str = Field(
+            description="Message about the response",
+            examples=["Job [abc] doesn't exist ..."],
+            frozen=True,
+            kw_only=True,
+        )
+
+
+class DownloadJobsResponse:
+    class Success(BaseModel):
+        jobs: list[DownloadJobModel] = Field(
+            description="A page of the jobs, the running ones first then the finished ones (the latest first)",
+            frozen=True,
+            kw_only=True,
+        )
+        total_count: int = Field(
+            description="The count of all the tracked jobs",
+            examples=[42],
+            frozen=True,
+            kw_only=True,
+        )
+        offset: int = Field(
+            description="The offset of the page",
+            examples=[0],
+            frozen=True,
+            kw_only=True,
+        )
+        limit: int = Field(
+            description="The max size of the page",
+            examples=[20],
+            frozen=True,
+            kw_only=True,
+        )
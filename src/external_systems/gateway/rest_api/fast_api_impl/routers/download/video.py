@@ -1,7 +1,6 @@
 import datetime
-import pickle
+import uuid
 from fastapi import APIRouter, Response, status
-from dataclasses import asdict
 from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_command import (
     DownloadYouTubeVideoFromTxtFileCommand,
 )
@@ -22,11 +21,13 @@ from src.external_systems.gateway.rest_api.fast_api_impl.models.download.video.y
     DownloadVideoResponse,
 )
 from src.domain.entity.commands.generic_command import GenericCommand
+from src.services.job import DownloadJobsService
 
 
 def get_download_video_router(
     *,
     message_queue_service: MessageQueueCommunicationService,
+    download_jobs_service: DownloadJobsService,
 ) -> APIRouter:
     download_video_router: APIRouter = APIRouter(
         prefix="/download/video",
@@ -34,14 +35,27 @@ def get_download_video_router(
         include_in_schema=True,
     )
 
-    def __process_message(
-        message: GenericCommand, response: Response
+    async def __process_message(
+        message: GenericCommand, response: Response, is_batch: bool
     ) -> DownloadVideoResponse.Error | DownloadVideoResponse.Success:
-        message_producing_status = message_queue_service.produce_message(
-            topic=message.get_topic(), data=pickle.dumps(asdict(message))
+        # Recording the job before publishing its command, as its events can be consumed
+        # (and even finish it) before the publishing is confirmed
+        if message.job_id is not None:
+            download_jobs_service.add_requested_job(
+                job_id=message.job_id,
+                topic=message.get_topic(),
+                created_at_iso_format=message.created_at_iso_format,
+                is_batch=is_batch,
+            )
+        message_producing_status = await message_queue_service.aproduce_domain_message(
+            message=message
         )
         match message_producing_status:
             case ProducingMessageError() as error:
+                if message.job_id is not None:
+                    download_jobs_service.add_failed_request(
+                        job_id=message.job_id, error=error.error
+                    )
                 response.status_code = status.HTTP_400_BAD_REQUEST
                 return DownloadVideoResponse.Error(
                     message=f"Failed to request a download for your video [{message}] for reason [{error.error}]"
@@ -51,6 +65,7 @@ def get_download_video_router(
                 print(f" [x] Published message to topic [{message.get_topic()}] ...")
                 return DownloadVideoResponse.Success(
                     message="Successfully requested to download this video ...",
+                    job_id=message.job_id,
                 )
 
     @download_video_router.post(
@@ -71,8 +86,12 @@ def get_download_video_router(
             url=request.url,
             resolution=request.resolution,
             desired_download_path=request.desired_download_path,
+            priority=request.priority,
+            job_id=str(uuid.uuid4()),
+        )
+        return await __process_message(
+            message=message, response=response, is_batch=False
         )
-        return __process_message(message=message, response=response)
 
     @download_video_router.post(
         "/youtube/to_channel_name_dir",
@@ -93,8 +112,12 @@ def get_download_video_router(
             url=request.url,
             resolution=request.resolution,
             desired_download_path=request.desired_download_path,
+            priority=request.priority,
+            job_id=str(uuid.uuid4()),
+        )
+        return await __process_message(
+            message=message, response=response, is_batch=False
         )
-        return __process_message(message=message, response=response)
 
     @download_video_router.post(
         "/youtube/from_txt_file_to_root_dir",
@@ -114,8 +137,12 @@ def get_download_video_router(
             txt_file_path=request.txt_file_path,
             resolution=request.resolution,
             desired_download_path=request.desired_download_path,
+            priority=request.priority,
+            job_id=str(uuid.uuid4()),
+        )
+        return await __process_message(
+            message=message, response=response, is_batch=True
         )
-        return __process_message(message=message, response=response)
 
     @download_video_router.post(
         "/youtube/from_txt_file_to_channel_name_dir",
@@ -136,7 +163,11 @@ def get_download_video_router(
             txt_file_path=request.txt_file_path,
             resolution=request.resolution,
             desired_download_path=request.desired_download_path,
+            priority=request.priority,
+            job_id=str(uuid.uuid4()),
+        )
+        return await __process_message(
+            message=message, response=response, is_batch=True
         )
-        return __process_message(message=message, response=response)
 
     return download_video_router
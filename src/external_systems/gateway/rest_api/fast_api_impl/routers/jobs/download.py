@@ -0,0 +1,158 @@
+from typing import AsyncIterator
+from fastapi import (
+    APIRouter,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.external_systems.gateway.rest_api.fast_api_impl.models.jobs.download import (
+    DownloadJobModel,
+    DownloadJobResponse,
+    DownloadJobsResponse,
+)
+from src.services.job import DownloadJobsService
+from src.services.job.watchers import DownloadJobsWatchersService
+
+
+def get_download_jobs_router(
+    *,
+    download_jobs_service: DownloadJobsService,
+    download_jobs_watchers_service: DownloadJobsWatchersService,
+) -> APIRouter:
+    """Getting the router of the download jobs.
+
+    The jobs are tracked in the memory of the gateway worker that requested them, so when the gateway
+    runs several workers (like `uvicorn --workers`) a job is only known by its own worker, and the other
+    ones answer 404 for it. Such a gateway needs sticky sessions (or a single worker) for these endpoints
+    """
+    download_jobs_router: APIRouter = APIRouter(
+        prefix="/jobs",
+        tags=["Download Jobs"],
+        include_in_schema=True,
+    )
+
+    @download_jobs_router.get(
+        "/{job_id}",
+        description="Get the status and the progress of a requested download"
+        + " (only known by the gateway worker that requested it)",
+        operation_id="get_download_job",
+        responses={
+            404: {"model": DownloadJobResponse.Error},
+            200: {"model": DownloadJobResponse.Success},
+        },
+        response_model=DownloadJobResponse.Error | DownloadJobResponse.Success,
+    )
+    async def get_download_job(
+        job_id: str, response: Response
+    ) -> DownloadJobResponse.Error | DownloadJobResponse.Success:
+        download_job = download_jobs_service.get_job(job_id=job_id)
+        if download_job is None:
+            response.status_code = status.HTTP_404_NOT_FOUND
+            return DownloadJobResponse.Error(
+                message=f"Job [{job_id}] doesn't exist ..."
+            )
+
+        response.status_code = status.HTTP_200_OK
+        return DownloadJobResponse.Success(
+            job=DownloadJobModel.from_download_job(download_job)
+        )
+
+    @download_jobs_router.get(
+        "/{job_id}/stream",
+        description="Stream the status and the progress of a requested download as Server-Sent Events,"
+        + " starting with its current state then each of its updates until it finishes",
+        operation_id="stream_download_job",
+        responses={
+            404: {"model": DownloadJobResponse.Error},
+            200: {"content": {"text/event-stream": {}}},
+        },
+        response_model=None,
+    )
+    async def stream_download_job(job_id: str) -> JSONResponse | StreamingResponse:
+        if download_jobs_service.get_job(job_id=job_id) is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content=DownloadJobResponse.Error(
+                    message=f"Job [{job_id}] doesn't exist ..."
+                ).model_dump(),
+            )
+
+        async def __stream_job_events() -> AsyncIterator[str]:
+            async for download_job in download_jobs_watchers_service.watch_job(
+                job_id=job_id
+            ):
+                if download_job is None:
+                    # A comment line, keeping the connection alive through the proxies
+                    yield ": keepalive\n\n"
+                    continue
+                yield (
+                    "event: job\n"
+                    + f"data: {DownloadJobModel.from_download_job(download_job).model_dump_json()}\n\n"
+                )
+
+        return StreamingResponse(
+            __stream_job_events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @download_jobs_router.websocket("/{job_id}/ws")
+    async def watch_download_job(websocket: WebSocket, job_id: str) -> None:
+        """Sending the status and the progress of a requested download as JSON messages,
+        starting with its current state then each of its updates until it finishes
+        """
+        await websocket.accept()
+        if download_jobs_service.get_job(job_id=job_id) is None:
+            await websocket.send_json(
+                DownloadJobResponse.Error(
+                    message=f"Job [{job_id}] doesn't exist ..."
+                ).model_dump()
+            )
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return None
+
+        try:
+            async for download_job in download_jobs_watchers_service.watch_job(
+                job_id=job_id
+            ):
+                if download_job is not None:
+                    await websocket.send_text(
+                        DownloadJobModel.from_download_job(
+                            download_job
+                        ).model_dump_json()
+                    )
+            await websocket.close()
+        except WebSocketDisconnect:
+            return None
+
+    @download_jobs_router.get(
+        "",
+        description="List the requested downloads, the running ones first then the finished ones",
+        operation_id="get_download_jobs",
+        responses={
+            200: {"model": DownloadJobsResponse.Success},
+        },
+        response_model=DownloadJobsResponse.Success,
+    )
+    async def get_download_jobs(
+        offset: int = Query(default=0, ge=0),
+        limit: int = Query(default=20, ge=1, le=100),
+    ) -> DownloadJobsResponse.Success:
+        download_jobs, total_count = download_jobs_service.get_jobs(
+            offset=offset, limit=limit
+        )
+        return DownloadJobsResponse.Success(
+            jobs=[
+                DownloadJobModel.from_download_job(download_job)
+                for download_job in download_jobs
+            ],
+            total_count=total_count,
+            offset=offset,
+            limit=limit,
+        )
+
+    return download_jobs_router
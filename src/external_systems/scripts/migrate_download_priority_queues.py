@@ -0,0 +1,79 @@
+import asyncio
+import os
+
+from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.queue_migrator import (
+    PikaRabbitMqQueueMigrator,
+)
+from src.configs.rabbitmq import RabbitMQConfigs
+from src.domain.entity.commands.generic_command import GenericCommand
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_command import (
+    DownloadYouTubeVideoFromUrlCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_command import (
+    DownloadYouTubeVideoFromTxtFileCommand,
+)
+from src.domain.entity.commands.video.youtube.download_youtube_videos_from_txt_file_to_channel_name_dir_command import (
+    DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+)
+from src.external_systems.commands_handler.video.download.utils import (
+    get_lane_queue_topic,
+)
+
+# The download handlers with the command they consume, their queues were plain (durable) ones
+# named after the command's topic and the handler before they became priority queues
+__DOWNLOAD_HANDLERS_COMMANDS: list[tuple[str, type[GenericCommand]]] = [
+    (
+        "download_youtube_video_for_url_command_handler",
+        DownloadYouTubeVideoFromUrlCommand,
+    ),
+    (
+        "download_youtube_video_from_url_to_channel_name_command_handler_dir",
+        DownloadYouTubeVideoFromUrlToChannelNameDirCommand,
+    ),
+    (
+        "download_youtube_video_from_txt_file_command_handler",
+        DownloadYouTubeVideoFromTxtFileCommand,
+    ),
+    (
+        "download_youtube_video_from_txt_file_to_channel_name_dir_command_handler",
+        DownloadYouTubeVideoFromTxtFileToChannelNameDirCommand,
+    ),
+]
+
+
+async def main() -> None:
+    """Moving the pending commands of the download handlers' old queues to their priority queues,
+    then deleting the old ones. Run it once, after stopping the old handlers and before starting the new ones
+    """
+    rabbitmq_configs = RabbitMQConfigs.Production()
+    queue_migrator = PikaRabbitMqQueueMigrator(
+        rabbitmq_host=rabbitmq_configs.host,
+        rabbitmq_port=int(rabbitmq_configs.port),
+        rabbitmq_username=rabbitmq_configs.username,
+        rabbitmq_password=rabbitmq_configs.password,
+    )
+    for handler_name, command_class in __DOWNLOAD_HANDLERS_COMMANDS:
+        old_queue_name = f"{command_class.get_topic()}_{handler_name}"
+        new_queue_name = get_lane_queue_topic(
+            lane_topic=command_class.get_topic(),
+            handler_file_path=os.path.join(
+                "src/external_systems/commands_handler/video/download/youtube",
+                f"{handler_name}.py",
+            ),
+        )
+        moved_messages_count = await queue_migrator.migrate_queue(
+            exchange_name=command_class.get_topic(),
+            old_queue_name=old_queue_name,
+            new_queue_name=new_queue_name,
+            new_queue_arguments={"x-max-priority": GenericCommand.MAX_PRIORITY},
+        )
+        print(
+            f" [*] Moved [{moved_messages_count}] message(s) from [{old_queue_name}] to [{new_queue_name}] ..."
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
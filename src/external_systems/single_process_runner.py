@@ -0,0 +1,74 @@
+import os
+import sys
+import threading
+import time
+from typing import Callable
+
+import uvicorn
+
+from src.configs.gateway import GatewayConfigs
+from src.configs.message_queue import MessageQueueConfigs
+from src.external_systems.commands_handler.generic import (
+    all_commands_persisting_handler,
+)
+from src.external_systems.commands_handler.video.download.youtube import (
+    download_youtube_video_for_url_command_handler,
+    download_youtube_video_from_txt_file_command_handler,
+    download_youtube_video_from_txt_file_to_channel_name_dir_command_handler,
+    download_youtube_video_from_url_to_channel_name_command_handler_dir,
+)
+from src.external_systems.events_handler.generic import all_events_persisting_handler
+from src.external_systems.events_handler.video.persist.youtube import (
+    downloaded_youtube_video_event_handler,
+)
+from src.external_systems.events_handler.video.progress.youtube import (
+    youtube_videos_batch_progress_event_handler,
+)
+
+HANDLERS_ENTRIES: list[Callable[[], None]] = [
+    all_commands_persisting_handler.entry,
+    download_youtube_video_for_url_command_handler.entry,
+    download_youtube_video_from_txt_file_command_handler.entry,
+    download_youtube_video_from_txt_file_to_channel_name_dir_command_handler.entry,
+    download_youtube_video_from_url_to_channel_name_command_handler_dir.entry,
+    all_events_persisting_handler.entry,
+    downloaded_youtube_video_event_handler.entry,
+    youtube_videos_batch_progress_event_handler.entry,
+]
+
+
+def main() -> None:
+    message_queue_configs = MessageQueueConfigs.Production()
+    gateway_configs = GatewayConfigs.Production()
+
+    if message_queue_configs.broker not in ("in_memory", "sqlite"):
+        print(
+            " [x] The single process runner needs [MESSAGE_QUEUE_BROKER=in_memory] or [MESSAGE_QUEUE_BROKER=sqlite],"
+            + f" got [{message_queue_configs.broker}] ..."
+        )
+        return None
+
+    # All the handlers share the same (in-memory or SQLite) broker with the gateway
+    for handler_entry in HANDLERS_ENTRIES:
+        threading.Thread(
+            target=handler_entry, name=handler_entry.__module__, daemon=True
+        ).start()
+    # Giving the handlers the time to bind their queues, since messages published
+    # to a topic without bound queues are dropped
+    time.sleep(1)
+
+    from src.external_systems.gateway.rest_api.runner import app
+
+    # The handlers patched asyncio with `nest_asyncio`, which only supports the default loop
+    uvicorn.run(app, host="0.0.0.0", port=int(gateway_configs.port), loop="asyncio")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print(" [x] Interrupted ...")
+        try:
+            sys.exit(0)
+        except SystemExit:
+            os._exit(0)
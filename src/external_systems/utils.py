@@ -0,0 +1,126 @@
+from functools import cache
+
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_consumer import (
+    AsyncioInMemoryMessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_producer import (
+    AsyncioInMemoryMessageProducer,
+)
+from src.adapters.outbound.communication.message_queue.outbox.sqlite3_impl.message_producer import (
+    Sqlite3OutboxMessageProducer,
+)
+from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
+    PikaRabbitMqMessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
+    PikaRabbitMqMessageProducer,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_broker import (
+    Sqlite3MessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_consumer import (
+    Sqlite3MessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_producer import (
+    Sqlite3MessageProducer,
+)
+from src.configs.message_queue import MessageQueueConfigs
+from src.configs.rabbitmq import RabbitMQConfigs
+from src.ports.outbound.communication.message_queue.message_consumer import (
+    MessageConsumerInterface,
+)
+from src.ports.outbound.communication.message_queue.message_producer import (
+    MessageProducerInterface,
+)
+from src.services.communication.message_queue import MessageQueueCommunicationService
+
+
+@cache
+def get_in_memory_message_broker() -> AsyncioInMemoryMessageBroker:
+    """Getting the in-memory broker shared by the gateway/handlers running in this process"""
+    return AsyncioInMemoryMessageBroker()
+
+
+@cache
+def get_sqlite_message_broker(*, database_path: str) -> Sqlite3MessageBroker:
+    """Getting the SQLite broker shared by the gateway/handlers running in this process,
+    the other processes using the same database file get their own one
+    """
+    return Sqlite3MessageBroker(database_path=database_path)
+
+
+def __get_broker_message_producer_and_consumer(
+    *,
+    message_queue_configs: MessageQueueConfigs.Production | MessageQueueConfigs.Testing,
+    rabbitmq_configs: RabbitMQConfigs.Production | RabbitMQConfigs.Testing,
+) -> tuple[MessageProducerInterface, MessageConsumerInterface]:
+    match message_queue_configs.broker:
+        case "in_memory":
+            in_memory_message_broker = get_in_memory_message_broker()
+            return AsyncioInMemoryMessageProducer(
+                message_broker=in_memory_message_broker
+            ), AsyncioInMemoryMessageConsumer(message_broker=in_memory_message_broker)
+        case "sqlite":
+            sqlite_message_broker = get_sqlite_message_broker(
+                database_path=message_queue_configs.sqlite_database_path
+            )
+            return Sqlite3MessageProducer(
+                message_broker=sqlite_message_broker
+            ), Sqlite3MessageConsumer(message_broker=sqlite_message_broker)
+        case "rabbitmq" | "":
+            return PikaRabbitMqMessageProducer(
+                rabbitmq_host=rabbitmq_configs.host,
+                rabbitmq_port=int(rabbitmq_configs.port),
+                rabbitmq_password=rabbitmq_configs.password,
+                rabbitmq_username=rabbitmq_configs.username,
+            ), PikaRabbitMqMessageConsumer(
+                rabbitmq_host=rabbitmq_configs.host,
+                rabbitmq_port=int(rabbitmq_configs.port),
+                rabbitmq_password=rabbitmq_configs.password,
+                rabbitmq_username=rabbitmq_configs.username,
+            )
+        case _:
+            raise ValueError(
+                f"Unsupported message queue broker [{message_queue_configs.broker}] !"
+            )
+
+
+def get_message_queue_service(
+    *,
+    message_queue_configs: MessageQueueConfigs.Production
+    | MessageQueueConfigs.Testing = MessageQueueConfigs.Production(),
+    rabbitmq_configs: RabbitMQConfigs.Production
+    | RabbitMQConfigs.Testing = RabbitMQConfigs.Production(),
+) -> MessageQueueCommunicationService:
+    """Building the message queue service on top of the configured broker, producing through
+    the local outbox (if one is configured) so the messages aren't lost while the broker is down
+
+    Args:
+        message_queue_configs (MessageQueueConfigs.Production | MessageQueueConfigs.Testing): The configs
+            selecting the broker and the outbox. Defaults to MessageQueueConfigs.Production()
+        rabbitmq_configs (RabbitMQConfigs.Production | RabbitMQConfigs.Testing): The RabbitMQ configs,
+            used only for the `rabbitmq` broker. Defaults to RabbitMQConfigs.Production()
+
+    Returns:
+        MessageQueueCommunicationService: The message queue service
+    """
+    message_producer, message_consumer = __get_broker_message_producer_and_consumer(
+        message_queue_configs=message_queue_configs, rabbitmq_configs=rabbitmq_configs
+    )
+    if message_queue_configs.outbox_database_path:
+        message_producer = Sqlite3OutboxMessageProducer(
+            message_producer=message_producer,
+            database_path=message_queue_configs.outbox_database_path,
+        )
+
+    return MessageQueueCommunicationService(
+        message_producer=message_producer,
+        message_consumer=message_consumer,
+        message_codec=MsgPackMessageCodec(),
+    )
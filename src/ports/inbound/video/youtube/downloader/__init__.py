@@ -4,7 +4,7 @@ from typing import Any, Callable
 from src.domain.entity.error.video import (
     DownloadingYouTubeVideoError,
 )
-from src.domain.entity.video.youtube import DownloadedYouTubeVideo
+from src.domain.entity.video.youtube import DownloadedYouTubeVideo, YouTubeVideoInfo
 from src.domain.entity.video.download_status import (
     OnCompleteDownloadingVideoStatus,
     OnProgressDownloadingVideoStatus,
@@ -27,6 +27,7 @@ class YouTubeVideoDownloaderInterface(ABC):
         initial_tags: list[str] = [],
         on_progress_callback: Callable[[OnProgressDownloadingVideoStatus], Any],
         on_complete_callback: Callable[[OnCompleteDownloadingVideoStatus], Any],
+        video_info: YouTubeVideoInfo | None = None,
     ) -> DownloadingYouTubeVideoError | DownloadedYouTubeVideo:
         """Downloading a video to a directory from a url
 
@@ -41,6 +42,8 @@ class YouTubeVideoDownloaderInterface(ABC):
                 Callback to be used when any updates happens to the download progress
             on_complete_callback (Callable[[OnCompleteDownloadingVideoStatus], Any]):
                 Callback to be used when any updates happens to the download complete
+            video_info (YouTubeVideoInfo, optional): The already fetched info of the video, when it holds
+                its raw info the video is downloaded straight away without extracting it again. Defaults to None.
 
         Returns:
             DownloadingYouTubeVideoError | DownloadedYouTubeVideo: Either Error entity or a Success entity
@@ -21,6 +21,21 @@ class CommandRepositoryInterface(ABC):
         """
         raise Exception("This should be implemented from an adapter !")
 
+    @abstractmethod
+    def save_commands(
+        self, *, commands: list[GenericCommand]
+    ) -> list[SavingCommandError | None]:
+        """Saving many commands into a repository/storage at once (in the same transaction)
+
+        Args:
+            commands (list[GenericCommand]): The commands that need to be saved
+
+        Returns:
+            list[SavingCommandError | None]: For each command (in the same order), either an error if there is
+                an error (e.g. a duplicated command) or None if success
+        """
+        raise Exception("This should be implemented from an adapter !")
+
     @abstractmethod
     def get_commands_by_topic(self, *, topic: str) -> list[GenericCommand]:
         """Getting command by a specific topic
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.domain.entity.error.message_queue import (
+    DecodingMessageError,
+    EncodingMessageError,
+)
+
+
+class MessageCodecInterface(ABC):
+    @abstractmethod
+    def __init__(self) -> None:
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    def get_content_type(self) -> str:
+        """Getting the content type of the encoded messages (e.g. application/msgpack)"""
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    def encode(self, *, data: dict[str, Any]) -> EncodingMessageError | bytes:
+        """Encoding primitive data (dicts, lists, strings, numbers, ...) into bytes to be sent as a message
+
+        Args:
+            data (dict[str, Any]): The data that needs to be encoded
+
+        Returns:
+            EncodingMessageError | bytes: Either an error if there is an error or the encoded bytes if success
+        """
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    def decode(self, *, data: bytes) -> DecodingMessageError | dict[str, Any]:
+        """Decoding the bytes of a message back into primitive data
+
+        Args:
+            data (bytes): The bytes that needs to be decoded
+
+        Returns:
+            DecodingMessageError | dict[str, Any]: Either an error if there is an error or the decoded data if success
+        """
+        raise Exception("This should be implemented from an adapter !")
@@ -1,9 +1,20 @@
 from abc import ABC, abstractmethod
 from typing import Any, Callable
 from src.domain.entity.error.message_queue import ConsumingMessageError
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
 
 
 class MessageConsumerInterface(ABC):
+    """Consuming messages from a message queue, a message is acknowledged once its callback has completed.
+
+    What happens to a message whose callback fails depends on the broker: the durable ones (RabbitMQ, SQLite)
+    deliver it again after growing delays then park it to be inspected, the in-memory one drops it
+    """
+
     @abstractmethod
     def __init__(self) -> None:
         raise Exception("This should be implemented from an adapter!")
@@ -14,22 +25,97 @@ class MessageConsumerInterface(ABC):
         *,
         exchange_name: str,
         queue_topic: str,
-        deserialization_function: Callable[[dict[str, Any]], T],
+        deserialization_function: Callable[[QueueMessage], T],
         callback_function: Callable[[T], Any],
         consume_forever: bool = True,
         retry_attempts: int = 3,
         retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
     ) -> ConsumingMessageError | None:
         """Consume messages from a specific topic in a message queue
 
         Args:
             exchange_name (str): The exchange that the messages will be consumed from
             queue_topic (str): The queue topic that the messages will be consumed from
-            deserialization_function (Callable[[dict[str, Any]], T]): The deserialization function that will be used
-            callback_function (Callable[[T], Any]): Call back function to be called when getting a new message
+            deserialization_function (Callable[[QueueMessage], T]): The deserialization function that will be used
+                on the received message (its body, content type and headers)
+            callback_function (Callable[[T], Any]): Call back function to be called when getting a new message,
+                it can be a blocking function (ran in a worker thread) or an `async def` one (awaited directly)
             consume_forever (bool): If this consumption will run forever or just once. Defaults to True
             retry_attempts (int): The retry attempts number if there is any error. Defaults to 3 attempts
-            retry_timeout (int): The retry timeout. Defaults to 3 seconds
+            retry_timeout (int): The delay before the first retry, doubled (with some jitter) on every next one.
+                Defaults to 3 seconds
+            prefetch_count (int): How many unacknowledged messages can be delivered to this consumer at once.
+                Defaults to 1 message
+            max_concurrency (int): How many messages can be processed concurrently, each message is acknowledged
+                only after its callback has completed. Defaults to 1 message at a time
+
+        """
+        raise Exception("This should be implemented from an adapter!")
+
+    @abstractmethod
+    def consume_subscriptions(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        """Consume messages from many topics at once over the same connection, each subscription
+        having its own exchange, queue topic, deserialization function and callback function
+
+        Args:
+            subscriptions (list[MessageSubscription]): The subscriptions that the messages will be consumed for
+            consume_forever (bool): If this consumption will run forever or just once (for the first message
+                from any of the subscriptions). Defaults to True
+            retry_attempts (int): The retry attempts number if there is any error. Defaults to 3 attempts
+            retry_timeout (int): The delay before the first retry, doubled (with some jitter) on every next one.
+                Defaults to 3 seconds
+            prefetch_count (int): How many unacknowledged messages can be delivered to this consumer at once
+                (shared by all the subscriptions). Defaults to 1 message
+            max_concurrency (int): How many messages can be processed concurrently (shared by all the subscriptions
+                without a max concurrency of their own, which get reserved workers instead),
+                each message is acknowledged only after its callback has completed. Defaults to 1 message at a time
+
+        """
+        raise Exception("This should be implemented from an adapter!")
+
+    @abstractmethod
+    def consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        retry_attempts: int = 3,
+        retry_timeout: int = 3,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        """Consume messages in batches from many topics at once over the same connection, each batch being
+        acknowledged (or requeued) as a whole depending on the result of its subscription's batch callback
+
+        Args:
+            subscriptions (list[MessageBatchSubscription]): The subscriptions that the batches will be consumed for
+            consume_forever (bool): If this consumption will run forever or just once (for the first batch
+                of each subscription). Defaults to True
+            retry_attempts (int): The retry attempts number if there is any error. Defaults to 3 attempts
+            retry_timeout (int): The delay before the first retry, doubled (with some jitter) on every next one.
+                Defaults to 3 seconds
+            batch_size (int): The maximum number of messages in a batch. Defaults to 100 messages
+            batch_timeout_in_ms (int): How long to wait for a batch to fill up after its first message
+                before handing it to the callback. Defaults to 500 milliseconds
 
         """
         raise Exception("This should be implemented from an adapter!")
+
+    @abstractmethod
+    def stop_consuming(self) -> None:
+        """Stopping all the consumptions of this consumer (from any thread), their consuming calls return
+        once their in-flight messages have been processed and their transient queues have been released.
+        A stopped consumer doesn't consume anymore
+        """
+        raise Exception("This should be implemented from an adapter!")
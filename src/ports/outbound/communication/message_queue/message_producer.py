@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Iterable
 
 from src.domain.entity.error.message_queue import ProducingMessageError
 
@@ -10,12 +11,78 @@ class MessageProducerInterface(ABC):
 
     @abstractmethod
     def produce_message(
-        self, *, topic: str, data: bytes
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
     ) -> ProducingMessageError | None:
         """Producing a message to the message queue at this specific topic specified
 
         Args:
             topic (str): The topic that the message should be delivered to
-            data (bytes): The data that should be send as a message [This should be bytes out of json format object]
+            data (bytes): The data that should be send as a message [This should be bytes out of an encoded object]
+            content_type (str, optional): The content type of the data (e.g. application/msgpack). Defaults to None.
+            headers (dict[str, Any], optional): The headers that will be sent along with the message. Defaults to None.
+            priority (int, optional): The priority of the message, delivered first from the queues supporting
+                priorities. Defaults to None.
+        """
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        """Producing many messages to the message queue at this specific topic specified at once,
+        the messages are published with publisher confirms and their confirmations are awaited together
+
+        Args:
+            topic (str): The topic that the messages should be delivered to
+            data_items (Iterable[bytes]): The data of each message that should be send
+            content_type (str, optional): The content type of all the data items. Defaults to None.
+            headers (dict[str, Any], optional): The headers that will be sent along with every message. Defaults to None.
+            priority (int, optional): The priority of every message, delivered first from the queues supporting
+                priorities. Defaults to None.
+
+        Returns:
+            list[ProducingMessageError | None]: The producing status of each message in the same order of the data items
+        """
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        """Producing a message to the message queue at this specific topic specified without blocking
+        the caller's event loop (to be awaited from async code such as the gateway's routes)
+
+        Args:
+            topic (str): The topic that the message should be delivered to
+            data (bytes): The data that should be send as a message [This should be bytes out of an encoded object]
+            content_type (str, optional): The content type of the data (e.g. application/msgpack). Defaults to None.
+            headers (dict[str, Any], optional): The headers that will be sent along with the message. Defaults to None.
+            priority (int, optional): The priority of the message, delivered first from the queues supporting
+                priorities. Defaults to None.
+        """
+        raise Exception("This should be implemented from an adapter !")
+
+    @abstractmethod
+    def close(self) -> None:
+        """Closing the producer's connection(s) to the message queue and releasing its resources,
+        any message produced after closing will be returning an error
         """
         raise Exception("This should be implemented from an adapter !")
@@ -21,6 +21,21 @@ class EventRepositoryInterface(ABC):
         """
         raise Exception("This should be implemented from an adapter !")
 
+    @abstractmethod
+    def save_events(
+        self, *, events: list[GenericEvent]
+    ) -> list[SavingEventError | None]:
+        """Saving many events into a repository/storage at once (in the same transaction)
+
+        Args:
+            events (list[GenericEvent]): The events that need to be saved
+
+        Returns:
+            list[SavingEventError | None]: For each event (in the same order), either an error if there is
+                an error (e.g. a duplicated event) or None if success
+        """
+        raise Exception("This should be implemented from an adapter !")
+
     @abstractmethod
     def get_events_by_topic(self, *, topic: str) -> list[GenericEvent]:
         """Getting event(s) by a specific topic
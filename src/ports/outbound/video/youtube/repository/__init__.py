@@ -20,6 +20,12 @@ class YouTubeVideoRepositoryInterface(ABC):
     ) -> SavingYouTubeVideoError | RepositoryYouTubeVideo:
         raise Exception("This should be implemented from an adapter !")
 
+    @abstractmethod
+    def save_videos(
+        self, *, videos: list[DownloadedYouTubeVideo]
+    ) -> list[SavingYouTubeVideoError | RepositoryYouTubeVideo]:
+        raise Exception("This should be implemented from an adapter !")
+
     @abstractmethod
     def get_video_by_uuid(
         self, *, uuid: str
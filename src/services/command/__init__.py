@@ -10,5 +10,10 @@ class CommandService:
     def save_command(self, *, command: GenericCommand) -> SavingCommandError | None:
         return self.__command_repository.save_command(command=command)
 
+    def save_commands(
+        self, *, commands: list[GenericCommand]
+    ) -> list[SavingCommandError | None]:
+        return self.__command_repository.save_commands(commands=commands)
+
     def get_commands_by_topic(self, *, topic: str) -> list[GenericCommand]:
         return self.__command_repository.get_commands_by_topic(topic=topic)
@@ -0,0 +1,39 @@
+import threading
+from collections import OrderedDict
+
+
+class CommandsDeduplicationService:
+    """Remembering the keys of the commands a worker is processing or has processed, so the duplicates
+    it gets (like the ones of a txt file fanned out again) are skipped instead of being processed again.
+
+    Up to `max_processed_keys` processed keys are kept, the least recently processed ones are forgotten first.
+    The keys only live in the memory of this worker, so it doesn't skip the duplicates that other workers
+    get (or that it gets again after a restart), it's a best-effort deduplication
+    """
+
+    def __init__(self, *, max_processed_keys: int = 100_000) -> None:
+        self.__max_processed_keys = max_processed_keys
+        self.__lock = threading.Lock()
+        self.__processing_keys: set[str] = set()
+        self.__processed_keys: OrderedDict[str, None] = OrderedDict()
+
+    def start_processing(self, *, key: str) -> bool:
+        """Starting to process a command, returning False when it's a duplicate to be skipped"""
+        with self.__lock:
+            if key in self.__processing_keys or key in self.__processed_keys:
+                return False
+            self.__processing_keys.add(key)
+            return True
+
+    def finish_processing(self, *, key: str, is_processed: bool = True) -> None:
+        """Finishing to process a command, the ones that haven't been processed (like when their processing
+        raised so they are redelivered) can be processed again
+        """
+        with self.__lock:
+            self.__processing_keys.discard(key)
+            if not is_processed:
+                return None
+            self.__processed_keys[key] = None
+            self.__processed_keys.move_to_end(key)
+            if len(self.__processed_keys) > self.__max_processed_keys:
+                self.__processed_keys.popitem(last=False)
@@ -1,8 +1,24 @@
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
+from src.domain.entity.commands.generic_command import GenericCommand
+from src.domain.entity.events.generic import GenericEvent
 from src.domain.entity.error.message_queue import (
     ConsumingMessageError,
+    DecodingMessageError,
+    EncodingMessageError,
     ProducingMessageError,
 )
+from src.domain.entity.message_queue.message_registry import (
+    MessageRegistry,
+    get_default_message_registry,
+)
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.ports.outbound.communication.message_queue.message_codec import (
+    MessageCodecInterface,
+)
 from src.ports.outbound.communication.message_queue.message_producer import (
     MessageProducerInterface,
 )
@@ -17,14 +33,208 @@ class MessageQueueCommunicationService:
         *,
         message_producer: MessageProducerInterface,
         message_consumer: MessageConsumerInterface,
+        message_codec: MessageCodecInterface,
+        message_registry: MessageRegistry = get_default_message_registry(),
     ) -> None:
         self.__message_producer = message_producer
         self.__message_consumer = message_consumer
+        self.__message_codec = message_codec
+        self.__message_registry = message_registry
+
+    def __encode_message(
+        self, *, message: GenericCommand | GenericEvent
+    ) -> EncodingMessageError | bytes:
+        return self.__message_codec.encode(
+            data=self.__message_registry.to_primitive(message=message)
+        )
+
+    def __decode_queue_message(self, *, queue_message: QueueMessage) -> dict[str, Any]:
+        if (
+            queue_message.content_type is not None
+            and queue_message.content_type != self.__message_codec.get_content_type()
+        ):
+            raise ValueError(
+                f"Unsupported content type [{queue_message.content_type}],"
+                + f" expected [{self.__message_codec.get_content_type()}] !"
+            )
+
+        decoding_status = self.__message_codec.decode(data=queue_message.body)
+        match decoding_status:
+            case DecodingMessageError() as error:
+                raise ValueError(error.error)
+            case _:
+                return decoding_status
+
+    def __decode_domain_message[T: GenericCommand | GenericEvent](
+        self, *, message_class: type[T], queue_message: QueueMessage
+    ) -> T:
+        supported_schema_version = self.__message_registry.get_schema_version(
+            topic=message_class.get_topic()
+        )
+        schema_version = queue_message.headers.get(
+            MessageRegistry.SCHEMA_VERSION_HEADER, supported_schema_version
+        )
+        if (
+            supported_schema_version is None
+            or schema_version > supported_schema_version
+        ):
+            raise ValueError(
+                f"Unsupported schema version [{schema_version}] for [{message_class.get_topic()}],"
+                + f" supported version is [{supported_schema_version}] !"
+            )
+
+        return self.__message_registry.from_primitive(
+            message_class=message_class,
+            data=self.__decode_queue_message(queue_message=queue_message),
+        )
+
+    @staticmethod
+    def __get_lane(message: GenericCommand | GenericEvent) -> tuple[str, int | None]:
+        """Getting the topic and the priority a command/event is produced with,
+        the commands go over their (interactive or bulk) lane with their own priority
+        """
+        match message:
+            case GenericCommand():
+                return message.get_lane_topic(), message.priority
+            case _:
+                return message.get_topic(), None
 
     def produce_message(
-        self, *, topic: str, data: bytes
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        return self.__message_producer.produce_message(
+            topic=topic,
+            data=data,
+            content_type=content_type,
+            headers=headers,
+            priority=priority,
+        )
+
+    def produce_messages(
+        self,
+        *,
+        topic: str,
+        data_items: Iterable[bytes],
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> list[ProducingMessageError | None]:
+        return self.__message_producer.produce_messages(
+            topic=topic,
+            data_items=data_items,
+            content_type=content_type,
+            headers=headers,
+            priority=priority,
+        )
+
+    async def aproduce_message(
+        self,
+        *,
+        topic: str,
+        data: bytes,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+        priority: int | None = None,
+    ) -> ProducingMessageError | None:
+        return await self.__message_producer.aproduce_message(
+            topic=topic,
+            data=data,
+            content_type=content_type,
+            headers=headers,
+            priority=priority,
+        )
+
+    def produce_domain_message(
+        self, *, message: GenericCommand | GenericEvent
+    ) -> ProducingMessageError | None:
+        """Encoding a command/event with the message codec and producing it to its own topic
+        (or to its bulk lane for the bulk commands)
+        """
+        encoding_status = self.__encode_message(message=message)
+        match encoding_status:
+            case EncodingMessageError() as error:
+                return ProducingMessageError(error=error.error)
+            case _:
+                topic, priority = self.__get_lane(message)
+                return self.produce_message(
+                    topic=topic,
+                    data=encoding_status,
+                    content_type=self.__message_codec.get_content_type(),
+                    headers=self.__message_registry.get_headers(
+                        topic=message.get_topic()
+                    ),
+                    priority=priority,
+                )
+
+    async def aproduce_domain_message(
+        self, *, message: GenericCommand | GenericEvent
     ) -> ProducingMessageError | None:
-        return self.__message_producer.produce_message(topic=topic, data=data)
+        """Encoding a command/event with the message codec and producing it to its own topic
+        (or to its bulk lane for the bulk commands) without blocking the caller's event loop
+        """
+        encoding_status = self.__encode_message(message=message)
+        match encoding_status:
+            case EncodingMessageError() as error:
+                return ProducingMessageError(error=error.error)
+            case _:
+                topic, priority = self.__get_lane(message)
+                return await self.aproduce_message(
+                    topic=topic,
+                    data=encoding_status,
+                    content_type=self.__message_codec.get_content_type(),
+                    headers=self.__message_registry.get_headers(
+                        topic=message.get_topic()
+                    ),
+                    priority=priority,
+                )
+
+    def produce_domain_messages[T: GenericCommand | GenericEvent](
+        self, *, message_class: type[T], messages: list[T]
+    ) -> list[ProducingMessageError | None]:
+        """Encoding many commands/events of the same type and producing them at once to their topic,
+        with one batch per lane and priority
+        """
+        encoded_messages_by_lane: dict[tuple[str, int | None], list[int]] = {}
+        encoding_statuses = [
+            self.__encode_message(message=message) for message in messages
+        ]
+        for index, (message, encoding_status) in enumerate(
+            zip(messages, encoding_statuses)
+        ):
+            if isinstance(encoding_status, bytes):
+                encoded_messages_by_lane.setdefault(
+                    self.__get_lane(message), []
+                ).append(index)
+
+        producing_statuses: list[ProducingMessageError | None] = [
+            (
+                ProducingMessageError(error=encoding_status.error)
+                if isinstance(encoding_status, EncodingMessageError)
+                else None
+            )
+            for encoding_status in encoding_statuses
+        ]
+        for (topic, priority), indexes in encoded_messages_by_lane.items():
+            for index, producing_status in zip(
+                indexes,
+                self.produce_messages(
+                    topic=topic,
+                    data_items=[encoding_statuses[index] for index in indexes],
+                    content_type=self.__message_codec.get_content_type(),
+                    headers=self.__message_registry.get_headers(
+                        topic=message_class.get_topic()
+                    ),
+                    priority=priority,
+                ),
+            ):
+                producing_statuses[index] = producing_status
+        return producing_statuses
 
     def consume_messages[T](
         self,
@@ -34,11 +244,137 @@ class MessageQueueCommunicationService:
         deserialization_function: Callable[[dict[str, Any]], T],
         callback_function: Callable[[T], Any],
         consume_forever: bool = True,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
     ) -> ConsumingMessageError | None:
         return self.__message_consumer.consume_messages(
             exchange_name=exchange_name,
             queue_topic=queue_topic,
-            deserialization_function=deserialization_function,
+            deserialization_function=lambda queue_message: deserialization_function(
+                self.__decode_queue_message(queue_message=queue_message)
+            ),
             callback_function=callback_function,
             consume_forever=consume_forever,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
         )
+
+    def consume_domain_messages[T: GenericCommand | GenericEvent](
+        self,
+        *,
+        message_class: type[T],
+        queue_topic: str,
+        callback_function: Callable[[T], Any],
+        consume_forever: bool = True,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        """Consuming the commands/events of a specific type from their own topic,
+        decoding them with the message codec and the (precomputed) registry decoders
+        """
+        return self.__message_consumer.consume_messages(
+            exchange_name=message_class.get_topic(),
+            queue_topic=queue_topic,
+            deserialization_function=lambda queue_message: self.__decode_domain_message(
+                message_class=message_class, queue_message=queue_message
+            ),
+            callback_function=callback_function,
+            consume_forever=consume_forever,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
+        )
+
+    def get_domain_message_subscription[T: GenericCommand | GenericEvent](
+        self,
+        *,
+        message_class: type[T],
+        queue_topic: str,
+        callback_function: Callable[[T], Any],
+        exchange_name: str | None = None,
+        max_priority: int | None = None,
+        max_concurrency: int | None = None,
+        is_transient: bool = False,
+    ) -> MessageSubscription[T]:
+        """Building a subscription to the commands/events of a specific type, to be consumed
+        along with other subscriptions using `consume_subscriptions`
+
+        Args:
+            exchange_name (str | None): The topic to subscribe to instead of the type's own one,
+                like the bulk lane of a command
+            max_priority (int | None): The max priority of the queue, when it's a priority queue
+            max_concurrency (int | None): The workers reserved to this subscription,
+                instead of sharing the consumer's ones with the other subscriptions
+            is_transient (bool): Whether the queue is deleted with its consumer,
+                like the queue of a single gateway worker
+        """
+        return MessageSubscription(
+            exchange_name=exchange_name or message_class.get_topic(),
+            queue_topic=queue_topic,
+            deserialization_function=lambda queue_message: self.__decode_domain_message(
+                message_class=message_class, queue_message=queue_message
+            ),
+            callback_function=callback_function,
+            max_priority=max_priority,
+            max_concurrency=max_concurrency,
+            is_transient=is_transient,
+        )
+
+    def consume_subscriptions(
+        self,
+        *,
+        subscriptions: list[MessageSubscription],
+        consume_forever: bool = True,
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+    ) -> ConsumingMessageError | None:
+        return self.__message_consumer.consume_subscriptions(
+            subscriptions=subscriptions,
+            consume_forever=consume_forever,
+            prefetch_count=prefetch_count,
+            max_concurrency=max_concurrency,
+        )
+
+    def get_domain_message_batch_subscription[T: GenericCommand | GenericEvent](
+        self,
+        *,
+        message_class: type[T],
+        queue_topic: str,
+        batch_callback_function: Callable[[list[T]], bool],
+        exchange_name: str | None = None,
+    ) -> MessageBatchSubscription[T]:
+        """Building a subscription to batches of the commands/events of a specific type,
+        to be consumed along with other batch subscriptions using `consume_batches`
+
+        Args:
+            exchange_name (str | None): The topic to subscribe to instead of the type's own one,
+                like the bulk lane of a command
+        """
+        return MessageBatchSubscription(
+            exchange_name=exchange_name or message_class.get_topic(),
+            queue_topic=queue_topic,
+            deserialization_function=lambda queue_message: self.__decode_domain_message(
+                message_class=message_class, queue_message=queue_message
+            ),
+            batch_callback_function=batch_callback_function,
+        )
+
+    def consume_batches(
+        self,
+        *,
+        subscriptions: list[MessageBatchSubscription],
+        consume_forever: bool = True,
+        batch_size: int = 100,
+        batch_timeout_in_ms: int = 500,
+    ) -> ConsumingMessageError | None:
+        return self.__message_consumer.consume_batches(
+            subscriptions=subscriptions,
+            consume_forever=consume_forever,
+            batch_size=batch_size,
+            batch_timeout_in_ms=batch_timeout_in_ms,
+        )
+
+    def stop_consuming(self) -> None:
+        return self.__message_consumer.stop_consuming()
+
+    def close(self) -> None:
+        return self.__message_producer.close()
@@ -10,5 +10,10 @@ class EventService:
     def save_event(self, *, event: GenericEvent) -> SavingEventError | None:
         return self.__event_repository.save_event(event=event)
 
+    def save_events(
+        self, *, events: list[GenericEvent]
+    ) -> list[SavingEventError | None]:
+        return self.__event_repository.save_events(events=events)
+
     def get_events_by_topic(self, *, topic: str) -> list[GenericEvent]:
         return self.__event_repository.get_events_by_topic(topic=topic)
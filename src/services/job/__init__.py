@@ -0,0 +1,230 @@
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from itertools import chain, islice
+from typing import Any, Callable
+
+from src.domain.entity.job.download_job import DownloadJob
+from src.domain.entity.video.download_progress import (
+    VideoDownloadProgressSnapshot,
+    VideosDownloadProgress,
+)
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+
+
+class DownloadJobsService:
+    """A compact in-memory table of the download jobs, fed by the requested commands and the events
+    of the workers downloading them (which can come in any order, from any process and more than once),
+    so the jobs are served without any round trip to the broker or the database.
+
+    The done urls of every job are counted once whatever the count of their events, and a txt file
+    that couldn't be fanned out fails its job along with its (empty) urls count
+    """
+
+    def __init__(self, *, max_finished_jobs: int = 1000) -> None:
+        self.__max_finished_jobs = max_finished_jobs
+        self.__lock = threading.Lock()
+        self.__jobs: dict[str, DownloadJob] = {}
+        # The latest progress of the running downloads of every job, by their urls
+        self.__jobs_downloads: dict[
+            str, dict[str, OnProgressDownloadingVideoStatus]
+        ] = {}
+        # The downloaded and the failed urls of the running jobs
+        self.__jobs_done_urls: dict[str, tuple[set[str], set[str]]] = {}
+        # Remembering the latest finished jobs, so their redelivered events don't open them again
+        self.__finished_jobs: OrderedDict[str, DownloadJob] = OrderedDict()
+        self.__on_job_updated_callbacks: list[Callable[[DownloadJob], Any]] = []
+
+    def add_on_job_updated_callback(
+        self, callback: Callable[[DownloadJob], Any]
+    ) -> None:
+        """Adding a callback called (outside of the lock) with every job that has been updated"""
+        self.__on_job_updated_callbacks.append(callback)
+
+    def __update_job(
+        self,
+        *,
+        job_id: str,
+        update_function: Callable[[DownloadJob], DownloadJob],
+    ) -> DownloadJob:
+        with self.__lock:
+            finished_job = self.__finished_jobs.get(job_id)
+            if finished_job is not None:
+                return finished_job
+            job = self.__update_job_locked(
+                job_id=job_id, update_function=update_function
+            )
+
+        for on_job_updated_callback in self.__on_job_updated_callbacks:
+            try:
+                on_job_updated_callback(job)
+            except Exception as ex:
+                print(
+                    f" [x] Error notifying the update of job [{job_id}] for reason [{str(ex)}] ..."
+                )
+        return job
+
+    def __update_job_locked(
+        self,
+        *,
+        job_id: str,
+        update_function: Callable[[DownloadJob], DownloadJob],
+    ) -> DownloadJob:
+        """Updating a job that isn't finished yet (the lock must be held)"""
+        now_iso_format = datetime.datetime.now().isoformat()
+        job = replace(
+            update_function(
+                self.__jobs.get(job_id)
+                or DownloadJob(
+                    job_id=job_id,
+                    created_at_iso_format=now_iso_format,
+                    updated_at_iso_format=now_iso_format,
+                )
+            ),
+            updated_at_iso_format=now_iso_format,
+        )
+        if not job.is_finished():
+            self.__jobs[job_id] = job
+            return job
+
+        self.__jobs.pop(job_id, None)
+        self.__jobs_downloads.pop(job_id, None)
+        self.__jobs_done_urls.pop(job_id, None)
+        job = replace(job, progress=VideosDownloadProgress())
+        self.__finished_jobs[job_id] = job
+        if len(self.__finished_jobs) > self.__max_finished_jobs:
+            self.__finished_jobs.popitem(last=False)
+        return job
+
+    def __add_done_url(
+        self, *, job: DownloadJob, url: str, is_downloaded: bool, is_batch: bool
+    ) -> DownloadJob:
+        """Counting a done url of a job and removing its download from the job's progress, a url
+        that failed then got downloaded (like when its command has been redelivered) only counts
+        as downloaded (the lock must be held)
+        """
+        downloaded_urls, failed_urls = self.__jobs_done_urls.setdefault(
+            job.job_id, (set(), set())
+        )
+        (downloaded_urls if is_downloaded else failed_urls).add(url)
+        job_downloads = self.__jobs_downloads.get(job.job_id, {})
+        job_downloads.pop(url, None)
+        return replace(
+            job,
+            urls_count=job.urls_count if is_batch else 1,
+            downloaded_count=len(downloaded_urls),
+            failed_count=len(failed_urls - downloaded_urls),
+            progress=VideosDownloadProgress.from_statuses(job_downloads.values()),
+        )
+
+    def add_requested_job(
+        self, *, job_id: str, topic: str, created_at_iso_format: str, is_batch: bool
+    ) -> DownloadJob:
+        return self.__update_job(
+            job_id=job_id,
+            update_function=lambda job: replace(
+                job,
+                topic=topic,
+                created_at_iso_format=created_at_iso_format,
+                urls_count=job.urls_count if is_batch else 1,
+            ),
+        )
+
+    def add_failed_request(self, *, job_id: str, error: str) -> DownloadJob:
+        """Failing a job whose command couldn't be requested, so none of its urls will ever be done"""
+        return self.__update_job(
+            job_id=job_id,
+            update_function=lambda job: replace(
+                job, urls_count=job.get_done_count(), last_error=error
+            ),
+        )
+
+    def add_fanned_out_urls(
+        self, *, job_id: str, urls_count: int, error: str | None = None
+    ) -> DownloadJob:
+        return self.__update_job(
+            job_id=job_id,
+            update_function=lambda job: replace(
+                job,
+                urls_count=urls_count,
+                last_error=job.last_error if error is None else error,
+            ),
+        )
+
+    def add_downloaded_video(
+        self, *, job_id: str, url: str, is_batch: bool
+    ) -> DownloadJob:
+        return self.__update_job(
+            job_id=job_id,
+            update_function=lambda job: self.__add_done_url(
+                job=job, url=url, is_downloaded=True, is_batch=is_batch
+            ),
+        )
+
+    def add_failed_video(
+        self, *, job_id: str, url: str, error: str, is_batch: bool
+    ) -> DownloadJob:
+        return self.__update_job(
+            job_id=job_id,
+            update_function=lambda job: replace(
+                self.__add_done_url(
+                    job=job, url=url, is_downloaded=False, is_batch=is_batch
+                ),
+                last_error=error,
+            ),
+        )
+
+    def add_progress_snapshots(
+        self, *, snapshots: list[VideoDownloadProgressSnapshot]
+    ) -> list[DownloadJob]:
+        """Adding the progress of a worker's tick, returning the jobs that progressed"""
+        jobs_statuses: dict[str, list[OnProgressDownloadingVideoStatus]] = {}
+        for snapshot in snapshots:
+            if snapshot.job_id is not None:
+                jobs_statuses.setdefault(snapshot.job_id, []).append(snapshot.status)
+
+        def __update_progress(
+            job: DownloadJob, statuses: list[OnProgressDownloadingVideoStatus]
+        ) -> DownloadJob:
+            job_downloads = self.__jobs_downloads.setdefault(job.job_id, {})
+            for status in statuses:
+                job_downloads[status.url] = status
+            return replace(
+                job,
+                progress=VideosDownloadProgress.from_statuses(job_downloads.values()),
+            )
+
+        return [
+            self.__update_job(
+                job_id=job_id,
+                update_function=lambda job, statuses=statuses: __update_progress(
+                    job, statuses
+                ),
+            )
+            for job_id, statuses in jobs_statuses.items()
+        ]
+
+    def get_job(self, *, job_id: str) -> DownloadJob | None:
+        with self.__lock:
+            return self.__jobs.get(job_id) or self.__finished_jobs.get(job_id)
+
+    def get_jobs(
+        self, *, offset: int = 0, limit: int = 20
+    ) -> tuple[list[DownloadJob], int]:
+        """Getting a page of the jobs, the running ones first then the finished ones
+        (the latest first), along with the count of all the jobs
+        """
+        with self.__lock:
+            jobs_count = len(self.__jobs) + len(self.__finished_jobs)
+            jobs = list(
+                islice(
+                    chain(
+                        reversed(self.__jobs.values()),
+                        reversed(self.__finished_jobs.values()),
+                    ),
+                    offset,
+                    offset + limit,
+                )
+            )
+            return jobs, jobs_count
@@ -0,0 +1,76 @@
+import asyncio
+from typing import AsyncIterator
+
+from src.domain.entity.job.download_job import DownloadJob
+from src.services.job import DownloadJobsService
+
+
+class DownloadJobsWatchersService:
+    """Fanning out the updates of the download jobs (fed by the single events subscription
+    of a gateway worker) to all the clients watching them on the worker's event loop.
+
+    Every update crosses into the event loop once whatever the count of its watchers (and not at all
+    when nobody is watching its job), and a slow watcher only gets the latest state of its job
+    instead of a growing backlog of the states it missed
+    """
+
+    def __init__(self, *, download_jobs_service: DownloadJobsService) -> None:
+        self.__download_jobs_service = download_jobs_service
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        # Only mutated from the event loop, the other threads only check whether a job is watched
+        self.__watchers: dict[str, set[asyncio.Queue[DownloadJob]]] = {}
+        self.__download_jobs_service.add_on_job_updated_callback(self.__on_job_updated)
+
+    def __on_job_updated(self, job: DownloadJob) -> None:
+        if self.__loop is None or job.job_id not in self.__watchers:
+            return None
+        try:
+            self.__loop.call_soon_threadsafe(self.__dispatch, job)
+        except RuntimeError:
+            # The event loop has been closed along with the gateway
+            return None
+
+    def __dispatch(self, job: DownloadJob) -> None:
+        for watcher in self.__watchers.get(job.job_id, ()):
+            if watcher.full():
+                watcher.get_nowait()
+            watcher.put_nowait(job)
+
+    def get_watchers_count(self) -> int:
+        return sum(len(watchers) for watchers in self.__watchers.values())
+
+    async def watch_job(
+        self, *, job_id: str, keepalive_interval_in_s: float = 15
+    ) -> AsyncIterator[DownloadJob | None]:
+        """Watching a job, starting with its current state then each of its updates until it finishes
+        (nothing when it doesn't exist)
+
+        Args:
+            job_id (str): The id of the job to watch
+            keepalive_interval_in_s (float, optional): Yielding None when the job hasn't been updated
+                for this long, to keep the client's connection alive. Defaults to 15.
+        """
+        self.__loop = asyncio.get_running_loop()
+        watcher: asyncio.Queue[DownloadJob] = asyncio.Queue(maxsize=1)
+        self.__watchers.setdefault(job_id, set()).add(watcher)
+        try:
+            # Getting the current state after registering, so no update can be missed in between
+            job = self.__download_jobs_service.get_job(job_id=job_id)
+            if job is None:
+                return
+
+            yield job
+            while not job.is_finished():
+                try:
+                    job = await asyncio.wait_for(
+                        watcher.get(), timeout=keepalive_interval_in_s
+                    )
+                except TimeoutError:
+                    yield None
+                    continue
+                yield job
+        finally:
+            watchers = self.__watchers.get(job_id, set())
+            watchers.discard(watcher)
+            if not watchers:
+                self.__watchers.pop(job_id, None)
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable
+
+from src.domain.entity.video.batch_progress import VideosBatchProgress
+
+
+class VideosBatchProgressService:
+    """Aggregating the progress of the batches of videos fanned out from txt files, out of the events
+    of the workers downloading them, which can come in any order, from any process and more than once
+    (the done urls of every batch are counted once, whatever the count of their events)
+    """
+
+    def __init__(self, *, max_completed_batches: int = 1000) -> None:
+        self.__max_completed_batches = max_completed_batches
+        self.__lock = threading.Lock()
+        self.__batches: dict[str, VideosBatchProgress] = {}
+        # The downloaded and the failed urls of the active batches
+        self.__batches_done_urls: dict[str, tuple[set[str], set[str]]] = {}
+        # Remembering the latest completed batches, so their redelivered events don't open them again
+        self.__completed_batches: OrderedDict[str, VideosBatchProgress] = OrderedDict()
+
+    def __update_batch(
+        self,
+        *,
+        batch_id: str,
+        update_function: Callable[[VideosBatchProgress], VideosBatchProgress],
+    ) -> VideosBatchProgress:
+        with self.__lock:
+            completed_batch = self.__completed_batches.get(batch_id)
+            if completed_batch is not None:
+                return completed_batch
+
+            batch = update_function(
+                self.__batches.get(batch_id) or VideosBatchProgress(batch_id=batch_id)
+            )
+            if not batch.is_completed():
+                self.__batches[batch_id] = batch
+                return batch
+
+            self.__batches.pop(batch_id, None)
+            self.__batches_done_urls.pop(batch_id, None)
+            self.__completed_batches[batch_id] = batch
+            if len(self.__completed_batches) > self.__max_completed_batches:
+                self.__completed_batches.popitem(last=False)
+            return batch
+
+    def add_fanned_out_batch(
+        self, *, batch_id: str, urls_count: int
+    ) -> VideosBatchProgress:
+        return self.__update_batch(
+            batch_id=batch_id,
+            update_function=lambda batch: replace(batch, urls_count=urls_count),
+        )
+
+    def __add_done_url(
+        self, *, batch: VideosBatchProgress, url: str, is_downloaded: bool
+    ) -> VideosBatchProgress:
+        """Counting the done urls of a batch, a url that failed then got downloaded (like when
+        its command has been redelivered) only counts as downloaded (the lock must be held)
+        """
+        downloaded_urls, failed_urls = self.__batches_done_urls.setdefault(
+            batch.batch_id, (set(), set())
+        )
+        (downloaded_urls if is_downloaded else failed_urls).add(url)
+        return replace(
+            batch,
+            downloaded_count=len(downloaded_urls),
+            failed_count=len(failed_urls - downloaded_urls),
+        )
+
+    def add_downloaded_video(self, *, batch_id: str, url: str) -> VideosBatchProgress:
+        return self.__update_batch(
+            batch_id=batch_id,
+            update_function=lambda batch: self.__add_done_url(
+                batch=batch, url=url, is_downloaded=True
+            ),
+        )
+
+    def add_failed_video(self, *, batch_id: str, url: str) -> VideosBatchProgress:
+        return self.__update_batch(
+            batch_id=batch_id,
+            update_function=lambda batch: self.__add_done_url(
+                batch=batch, url=url, is_downloaded=False
+            ),
+        )
+
+    def get_batch_progress(self, *, batch_id: str) -> VideosBatchProgress | None:
+        with self.__lock:
+            return self.__batches.get(batch_id) or self.__completed_batches.get(
+                batch_id
+            )
+
+    def get_active_batches_progress(self) -> list[VideosBatchProgress]:
+        with self.__lock:
+            return list(self.__batches.values())
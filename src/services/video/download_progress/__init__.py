@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Callable
+
+from src.domain.entity.video.download_progress import (
+    VideoDownloadProgressSnapshot,
+    VideosDownloadProgress,
+)
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+
+
+class VideosDownloadProgressReporterService:
+    """Coalescing the progress of the videos being downloaded and reporting them from a single thread,
+    so the downloads only record their latest progress (whatever their count and their progress rate)
+    and the reporting (rendering/forwarding) happens at most once every `reporting_interval_in_s`,
+    with the latest snapshot of each download that progressed since the previous report.
+
+    It also combines the progress of the active downloads into the totals of the worker (all of them)
+    and of every batch they belong to
+    """
+
+    def __init__(
+        self,
+        *,
+        report_function: Callable[[list[VideoDownloadProgressSnapshot]], Any],
+        reporting_interval_in_s: float = 1,
+    ) -> None:
+        self.__report_function = report_function
+        self.__reporting_interval_in_s = reporting_interval_in_s
+        self.__lock = threading.Lock()
+        self.__snapshots: dict[str, VideoDownloadProgressSnapshot] = {}
+        self.__progressed_urls: set[str] = set()
+        self.__is_closed = threading.Event()
+        self.__reporter_thread = threading.Thread(
+            target=self.__run_reporter,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self.__reporter_thread.start()
+
+    def __report(self) -> None:
+        with self.__lock:
+            progressed_snapshots = [
+                self.__snapshots[url]
+                for url in self.__progressed_urls
+                if url in self.__snapshots
+            ]
+            self.__progressed_urls = set()
+
+        if not progressed_snapshots:
+            return None
+        try:
+            self.__report_function(progressed_snapshots)
+        except Exception as ex:
+            print(
+                f" [x] Error reporting the downloads progress for reason [{str(ex)}] ..."
+            )
+
+    def __run_reporter(self) -> None:
+        while not self.__is_closed.wait(timeout=self.__reporting_interval_in_s):
+            self.__report()
+        self.__report()
+
+    def add_progress(
+        self,
+        status: OnProgressDownloadingVideoStatus,
+        *,
+        batch_id: str | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        snapshot = VideoDownloadProgressSnapshot(
+            status=status, batch_id=batch_id, job_id=job_id
+        )
+        with self.__lock:
+            self.__snapshots[status.url] = snapshot
+            self.__progressed_urls.add(status.url)
+
+    def remove_progress(self, *, url: str) -> None:
+        with self.__lock:
+            self.__snapshots.pop(url, None)
+            self.__progressed_urls.discard(url)
+
+    def get_worker_progress(self) -> VideosDownloadProgress:
+        with self.__lock:
+            snapshots = list(self.__snapshots.values())
+        return VideosDownloadProgress.from_statuses(
+            snapshot.status for snapshot in snapshots
+        )
+
+    def get_batches_progress(self) -> dict[str, VideosDownloadProgress]:
+        with self.__lock:
+            snapshots = list(self.__snapshots.values())
+        batches_statuses: dict[str, list[OnProgressDownloadingVideoStatus]] = {}
+        for snapshot in snapshots:
+            if snapshot.batch_id is not None:
+                batches_statuses.setdefault(snapshot.batch_id, []).append(
+                    snapshot.status
+                )
+        return {
+            batch_id: VideosDownloadProgress.from_statuses(statuses)
+            for batch_id, statuses in batches_statuses.items()
+        }
+
+    def close(self) -> None:
+        self.__is_closed.set()
+        self.__reporter_thread.join()
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Callable
+from typing import Any, Callable, Generator
 from src.ports.inbound.video.youtube.fetcher import YouTubeVideoFetcherInterface
 from src.ports.inbound.video.youtube.downloader import YouTubeVideoDownloaderInterface
 from src.domain.entity.error.video import (
@@ -19,7 +19,6 @@ from src.domain.entity.video.download_status import (
     OnProgressDownloadingVideoStatus,
 )
 import time
-from concurrent.futures import ThreadPoolExecutor
 from src.ports.outbound.video.youtube.repository import YouTubeVideoRepositoryInterface
 
 
@@ -49,6 +48,22 @@ class YouTubeVideoService:
             channel_name=channel_name, videos_limit=videos_limit
         )
 
+    @staticmethod
+    def get_urls_from_txt_file(
+        *, urls_txt_file_path: str
+    ) -> Generator[str, None, None]:
+        """Reading the urls of a txt file lazily (line by line), skipping the blank lines,
+        the comments (starting with #) and the urls that have already been read
+        """
+        read_urls: set[str] = set()
+        with open(urls_txt_file_path, "r") as urls_txt_file:
+            for line in urls_txt_file:
+                url = line.strip()
+                if not url or url.startswith("#") or url in read_urls:
+                    continue
+                read_urls.add(url)
+                yield url
+
     def download_youtube_video_from_url_to_channel_name_dir(
         self,
         *,
@@ -133,6 +148,8 @@ class YouTubeVideoService:
                 cookies_file_path=cookies_file_path,
                 on_progress_callback=on_progress_callback,
                 on_complete_callback=on_complete_callback,
+                # The channel name has been got from the full info of the video, so it's not extracted again
+                video_info=getting_video_info_status,
             )
 
     def download_youtube_video_from_url(
@@ -147,6 +164,7 @@ class YouTubeVideoService:
         retry_timeout: int = 3,
         on_progress_callback: Callable[[OnProgressDownloadingVideoStatus], Any],
         on_complete_callback: Callable[[OnCompleteDownloadingVideoStatus], Any],
+        video_info: YouTubeVideoInfo | None = None,
     ) -> DownloadingYouTubeVideoError | DownloadedYouTubeVideo:
         if not os.path.exists(download_path):
             return DownloadingYouTubeVideoError(
@@ -164,6 +182,7 @@ class YouTubeVideoService:
             cookies_file_path=cookies_file_path,
             on_progress_callback=on_progress_callback,
             on_complete_callback=on_complete_callback,
+            video_info=video_info,
         )
         match download_status:
             case DownloadingYouTubeVideoError() as error:
@@ -185,131 +204,21 @@ class YouTubeVideoService:
                         on_complete_callback=on_complete_callback,
                         retry_attempts=retry_attempts - 1,
                         retry_timeout=retry_timeout,
+                        video_info=video_info,
                     )
             case DownloadedYouTubeVideo() as downloaded_video:
                 return downloaded_video
 
-    def download_youtube_videos_from_txt_file_to_channel_name_dir(
-        self,
-        *,
-        urls_txt_file_path: str,
-        resolution: int = 1080,
-        download_root_path: str,
-        initial_tags: list[str] = [],
-        cookies_file_path: str | None = None,
-        retry_attempts: int = 3,
-        retry_timeout: int = 3,
-        concurrency: int = 3,
-        on_progress_callback: Callable[[OnProgressDownloadingVideoStatus], Any],
-        on_complete_callback: Callable[[OnCompleteDownloadingVideoStatus], Any],
-    ) -> tuple[list[DownloadingYouTubeVideoError], list[DownloadedYouTubeVideo]]:
-        if not os.path.exists(urls_txt_file_path):
-            return [
-                DownloadingYouTubeVideoError(
-                    error=f"This urls txt file path [{urls_txt_file_path}] doesn't exist !",
-                    download_path=download_root_path,
-                    resolution=resolution,
-                    url=urls_txt_file_path,
-                )
-            ], []
-
-        with open(urls_txt_file_path, "r") as urls_txt_file:
-            urls = urls_txt_file.readlines()
-
-        def __process_wrapper(
-            url: str,
-        ) -> DownloadingYouTubeVideoError | DownloadedYouTubeVideo:
-            return self.download_youtube_video_from_url_to_channel_name_dir(
-                url=url.strip(),
-                resolution=resolution,
-                download_root_path=download_root_path,
-                initial_tags=initial_tags,
-                cookies_file_path=cookies_file_path,
-                retry_attempts=retry_attempts,
-                retry_timeout=retry_timeout,
-                on_progress_callback=on_progress_callback,
-                on_complete_callback=on_complete_callback,
-            )
-
-        with ThreadPoolExecutor(max_workers=concurrency) as execution_pool:
-            results = list(execution_pool.map(__process_wrapper, urls))
-
-            errors = [
-                result
-                for result in results
-                if isinstance(result, DownloadingYouTubeVideoError)
-            ]
-            successes = [
-                result
-                for result in results
-                if isinstance(result, DownloadedYouTubeVideo)
-            ]
-
-            return errors, successes
-
-    def download_youtube_videos_from_txt_file(
-        self,
-        *,
-        urls_txt_file_path: str,
-        resolution: int = 1080,
-        download_path: str,
-        initial_tags: list[str] = [],
-        cookies_file_path: str | None = None,
-        retry_attempts: int = 3,
-        retry_timeout: int = 3,
-        concurrency: int = 3,
-        on_progress_callback: Callable[[OnProgressDownloadingVideoStatus], Any],
-        on_complete_callback: Callable[[OnCompleteDownloadingVideoStatus], Any],
-    ) -> tuple[list[DownloadingYouTubeVideoError], list[DownloadedYouTubeVideo]]:
-        if not os.path.exists(urls_txt_file_path):
-            return [
-                DownloadingYouTubeVideoError(
-                    error=f"This urls txt file path [{urls_txt_file_path}] doesn't exist !",
-                    download_path=download_path,
-                    resolution=resolution,
-                    url=urls_txt_file_path,
-                )
-            ], []
-
-        with open(urls_txt_file_path, "r") as urls_txt_file:
-            urls = urls_txt_file.readlines()
-
-        def __process_wrapper(
-            url: str,
-        ) -> DownloadingYouTubeVideoError | DownloadedYouTubeVideo:
-            return self.download_youtube_video_from_url(
-                url=url.strip(),
-                resolution=resolution,
-                download_path=download_path,
-                initial_tags=initial_tags,
-                cookies_file_path=cookies_file_path,
-                retry_attempts=retry_attempts,
-                retry_timeout=retry_timeout,
-                on_progress_callback=on_progress_callback,
-                on_complete_callback=on_complete_callback,
-            )
-
-        with ThreadPoolExecutor(max_workers=concurrency) as execution_pool:
-            results = list(execution_pool.map(__process_wrapper, urls))
-
-            errors = [
-                result
-                for result in results
-                if isinstance(result, DownloadingYouTubeVideoError)
-            ]
-            successes = [
-                result
-                for result in results
-                if isinstance(result, DownloadedYouTubeVideo)
-            ]
-
-            return errors, successes
-
     def save_youtube_video(
         self, *, video: DownloadedYouTubeVideo
     ) -> SavingYouTubeVideoError | RepositoryYouTubeVideo:
         return self.__youtube_video_repository.save_video(video=video)
 
+    def save_youtube_videos(
+        self, *, videos: list[DownloadedYouTubeVideo]
+    ) -> list[SavingYouTubeVideoError | RepositoryYouTubeVideo]:
+        return self.__youtube_video_repository.save_videos(videos=videos)
+
     def get_youtube_video_by_uuid(
         self, *, uuid: str
     ) -> GettingYouTubeVideoError | RepositoryYouTubeVideo:
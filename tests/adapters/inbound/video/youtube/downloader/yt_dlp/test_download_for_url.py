@@ -1,19 +1,20 @@
 import datetime
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from tempfile import gettempdir
 
 from src.domain.entity.error.video import DownloadingYouTubeVideoError
-from src.domain.entity.video.youtube import DownloadedYouTubeVideo
+from src.domain.entity.video.youtube import DownloadedYouTubeVideo, YouTubeVideoInfo
 from src.adapters.inbound.video.youtube.downloader.yt_dlp import (
     YtDlpYouTubeVideoDownloader,
 )
+from src.adapters.inbound.video.youtube.yt_dlp_pool import YoutubeDLPool
 
 expected_time_timestamp = datetime.datetime.now().timestamp()
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     return_value=dict(
         url="testing_url",
         average_rating=0.0,
@@ -35,15 +36,15 @@ def test_download_test_youtube_short_video(_mock_socket: Mock) -> None:
     url: str = "testing_url"
     download_path: str = gettempdir()
     resolution: int = 1
-    download_result: (
-        DownloadingYouTubeVideoError | DownloadedYouTubeVideo
-    ) = YtDlpYouTubeVideoDownloader().download_from_url(
-        url=url,
-        download_path=download_path,
-        resolution=resolution,
-        on_complete_callback=lambda s: print(s),
-        on_progress_callback=lambda s: print(s),
-        cookies_file_path=os.path.join(gettempdir(), "anyfile"),
+    download_result: DownloadingYouTubeVideoError | DownloadedYouTubeVideo = (
+        YtDlpYouTubeVideoDownloader().download_from_url(
+            url=url,
+            download_path=download_path,
+            resolution=resolution,
+            on_complete_callback=lambda s: print(s),
+            on_progress_callback=lambda s: print(s),
+            cookies_file_path=os.path.join(gettempdir(), "anyfile"),
+        )
     )
 
     expected_video = DownloadedYouTubeVideo(
@@ -53,7 +54,7 @@ def test_download_test_youtube_short_video(_mock_socket: Mock) -> None:
         channel_name="testing_channel_name",
         channel_url="testing_channel_url",
         download_path=gettempdir(),
-        downloaded_file=f"{os.path.join(gettempdir(), "testing_title")}.mkv",
+        downloaded_file=f"{os.path.join(gettempdir(), 'testing_title')}.mkv",
         duration="1:0",
         height=1,
         published_date_str=datetime.datetime.fromtimestamp(
@@ -71,21 +72,21 @@ def test_download_test_youtube_short_video(_mock_socket: Mock) -> None:
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     side_effect=Exception("Failed to extract any player response"),
 )
 def test_no_internet_connection(_mock_socket: Mock) -> None:
     url: str = "https://www.youtube.com/watch?v=C0DPdy98e4c"
     download_path: str = gettempdir()
     resolution: int = 144
-    download_result: (
-        DownloadingYouTubeVideoError | DownloadedYouTubeVideo
-    ) = YtDlpYouTubeVideoDownloader().download_from_url(
-        url=url,
-        download_path=download_path,
-        resolution=resolution,
-        on_complete_callback=lambda s: print(s),
-        on_progress_callback=lambda s: print(s),
+    download_result: DownloadingYouTubeVideoError | DownloadedYouTubeVideo = (
+        YtDlpYouTubeVideoDownloader().download_from_url(
+            url=url,
+            download_path=download_path,
+            resolution=resolution,
+            on_complete_callback=lambda s: print(s),
+            on_progress_callback=lambda s: print(s),
+        )
     )
 
     expected: DownloadingYouTubeVideoError = DownloadingYouTubeVideoError(
@@ -100,21 +101,21 @@ def test_no_internet_connection(_mock_socket: Mock) -> None:
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     side_effect=Exception("is not a valid URL"),
 )
 def test_invalid_url_video(_mock_socket: Mock) -> None:
     url: str = "https://www.youtube.com/invalid_video_url"
     download_path: str = gettempdir()
     resolution: int = 144
-    download_result: (
-        DownloadingYouTubeVideoError | DownloadedYouTubeVideo
-    ) = YtDlpYouTubeVideoDownloader().download_from_url(
-        url=url,
-        download_path=download_path,
-        resolution=resolution,
-        on_complete_callback=lambda s: print(s),
-        on_progress_callback=lambda s: print(s),
+    download_result: DownloadingYouTubeVideoError | DownloadedYouTubeVideo = (
+        YtDlpYouTubeVideoDownloader().download_from_url(
+            url=url,
+            download_path=download_path,
+            resolution=resolution,
+            on_complete_callback=lambda s: print(s),
+            on_progress_callback=lambda s: print(s),
+        )
     )
 
     expected: DownloadingYouTubeVideoError = DownloadingYouTubeVideoError(
@@ -132,14 +133,14 @@ def test_invalid_download_path() -> None:
     url: str = "testing_url"
     download_path: str = "/invalid"
     resolution: int = 144
-    download_result: (
-        DownloadingYouTubeVideoError | DownloadedYouTubeVideo
-    ) = YtDlpYouTubeVideoDownloader().download_from_url(
-        url=url,
-        download_path=download_path,
-        resolution=resolution,
-        on_complete_callback=lambda s: print(s),
-        on_progress_callback=lambda s: print(s),
+    download_result: DownloadingYouTubeVideoError | DownloadedYouTubeVideo = (
+        YtDlpYouTubeVideoDownloader().download_from_url(
+            url=url,
+            download_path=download_path,
+            resolution=resolution,
+            on_complete_callback=lambda s: print(s),
+            on_progress_callback=lambda s: print(s),
+        )
     )
 
     expected: DownloadingYouTubeVideoError = DownloadingYouTubeVideoError(
@@ -151,3 +152,72 @@ def test_invalid_download_path() -> None:
 
     assert isinstance(download_result, DownloadingYouTubeVideoError)
     assert download_result == expected
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info")
+@patch(
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.process_ie_result",
+    return_value=dict(channel="testing_channel_name", fulltitle="testing_title"),
+)
+def test_download_video_without_extracting_its_info_again(
+    process_ie_result_mock: Mock, extract_info_mock: Mock
+) -> None:
+    raw_info = dict(id="testing_id", fulltitle="testing_title")
+    download_result = YtDlpYouTubeVideoDownloader().download_from_url(
+        url="testing_url",
+        download_path=gettempdir(),
+        resolution=1,
+        on_complete_callback=lambda s: print(s),
+        on_progress_callback=lambda s: print(s),
+        video_info=YouTubeVideoInfo(
+            url="testing_url",
+            title="testing_title",
+            duration="",
+            published_date_str="",
+            average_rating=0.0,
+            thumbnail=None,
+            tags=[],
+            channel_id="",
+            channel_name="testing_channel_name",
+            channel_url="",
+            raw_info=raw_info,
+        ),
+    )
+
+    assert isinstance(download_result, DownloadedYouTubeVideo)
+    assert download_result.channel_name == "testing_channel_name"
+    extract_info_mock.assert_not_called()
+    process_ie_result_mock.assert_called_once_with(ie_result=raw_info, download=True)
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_never_reuse_youtube_dl_instance_of_failed_download(
+    youtube_dl_mock: Mock,
+) -> None:
+    failing_youtube_dl = MagicMock()
+    failing_youtube_dl.extract_info.side_effect = Exception("Unable to download")
+    youtube_dl_mock.side_effect = [failing_youtube_dl, Mock()]
+    youtube_dl_pool = YoutubeDLPool()
+    video_downloader = YtDlpYouTubeVideoDownloader(youtube_dl_pool=youtube_dl_pool)
+
+    download_result = video_downloader.download_from_url(
+        url="testing_url",
+        download_path=gettempdir(),
+        resolution=1,
+        on_complete_callback=lambda s: print(s),
+        on_progress_callback=lambda s: print(s),
+    )
+    assert isinstance(download_result, DownloadingYouTubeVideoError)
+    failing_youtube_dl.close.assert_called_once()
+    failing_youtube_dl.params.__setitem__.assert_called_once_with("cookiefile", None)
+    failing_youtube_dl.save_cookies.assert_not_called()
+
+    # The next download gets a new instance instead of the one that failed
+    video_downloader.download_from_url(
+        url="testing_url",
+        download_path=gettempdir(),
+        resolution=1,
+        on_complete_callback=lambda s: print(s),
+        on_progress_callback=lambda s: print(s),
+    )
+    assert youtube_dl_mock.call_count == 2
@@ -9,7 +9,7 @@ expected_time_timestamp = datetime.datetime.now().timestamp()
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     return_value=dict(
         id="testing_url",
         average_rating=0.0,
@@ -51,7 +51,7 @@ def test_fetching_youtube_video_info_for_url(_mock_socket: Mock) -> None:
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     side_effect=Exception("Error fetching video info !"),
 )
 def test_fetching_youtube_video_info_error(_mock_socket: Mock) -> None:
@@ -11,7 +11,7 @@ expected_time_timestamp = datetime.datetime.now().timestamp()
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     return_value=dict(
         entries=[
             dict(
@@ -61,7 +61,7 @@ def test_fetching_latest_youtube_video_for_channel_by_name(_mock_socket: Mock) -
 
 
 @patch(
-    "src.adapters.inbound.video.youtube.downloader.yt_dlp.YoutubeDL.extract_info",
+    "src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL.extract_info",
     side_effect=Exception("Error fetching latest videos"),
 )
 def test_fetching_latest_youtube_video_for_channel_by_name_error(
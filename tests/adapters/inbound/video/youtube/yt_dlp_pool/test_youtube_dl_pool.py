@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+from src.adapters.inbound.video.youtube.yt_dlp_pool import YoutubeDLPool
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_reuse_instance_for_the_same_options(youtube_dl_mock: Mock) -> None:
+    youtube_dl_mock.side_effect = lambda *_: Mock()
+    youtube_dl_pool = YoutubeDLPool()
+
+    with youtube_dl_pool.acquire(options=dict(quiet=True)) as first_youtube_dl:
+        pass
+    with youtube_dl_pool.acquire(options=dict(quiet=True)) as second_youtube_dl:
+        pass
+    with youtube_dl_pool.acquire(options=dict(quiet=False)) as third_youtube_dl:
+        pass
+
+    assert first_youtube_dl is second_youtube_dl
+    assert first_youtube_dl is not third_youtube_dl
+    assert youtube_dl_mock.call_count == 2
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_never_share_instance_between_concurrent_callers(
+    youtube_dl_mock: Mock,
+) -> None:
+    youtube_dl_mock.side_effect = lambda *_: Mock()
+    youtube_dl_pool = YoutubeDLPool()
+
+    with youtube_dl_pool.acquire(options=dict(quiet=True)) as first_youtube_dl:
+        with youtube_dl_pool.acquire(options=dict(quiet=True)) as second_youtube_dl:
+            pass
+
+    assert first_youtube_dl is not second_youtube_dl
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_call_only_the_hooks_of_the_current_caller(youtube_dl_mock: Mock) -> None:
+    youtube_dl_pool = YoutubeDLPool()
+    first_statuses: list[dict[str, Any]] = []
+    second_statuses: list[dict[str, Any]] = []
+
+    def run_progress_hooks() -> None:
+        options = youtube_dl_mock.call_args.args[0]
+        for progress_hook in options["progress_hooks"]:
+            progress_hook(dict(status="downloading"))
+
+    with youtube_dl_pool.acquire(
+        options=dict(quiet=True), progress_hooks=[first_statuses.append]
+    ):
+        run_progress_hooks()
+    with youtube_dl_pool.acquire(
+        options=dict(quiet=True), progress_hooks=[second_statuses.append]
+    ):
+        run_progress_hooks()
+    run_progress_hooks()
+
+    assert first_statuses == [dict(status="downloading")]
+    assert second_statuses == [dict(status="downloading")]
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_close_least_recently_used_idle_instances(youtube_dl_mock: Mock) -> None:
+    youtube_dl_mock.side_effect = lambda *_: Mock()
+    youtube_dl_pool = YoutubeDLPool(max_idle_instances=1)
+
+    with youtube_dl_pool.acquire(options=dict(quiet=True)) as first_youtube_dl:
+        pass
+    with youtube_dl_pool.acquire(options=dict(quiet=False)) as second_youtube_dl:
+        pass
+    youtube_dl_pool.close()
+
+    first_youtube_dl.close.assert_called_once()
+    second_youtube_dl.close.assert_called_once()
+
+
+@patch("src.adapters.inbound.video.youtube.yt_dlp_pool.YoutubeDL")
+def test_never_overwrite_refreshed_cookies_file(
+    youtube_dl_mock: Mock, tmp_path: Path
+) -> None:
+    youtube_dl_mock.side_effect = lambda *_: MagicMock()
+    youtube_dl_pool = YoutubeDLPool()
+    cookie_file = tmp_path / "cookies.txt"
+    cookie_file.write_text("stale cookies")
+    options = dict(quiet=True, cookiefile=str(cookie_file))
+
+    def refresh_cookie_file() -> None:
+        cookie_file.write_text("refreshed cookies")
+        # Not relying on the resolution of the file system's clock
+        os.utime(cookie_file, ns=(0, cookie_file.stat().st_mtime_ns + 1_000_000_000))
+
+    with youtube_dl_pool.acquire(options=options) as first_youtube_dl:
+        pass
+    first_youtube_dl.save_cookies.assert_called_once()
+
+    # The cookies file refreshed while an instance is idle gets a new instance loading it
+    refresh_cookie_file()
+    with youtube_dl_pool.acquire(options=options) as second_youtube_dl:
+        # Refreshed while the instance is being used, the instance doesn't save its cookies
+        refresh_cookie_file()
+    assert second_youtube_dl is not first_youtube_dl
+    first_youtube_dl.params.__setitem__.assert_called_once_with("cookiefile", None)
+    first_youtube_dl.close.assert_called_once()
+    second_youtube_dl.save_cookies.assert_not_called()
+    assert cookie_file.read_text() == "refreshed cookies"
@@ -56,6 +56,30 @@ def test_save_same_command_twice(setup_db: PonySqliteCommandRepository) -> None:
     assert save_command_status.command == command
 
 
+def test_save_many_commands_at_once(setup_db: PonySqliteCommandRepository) -> None:
+    db = setup_db
+    already_saved_command = GenericCommand(created_at_iso_format="2025-01-01T00:00:00")
+    new_command = GenericCommand(created_at_iso_format="2025-01-02T00:00:00")
+    assert db.save_command(command=already_saved_command) is None
+
+    save_commands_statuses = db.save_commands(
+        commands=[new_command, already_saved_command, new_command]
+    )
+
+    assert len(save_commands_statuses) == 3
+    assert save_commands_statuses[0] is None
+    for save_command_status, command in zip(
+        save_commands_statuses[1:], [already_saved_command, new_command]
+    ):
+        assert isinstance(save_command_status, SavingCommandError)
+        assert save_command_status.is_duplicate
+        assert save_command_status.command == command
+    assert sorted(
+        db.get_commands_by_topic(topic=GenericCommand.get_topic()),
+        key=lambda command: command.created_at_iso_format,
+    ) == [already_saved_command, new_command]
+
+
 def test_get_commands_for_topic(setup_db: PonySqliteCommandRepository) -> None:
     db = setup_db
     time = datetime.datetime.now().isoformat()
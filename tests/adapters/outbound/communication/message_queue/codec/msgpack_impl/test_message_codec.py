@@ -0,0 +1,109 @@
+import datetime
+
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
+from src.domain.entity.error.message_queue import DecodingMessageError
+from src.domain.entity.events.video.youtube.downloaded_youtube_video_event import (
+    DownloadedYouTubeVideo,
+    DownloadedYouTubeVideoEvent,
+)
+from src.domain.entity.events.video.youtube.download_progress_event import (
+    DownloadProgressEvent,
+)
+from src.domain.entity.message_queue.message_registry import (
+    MessageRegistry,
+    get_default_message_registry,
+)
+from src.domain.entity.video.download_progress import VideoDownloadProgressSnapshot
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+
+
+def get_dummy_downloaded_video_event() -> DownloadedYouTubeVideoEvent:
+    return DownloadedYouTubeVideoEvent(
+        created_at_iso_format=datetime.datetime.now().isoformat(),
+        downloaded_video=DownloadedYouTubeVideo(
+            url="https://www.youtube.com/watch?v=dummy",
+            resolution=720,
+            download_path="/tmp",
+            downloaded_file="/tmp/dummy.mp4",
+            title="dummy",
+            height=720,
+            width=1280,
+            duration="00:01",
+            published_date_str="20250101",
+            average_rating=0.0,
+            thumbnail=None,
+            tags=["dummy"],
+            channel_id="dummy",
+            channel_name="dummy",
+            channel_url="https://www.youtube.com/@dummy",
+        ),
+    )
+
+
+def test_encode_and_decode_domain_message_successfully() -> None:
+    codec = MsgPackMessageCodec()
+    registry = get_default_message_registry()
+    event = get_dummy_downloaded_video_event()
+
+    encoded_event = codec.encode(data=registry.to_primitive(message=event))
+    assert isinstance(encoded_event, bytes)
+
+    decoded_data = codec.decode(data=encoded_event)
+    assert isinstance(decoded_data, dict)
+    assert (
+        registry.from_primitive(
+            message_class=DownloadedYouTubeVideoEvent, data=decoded_data
+        )
+        == event
+    )
+
+
+def test_registry_headers_carry_the_schema_version() -> None:
+    registry = MessageRegistry()
+    registry.register(message_class=DownloadedYouTubeVideoEvent, schema_version=2)
+
+    assert registry.get_headers(topic=DownloadedYouTubeVideoEvent.get_topic()) == {
+        MessageRegistry.MESSAGE_TYPE_HEADER: DownloadedYouTubeVideoEvent.get_topic(),
+        MessageRegistry.SCHEMA_VERSION_HEADER: 2,
+    }
+
+
+def test_decode_invalid_data() -> None:
+    decoding_status = MsgPackMessageCodec().decode(data=b"\xc1")
+
+    assert isinstance(decoding_status, DecodingMessageError)
+
+
+def test_encode_and_decode_download_progress_event_successfully() -> None:
+    codec = MsgPackMessageCodec()
+    registry = get_default_message_registry()
+    event = DownloadProgressEvent(
+        created_at_iso_format=datetime.datetime.now().isoformat(),
+        worker_id="dummy-worker",
+        snapshots=[
+            VideoDownloadProgressSnapshot(
+                status=OnProgressDownloadingVideoStatus(
+                    url="https://www.youtube.com/watch?v=dummy",
+                    title="dummy",
+                    height=720,
+                    width=1280,
+                    downloaded_bytes=512,
+                    total_bytes=1024,
+                    speed_in_bytes_per_s=256.0,
+                    eta_in_s=2.0,
+                ),
+                batch_id="dummy-batch",
+            )
+        ],
+    )
+
+    decoded_data = codec.decode(
+        data=codec.encode(data=registry.to_primitive(message=event))
+    )
+    assert isinstance(decoded_data, dict)
+    assert (
+        registry.from_primitive(message_class=DownloadProgressEvent, data=decoded_data)
+        == event
+    )
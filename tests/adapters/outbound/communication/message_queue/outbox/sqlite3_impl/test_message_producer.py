@@ -0,0 +1,116 @@
+import threading
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_consumer import (
+    AsyncioInMemoryMessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_producer import (
+    AsyncioInMemoryMessageProducer,
+)
+from src.adapters.outbound.communication.message_queue.outbox.sqlite3_impl.message_producer import (
+    Sqlite3OutboxMessageProducer,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
+
+
+@pytest.fixture
+def message_broker() -> Generator[AsyncioInMemoryMessageBroker, Any, None]:
+    message_broker = AsyncioInMemoryMessageBroker()
+    yield message_broker
+    message_broker.close()
+
+
+def consume_one_message_in_background(
+    *, message_broker: AsyncioInMemoryMessageBroker, topic: str
+) -> tuple[threading.Thread, list[QueueMessage]]:
+    consumed_messages: list[QueueMessage] = []
+    consumption_thread = threading.Thread(
+        target=AsyncioInMemoryMessageConsumer(
+            message_broker=message_broker
+        ).consume_messages,
+        kwargs=dict(
+            exchange_name=topic,
+            queue_topic=topic,
+            consume_forever=False,
+            deserialization_function=lambda queue_message: queue_message,
+            callback_function=consumed_messages.append,
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    return consumption_thread, consumed_messages
+
+
+def test_relay_produced_message_to_the_broker(
+    tmp_path: Path, message_broker: AsyncioInMemoryMessageBroker
+) -> None:
+    topic: str = "test-topic"
+    consumption_thread, consumed_messages = consume_one_message_in_background(
+        message_broker=message_broker, topic=topic
+    )
+    threading.Event().wait(0.5)
+
+    outbox_message_producer = Sqlite3OutboxMessageProducer(
+        message_producer=AsyncioInMemoryMessageProducer(message_broker=message_broker),
+        database_path=str(tmp_path / "outbox.db"),
+    )
+    producing_status = outbox_message_producer.produce_message(
+        topic=topic,
+        data=b"data !",
+        content_type="application/msgpack",
+        headers={"x-schema-version": 1},
+    )
+    consumption_thread.join(timeout=5)
+    outbox_message_producer.close()
+
+    assert producing_status is None
+    assert consumed_messages == [
+        QueueMessage(
+            body=b"data !",
+            content_type="application/msgpack",
+            headers={"x-schema-version": 1},
+        )
+    ]
+
+
+def test_keep_message_in_the_outbox_while_the_broker_is_unavailable(
+    tmp_path: Path, message_broker: AsyncioInMemoryMessageBroker
+) -> None:
+    topic: str = "test-topic"
+    database_path = str(tmp_path / "outbox.db")
+    consumption_thread, consumed_messages = consume_one_message_in_background(
+        message_broker=message_broker, topic=topic
+    )
+    threading.Event().wait(0.5)
+
+    # A closed producer fails every message, like a broker that is down
+    unavailable_message_producer = AsyncioInMemoryMessageProducer(
+        message_broker=message_broker
+    )
+    unavailable_message_producer.close()
+    outbox_message_producer = Sqlite3OutboxMessageProducer(
+        message_producer=unavailable_message_producer, database_path=database_path
+    )
+    producing_status = outbox_message_producer.produce_message(
+        topic=topic, data=b"data !"
+    )
+    outbox_message_producer.close()
+
+    assert producing_status is None
+    assert consumed_messages == []
+
+    # The message gets relayed once the broker is back (after its retry backoff)
+    restarted_outbox_message_producer = Sqlite3OutboxMessageProducer(
+        message_producer=AsyncioInMemoryMessageProducer(message_broker=message_broker),
+        database_path=database_path,
+    )
+    consumption_thread.join(timeout=5)
+    restarted_outbox_message_producer.close()
+
+    assert consumed_messages == [QueueMessage(body=b"data !")]
@@ -53,6 +53,30 @@ def test_save_same_event_twice(setup_db: PonySqliteEventRepository) -> None:
     assert save_event_status.event == event
 
 
+def test_save_many_events_at_once(setup_db: PonySqliteEventRepository) -> None:
+    db = setup_db
+    already_saved_event = GenericEvent(created_at_iso_format="2025-01-01T00:00:00")
+    new_event = GenericEvent(created_at_iso_format="2025-01-02T00:00:00")
+    assert db.save_event(event=already_saved_event) is None
+
+    save_events_statuses = db.save_events(
+        events=[new_event, already_saved_event, new_event]
+    )
+
+    assert len(save_events_statuses) == 3
+    assert save_events_statuses[0] is None
+    for save_event_status, event in zip(
+        save_events_statuses[1:], [already_saved_event, new_event]
+    ):
+        assert isinstance(save_event_status, SavingEventError)
+        assert save_event_status.is_duplicate
+        assert save_event_status.event == event
+    assert sorted(
+        db.get_events_by_topic(topic=GenericEvent.get_topic()),
+        key=lambda event: event.created_at_iso_format,
+    ) == [already_saved_event, new_event]
+
+
 def test_get_events_for_topic(setup_db: PonySqliteEventRepository) -> None:
     db = setup_db
     time = datetime.datetime.now().isoformat()
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any, Generator
 from src.domain.entity.video.youtube import RepositoryYouTubeVideo
 from src.domain.entity.error.video import (
@@ -72,6 +73,34 @@ def test_save_same_youtube_video_twice(
     assert save_video_status.video == video
 
 
+def test_save_many_youtube_videos_at_once(
+    setup_db: SqlitePonyYouTubeVideoRepository,
+) -> None:
+    db = setup_db
+    already_saved_video = get_dummy_video()
+    new_video = replace(already_saved_video, url="another-testing")
+    assert isinstance(db.save_video(video=already_saved_video), RepositoryYouTubeVideo)
+
+    save_videos_statuses = db.save_videos(
+        videos=[new_video, already_saved_video, new_video]
+    )
+
+    assert len(save_videos_statuses) == 3
+    assert isinstance(save_videos_statuses[0], RepositoryYouTubeVideo)
+    assert save_videos_statuses[0].video == new_video
+    assert save_videos_statuses[0].uuid is not None
+    for save_video_status, video in zip(
+        save_videos_statuses[1:], [already_saved_video, new_video]
+    ):
+        assert isinstance(save_video_status, SavingYouTubeVideoError)
+        assert save_video_status.is_duplicate
+        assert save_video_status.video == video
+
+    get_video_status = db.get_video_by_url(url=new_video.url)
+    assert isinstance(get_video_status, RepositoryYouTubeVideo)
+    assert get_video_status.uuid == save_videos_statuses[0].uuid
+
+
 def test_get_video_by_uuid(setup_db: SqlitePonyYouTubeVideoRepository) -> None:
     repository = setup_db
     video = get_dummy_video()
@@ -0,0 +1,42 @@
+from src.domain.entity.error.video import DownloadingYouTubeVideoError
+from src.domain.entity.video.download_progress import VideoDownloadProgressSnapshot
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+from src.external_systems.commands_handler.video.download.utils import (
+    on_failure,
+    on_progress,
+)
+from src.services.video.download_progress import VideosDownloadProgressReporterService
+
+
+def test_remove_progress_of_failed_download() -> None:
+    reports: list[list[VideoDownloadProgressSnapshot]] = []
+    downloads_progress_reporter = VideosDownloadProgressReporterService(
+        report_function=reports.append, reporting_interval_in_s=60
+    )
+
+    on_progress(
+        OnProgressDownloadingVideoStatus(
+            url="url",
+            title="testing_title",
+            height=1,
+            width=1,
+            downloaded_bytes=50,
+            total_bytes=100,
+            speed_in_bytes_per_s=10,
+        ),
+        downloads_progress_reporter=downloads_progress_reporter,
+        batch_id="batch",
+    )
+    assert downloads_progress_reporter.get_worker_progress().downloads_count == 1
+
+    on_failure(
+        DownloadingYouTubeVideoError(
+            error="error", url="url", resolution=1080, download_path="/tmp"
+        ),
+        downloads_progress_reporter=downloads_progress_reporter,
+    )
+    downloads_progress_reporter.close()
+
+    assert downloads_progress_reporter.get_worker_progress().downloads_count == 0
+    assert downloads_progress_reporter.get_batches_progress() == {}
+    assert reports == []
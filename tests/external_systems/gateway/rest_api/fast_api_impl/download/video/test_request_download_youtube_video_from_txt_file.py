@@ -14,7 +14,13 @@ from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.messag
     PikaRabbitMqMessageProducer,
 )
 from src.external_systems.gateway.rest_api.fast_api_impl import FastApiGateWay
+from src.external_systems.gateway.rest_api.fast_api_impl.models.jobs.download import (
+    DownloadJobResponse,
+)
 from fastapi.testclient import TestClient
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
 from src.services.communication.message_queue import MessageQueueCommunicationService
 import pytest
 import nest_asyncio
@@ -39,6 +45,7 @@ def fastapi_testing_client() -> Generator[TestClient, Any, None]:
                 rabbitmq_username="guest",
                 rabbitmq_password="guest",
             ),
+            message_codec=MsgPackMessageCodec(),
         )
 
         app = FastApiGateWay(message_queue_service=message_queue_service).get_app()
@@ -46,9 +53,9 @@ def fastapi_testing_client() -> Generator[TestClient, Any, None]:
 
 
 @pytest.fixture()
-def fastapi_testing_client_with_wrong_rabbitmq_connection() -> (
-    Generator[TestClient, Any, None]
-):
+def fastapi_testing_client_with_wrong_rabbitmq_connection() -> Generator[
+    TestClient, Any, None
+]:
     with RabbitMQContainer() as container:
         message_queue_service = MessageQueueCommunicationService(
             message_producer=PikaRabbitMqMessageProducer(
@@ -63,6 +70,7 @@ def fastapi_testing_client_with_wrong_rabbitmq_connection() -> (
                 rabbitmq_username="-",
                 rabbitmq_password="-",
             ),
+            message_codec=MsgPackMessageCodec(),
         )
 
         app = FastApiGateWay(message_queue_service=message_queue_service).get_app()
@@ -89,6 +97,15 @@ def test_valid_request_to_download_youtube_video_from_txt_file(
     assert (
         response_decoding.message == "Successfully requested to download this video ..."
     )
+    assert response_decoding.job_id is not None
+    job_response = fastapi_testing_client.get(
+        f"/api/v1/jobs/{response_decoding.job_id}"
+    )
+    assert job_response.status_code == status.HTTP_200_OK
+    assert (
+        DownloadJobResponse.Success(**job_response.json()).job.job_id
+        == response_decoding.job_id
+    )
     assert (
         f"[x] Published message to topic [{DownloadYouTubeVideoFromTxtFileCommand.get_topic()}] ..."
         in captured.out
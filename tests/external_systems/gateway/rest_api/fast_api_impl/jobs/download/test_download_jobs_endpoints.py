@@ -0,0 +1,204 @@
+import json
+import threading
+from typing import Any, Generator
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_consumer import (
+    AsyncioInMemoryMessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_producer import (
+    AsyncioInMemoryMessageProducer,
+)
+from src.external_systems.gateway.rest_api.fast_api_impl import FastApiGateWay
+from src.external_systems.gateway.rest_api.fast_api_impl.models.jobs.download import (
+    DownloadJobModel,
+    DownloadJobResponse,
+    DownloadJobsResponse,
+)
+from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.services.job import DownloadJobsService
+
+
+@pytest.fixture()
+def download_jobs_service() -> DownloadJobsService:
+    return DownloadJobsService()
+
+
+@pytest.fixture()
+def fastapi_testing_client(
+    download_jobs_service: DownloadJobsService,
+) -> Generator[TestClient, Any, None]:
+    message_broker = AsyncioInMemoryMessageBroker()
+    message_queue_service = MessageQueueCommunicationService(
+        message_producer=AsyncioInMemoryMessageProducer(message_broker=message_broker),
+        message_consumer=AsyncioInMemoryMessageConsumer(message_broker=message_broker),
+        message_codec=MsgPackMessageCodec(),
+    )
+    app = FastApiGateWay(
+        message_queue_service=message_queue_service,
+        download_jobs_service=download_jobs_service,
+    ).get_app()
+    yield TestClient(app)
+    message_queue_service.close()
+    message_broker.close()
+
+
+def add_requested_job(download_jobs_service: DownloadJobsService, job_id: str) -> None:
+    download_jobs_service.add_requested_job(
+        job_id=job_id,
+        topic="download_youtube_video_from_url",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=False,
+    )
+
+
+def test_get_unknown_download_job(fastapi_testing_client: TestClient) -> None:
+    response = fastapi_testing_client.get("/api/v1/jobs/unknown")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert (
+        DownloadJobResponse.Error(**response.json()).message
+        == "Job [unknown] doesn't exist ..."
+    )
+
+
+def test_get_download_job(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    add_requested_job(download_jobs_service, job_id="job")
+
+    response = fastapi_testing_client.get("/api/v1/jobs/job")
+
+    assert response.status_code == status.HTTP_200_OK
+    download_job = DownloadJobResponse.Success(**response.json()).job
+    assert download_job.job_id == "job"
+    assert download_job.status == "queued"
+
+
+def test_get_download_jobs_page(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    for job_id in ("first_job", "second_job", "third_job"):
+        add_requested_job(download_jobs_service, job_id=job_id)
+
+    response = fastapi_testing_client.get(
+        "/api/v1/jobs", params=dict(offset=1, limit=1)
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    download_jobs_page = DownloadJobsResponse.Success(**response.json())
+    assert len(download_jobs_page.jobs) == 1
+    assert download_jobs_page.total_count == 3
+    assert download_jobs_page.offset == 1
+    assert download_jobs_page.limit == 1
+
+
+@pytest.mark.parametrize(
+    "params",
+    [dict(offset=-1), dict(limit=0), dict(limit=101)],
+)
+def test_reject_out_of_bounds_download_jobs_page(
+    fastapi_testing_client: TestClient, params: dict[str, int]
+) -> None:
+    response = fastapi_testing_client.get("/api/v1/jobs", params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_stream_unknown_download_job(fastapi_testing_client: TestClient) -> None:
+    response = fastapi_testing_client.get("/api/v1/jobs/unknown/stream")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_stream_download_job_until_it_finishes(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    add_requested_job(download_jobs_service, job_id="job")
+    # Finishing the job while it's being streamed, as the testing client reads the whole stream at once
+    finishing_timer = threading.Timer(
+        interval=0.5,
+        function=lambda: download_jobs_service.add_downloaded_video(
+            job_id="job", url="url", is_batch=False
+        ),
+    )
+    finishing_timer.start()
+
+    response = fastapi_testing_client.get("/api/v1/jobs/job/stream")
+    finishing_timer.join()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [event for event in response.text.split("\n\n") if event]
+    assert [
+        DownloadJobModel(**json.loads(event.removeprefix("event: job\ndata: "))).status
+        for event in events
+    ] == ["queued", "completed"]
+
+
+def test_stream_finished_download_job(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    add_requested_job(download_jobs_service, job_id="job")
+    download_jobs_service.add_downloaded_video(job_id="job", url="url", is_batch=False)
+
+    response = fastapi_testing_client.get("/api/v1/jobs/job/stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text.startswith("event: job\ndata: ")
+    assert response.text.count("event: job") == 1
+
+
+def test_watch_unknown_download_job(fastapi_testing_client: TestClient) -> None:
+    with fastapi_testing_client.websocket_connect(
+        "/api/v1/jobs/unknown/ws"
+    ) as websocket:
+        assert (
+            DownloadJobResponse.Error(**websocket.receive_json()).message
+            == "Job [unknown] doesn't exist ..."
+        )
+        with pytest.raises(WebSocketDisconnect) as disconnection:
+            websocket.receive_json()
+
+    assert disconnection.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_watch_download_job_until_it_finishes(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    add_requested_job(download_jobs_service, job_id="job")
+
+    with fastapi_testing_client.websocket_connect("/api/v1/jobs/job/ws") as websocket:
+        assert DownloadJobModel(**websocket.receive_json()).status == "queued"
+
+        download_jobs_service.add_failed_video(
+            job_id="job", url="url", error="error", is_batch=False
+        )
+        assert DownloadJobModel(**websocket.receive_json()).status == "failed"
+        # The connection is closed once the job has finished
+        with pytest.raises(WebSocketDisconnect) as disconnection:
+            websocket.receive_json()
+
+    assert disconnection.value.code == status.WS_1000_NORMAL_CLOSURE
+
+
+def test_watch_finished_download_job(
+    fastapi_testing_client: TestClient, download_jobs_service: DownloadJobsService
+) -> None:
+    add_requested_job(download_jobs_service, job_id="job")
+    download_jobs_service.add_downloaded_video(job_id="job", url="url", is_batch=False)
+
+    with fastapi_testing_client.websocket_connect("/api/v1/jobs/job/ws") as websocket:
+        assert DownloadJobModel(**websocket.receive_json()).status == "completed"
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
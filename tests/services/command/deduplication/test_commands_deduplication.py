@@ -0,0 +1,30 @@
+from src.services.command.deduplication import CommandsDeduplicationService
+
+
+def test_skip_commands_being_processed_or_processed() -> None:
+    commands_deduplication_service = CommandsDeduplicationService()
+
+    assert commands_deduplication_service.start_processing(key="key")
+    assert not commands_deduplication_service.start_processing(key="key")
+
+    commands_deduplication_service.finish_processing(key="key", is_processed=True)
+    assert not commands_deduplication_service.start_processing(key="key")
+    assert commands_deduplication_service.start_processing(key="other_key")
+
+
+def test_process_again_commands_not_processed() -> None:
+    commands_deduplication_service = CommandsDeduplicationService()
+
+    assert commands_deduplication_service.start_processing(key="key")
+    commands_deduplication_service.finish_processing(key="key", is_processed=False)
+    assert commands_deduplication_service.start_processing(key="key")
+
+
+def test_forget_least_recently_processed_keys() -> None:
+    commands_deduplication_service = CommandsDeduplicationService(max_processed_keys=2)
+    for key in ("first_key", "second_key", "third_key"):
+        assert commands_deduplication_service.start_processing(key=key)
+        commands_deduplication_service.finish_processing(key=key, is_processed=True)
+
+    assert commands_deduplication_service.start_processing(key="first_key")
+    assert not commands_deduplication_service.start_processing(key="third_key")
@@ -0,0 +1,221 @@
+import threading
+from dataclasses import asdict, dataclass
+from time import sleep
+from typing import Any, Generator
+
+import pytest
+
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_broker import (
+    AsyncioInMemoryMessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_consumer import (
+    AsyncioInMemoryMessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.in_memory.asyncio_impl.message_producer import (
+    AsyncioInMemoryMessageProducer,
+)
+from src.domain.entity.commands.generic_command import GenericCommand
+from src.domain.entity.commands.video.youtube.download_youtube_video_from_url_command import (
+    DownloadYouTubeVideoFromUrlCommand,
+)
+from src.domain.entity.error.message_queue import ProducingMessageError
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+)
+from src.services.communication.message_queue import MessageQueueCommunicationService
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DataForTesting:
+    data: str
+
+
+@pytest.fixture
+def message_queue_service() -> Generator[MessageQueueCommunicationService, Any, None]:
+    message_broker = AsyncioInMemoryMessageBroker()
+    message_queue_service = MessageQueueCommunicationService(
+        message_producer=AsyncioInMemoryMessageProducer(message_broker=message_broker),
+        message_consumer=AsyncioInMemoryMessageConsumer(message_broker=message_broker),
+        message_codec=MsgPackMessageCodec(),
+    )
+    yield message_queue_service
+    message_queue_service.close()
+    message_broker.close()
+
+
+def encode(test_data: DataForTesting) -> bytes:
+    encoded_data = MsgPackMessageCodec().encode(data=asdict(test_data))
+    assert isinstance(encoded_data, bytes)
+    return encoded_data
+
+
+def test_fanout_one_message_to_every_bound_queue(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    topic: str = "test-topic"
+    expected_message: DataForTesting = DataForTesting(data="data !")
+    consumed_messages: dict[str, DataForTesting] = {}
+
+    def collect_consumption_wrapper(queue_topic: str):
+        def collect_consumption(test_data: DataForTesting) -> None:
+            consumed_messages[queue_topic] = test_data
+
+        return collect_consumption
+
+    consumption_threads = [
+        threading.Thread(
+            target=message_queue_service.consume_messages,
+            kwargs=dict(
+                exchange_name=topic,
+                queue_topic=queue_topic,
+                consume_forever=False,
+                deserialization_function=lambda data: DataForTesting(**data),
+                callback_function=collect_consumption_wrapper(queue_topic),
+            ),
+            daemon=True,
+        )
+        for queue_topic in [f"{topic}_first", f"{topic}_second"]
+    ]
+    for consumption_thread in consumption_threads:
+        consumption_thread.start()
+    sleep(0.5)
+
+    producing_status = message_queue_service.produce_message(
+        topic=topic,
+        data=encode(expected_message),
+        content_type=MsgPackMessageCodec().get_content_type(),
+    )
+    assert producing_status is None
+
+    for consumption_thread in consumption_threads:
+        consumption_thread.join(timeout=5)
+    assert consumed_messages == {
+        f"{topic}_first": expected_message,
+        f"{topic}_second": expected_message,
+    }
+
+
+def test_consume_messages_in_batches(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    topic: str = "test-batch-topic"
+    expected_messages: list[DataForTesting] = [
+        DataForTesting(data=f"data {index} !") for index in range(5)
+    ]
+    consumed_batches: list[list[DataForTesting]] = []
+
+    def collect_batch(batch: list[DataForTesting]) -> bool:
+        consumed_batches.append(batch)
+        return True
+
+    def deserialize(queue_message) -> DataForTesting:
+        decoded_data = MsgPackMessageCodec().decode(data=queue_message.body)
+        assert isinstance(decoded_data, dict)
+        return DataForTesting(**decoded_data)
+
+    consumption_thread = threading.Thread(
+        target=message_queue_service.consume_batches,
+        kwargs=dict(
+            subscriptions=[
+                MessageBatchSubscription(
+                    exchange_name=topic,
+                    queue_topic=topic,
+                    deserialization_function=deserialize,
+                    batch_callback_function=collect_batch,
+                )
+            ],
+            consume_forever=False,
+            batch_size=10,
+            batch_timeout_in_ms=500,
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    sleep(0.5)
+
+    producing_statuses = message_queue_service.produce_messages(
+        topic=topic,
+        data_items=[encode(message) for message in expected_messages],
+        content_type=MsgPackMessageCodec().get_content_type(),
+    )
+    assert producing_statuses == [None] * len(expected_messages)
+
+    consumption_thread.join(timeout=5)
+    assert consumed_batches == [expected_messages]
+
+
+def test_consume_interactive_command_while_bulk_lane_is_busy(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    is_bulk_command_released = threading.Event()
+    is_interactive_command_consumed = threading.Event()
+    consumed_commands: list[DownloadYouTubeVideoFromUrlCommand] = []
+
+    def consume_command(command: DownloadYouTubeVideoFromUrlCommand) -> None:
+        consumed_commands.append(command)
+        if command.is_bulk():
+            is_bulk_command_released.wait(timeout=5)
+        else:
+            is_interactive_command_consumed.set()
+
+    consumption_thread = threading.Thread(
+        target=message_queue_service.consume_subscriptions,
+        kwargs=dict(
+            subscriptions=[
+                message_queue_service.get_domain_message_subscription(
+                    message_class=DownloadYouTubeVideoFromUrlCommand,
+                    exchange_name=lane_topic,
+                    queue_topic=f"{lane_topic}_test",
+                    callback_function=consume_command,
+                    max_concurrency=1,
+                )
+                for lane_topic in (
+                    DownloadYouTubeVideoFromUrlCommand.get_topic(),
+                    DownloadYouTubeVideoFromUrlCommand.get_bulk_topic(),
+                )
+            ],
+            max_concurrency=0,
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    sleep(0.5)
+
+    bulk_command, interactive_command = (
+        DownloadYouTubeVideoFromUrlCommand(
+            created_at_iso_format=f"2024-01-01T00:00:0{index}",
+            url="https://www.youtube.com/watch?v=video-uuid",
+            resolution=144,
+            desired_download_path="/tmp",
+            priority=priority,
+        )
+        for index, priority in enumerate(
+            (GenericCommand.BULK_PRIORITY, GenericCommand.MAX_PRIORITY)
+        )
+    )
+    producing_statuses = message_queue_service.produce_domain_messages(
+        message_class=DownloadYouTubeVideoFromUrlCommand,
+        messages=[bulk_command, bulk_command, interactive_command],
+    )
+    assert producing_statuses == [None, None, None]
+
+    # The interactive command doesn't wait for the bulk ones holding the bulk lane's worker
+    assert is_interactive_command_consumed.wait(timeout=5)
+    is_bulk_command_released.set()
+    assert consumed_commands[:2] == [bulk_command, interactive_command]
+
+
+def test_produce_message_after_closing_the_producer(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    message_queue_service.close()
+
+    producing_status = message_queue_service.produce_message(
+        topic="test-topic", data=encode(DataForTesting(data="data !"))
+    )
+
+    assert isinstance(producing_status, ProducingMessageError)
+    assert producing_status.error == "This message producer is closed !"
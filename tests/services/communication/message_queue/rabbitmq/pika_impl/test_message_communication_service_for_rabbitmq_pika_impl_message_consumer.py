@@ -1,6 +1,8 @@
+import asyncio
 import threading
 from time import sleep
 import pytest
+from aio_pika import connect_robust
 from testcontainer_python_rabbitmq import RabbitMQContainer
 from src.domain.entity.error.message_queue import (
     ConsumingMessageError,
@@ -11,9 +13,15 @@ from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.messag
 from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
     PikaRabbitMqMessageConsumer,
 )
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
 from src.services.communication.message_queue import MessageQueueCommunicationService
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
 from dataclasses import dataclass, asdict
-import pickle
 from concurrent.futures import ThreadPoolExecutor
 
 
@@ -39,6 +47,7 @@ def test_consume_one_message_successfully(
                 rabbitmq_username="guest",
                 rabbitmq_password="guest",
             ),
+            message_codec=MsgPackMessageCodec(),
         )
 
         topic: str = "test-topic"
@@ -68,7 +77,9 @@ def test_consume_one_message_successfully(
         )
 
         producing_status = message_queue_service.produce_message(
-            topic=topic, data=pickle.dumps(asdict(expected_message))
+            topic=topic,
+            data=MsgPackMessageCodec().encode(data=asdict(expected_message)),
+            content_type=MsgPackMessageCodec().get_content_type(),
         )
         assert producing_status is None
 
@@ -88,6 +99,7 @@ def test_invalid_credential_for_message_queue_consumption() -> None:
                 rabbitmq_username="invalid",
                 rabbitmq_password="invalid",
             ),
+            message_codec=MsgPackMessageCodec(),
         ).consume_messages(
             exchange_name="test-exchange",
             queue_topic="test-topic",
@@ -98,3 +110,404 @@ def test_invalid_credential_for_message_queue_consumption() -> None:
 
         assert isinstance(produce_status, ConsumingMessageError)
         assert "Login was refused" in produce_status.error
+
+
+def test_consume_messages_concurrently_successfully() -> None:
+    with RabbitMQContainer() as container:
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        )
+
+        topic: str = "test-concurrent-topic"
+        # Both callbacks have to be running at the same time to pass the barrier
+        callbacks_barrier = threading.Barrier(2, timeout=10)
+        consumed_messages: list[DataForTesting] = []
+
+        def wait_for_other_callback(test_data: DataForTesting) -> None:
+            callbacks_barrier.wait()
+            consumed_messages.append(test_data)
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_messages,
+            kwargs=dict(
+                exchange_name=topic,
+                queue_topic=topic,
+                deserialization_function=lambda data: DataForTesting(**data),
+                callback_function=wait_for_other_callback,
+                prefetch_count=2,
+                max_concurrency=2,
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        producing_statuses = message_queue_service.produce_messages(
+            topic=topic,
+            data_items=[
+                MsgPackMessageCodec().encode(data=asdict(DataForTesting(data=data)))
+                for data in ["first !", "second !"]
+            ],
+            content_type=MsgPackMessageCodec().get_content_type(),
+        )
+        assert producing_statuses == [None, None]
+
+        for _ in range(10):
+            if len(consumed_messages) == 2:
+                break
+            sleep(1)
+
+        assert not callbacks_barrier.broken
+        assert sorted(message.data for message in consumed_messages) == [
+            "first !",
+            "second !",
+        ]
+
+
+def test_consume_message_with_async_callback_successfully() -> None:
+    with RabbitMQContainer() as container:
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+                heartbeat=5,
+            ),
+            message_codec=MsgPackMessageCodec(),
+        )
+
+        topic: str = "test-async-topic"
+        expected_message: DataForTesting = DataForTesting(data="data !")
+        consumed_messages: list[DataForTesting] = []
+
+        async def collect_consumption(test_data: DataForTesting) -> None:
+            await asyncio.sleep(0)
+            consumed_messages.append(test_data)
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_messages,
+            kwargs=dict(
+                exchange_name=topic,
+                queue_topic=topic,
+                consume_forever=False,
+                deserialization_function=lambda data: DataForTesting(**data),
+                callback_function=collect_consumption,
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        producing_status = message_queue_service.produce_message(
+            topic=topic,
+            data=MsgPackMessageCodec().encode(data=asdict(expected_message)),
+            content_type=MsgPackMessageCodec().get_content_type(),
+        )
+        assert producing_status is None
+
+        consumption_thread.join(timeout=10)
+        assert consumed_messages == [expected_message]
+
+
+def test_consume_many_subscriptions_over_one_connection_successfully() -> None:
+    with RabbitMQContainer() as container:
+        codec = MsgPackMessageCodec()
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=codec,
+        )
+
+        topics: list[str] = ["test-first-topic", "test-second-topic"]
+        consumed_messages: dict[str, DataForTesting] = {}
+
+        def collect_consumption_wrapper(topic: str):
+            def collect_consumption(test_data: DataForTesting) -> None:
+                consumed_messages[topic] = test_data
+
+            return collect_consumption
+
+        def deserialize(queue_message) -> DataForTesting:
+            decoded_data = codec.decode(data=queue_message.body)
+            assert isinstance(decoded_data, dict)
+            return DataForTesting(**decoded_data)
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_subscriptions,
+            kwargs=dict(
+                subscriptions=[
+                    MessageSubscription(
+                        exchange_name=topic,
+                        queue_topic=topic,
+                        deserialization_function=deserialize,
+                        callback_function=collect_consumption_wrapper(topic),
+                    )
+                    for topic in topics
+                ],
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        for topic in topics:
+            producing_status = message_queue_service.produce_message(
+                topic=topic,
+                data=codec.encode(data=asdict(DataForTesting(data=topic))),
+                content_type=codec.get_content_type(),
+            )
+            assert producing_status is None
+
+        for _ in range(10):
+            if len(consumed_messages) == len(topics):
+                break
+            sleep(1)
+
+        assert consumed_messages == {
+            topic: DataForTesting(data=topic) for topic in topics
+        }
+
+
+def test_consume_messages_in_batches_successfully() -> None:
+    with RabbitMQContainer() as container:
+        codec = MsgPackMessageCodec()
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=codec,
+        )
+
+        topic: str = "test-batch-topic"
+        expected_messages: list[DataForTesting] = [
+            DataForTesting(data=f"data {index} !") for index in range(5)
+        ]
+        consumed_batches: list[list[DataForTesting]] = []
+
+        def collect_batch(batch: list[DataForTesting]) -> bool:
+            consumed_batches.append(batch)
+            return True
+
+        def deserialize(queue_message) -> DataForTesting:
+            decoded_data = codec.decode(data=queue_message.body)
+            assert isinstance(decoded_data, dict)
+            return DataForTesting(**decoded_data)
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_batches,
+            kwargs=dict(
+                subscriptions=[
+                    MessageBatchSubscription(
+                        exchange_name=topic,
+                        queue_topic=topic,
+                        deserialization_function=deserialize,
+                        batch_callback_function=collect_batch,
+                    )
+                ],
+                consume_forever=False,
+                batch_size=10,
+                batch_timeout_in_ms=2000,
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        producing_statuses = message_queue_service.produce_messages(
+            topic=topic,
+            data_items=[
+                codec.encode(data=asdict(message)) for message in expected_messages
+            ],
+            content_type=codec.get_content_type(),
+        )
+        assert producing_statuses == [None] * len(expected_messages)
+
+        consumption_thread.join(timeout=10)
+        assert consumed_batches == [expected_messages]
+
+
+def test_retry_failing_message_then_park_it() -> None:
+    with RabbitMQContainer() as container:
+        codec = MsgPackMessageCodec()
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+                retry_delays_in_ms=(100, 200),
+            ),
+            message_codec=codec,
+        )
+
+        topic: str = "test-retry-topic"
+        expected_message: DataForTesting = DataForTesting(data="data !")
+        failed_messages: list[DataForTesting] = []
+
+        def fail_processing(test_data: DataForTesting) -> None:
+            failed_messages.append(test_data)
+            raise ValueError("Poison message !")
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_messages,
+            kwargs=dict(
+                exchange_name=topic,
+                queue_topic=topic,
+                deserialization_function=lambda data: DataForTesting(**data),
+                callback_function=fail_processing,
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        producing_status = message_queue_service.produce_message(
+            topic=topic,
+            data=codec.encode(data=asdict(expected_message)),
+            content_type=codec.get_content_type(),
+        )
+        assert producing_status is None
+        sleep(3)
+
+        # The first delivery and one per retry delay, then the message is parked
+        assert failed_messages == [expected_message] * 3
+
+        parked_messages: list[dict] = []
+        consumption_status = PikaRabbitMqMessageConsumer(
+            rabbitmq_host=container.get_container_host_ip(),
+            rabbitmq_port=int(container.get_amqp_port()),
+            rabbitmq_username="guest",
+            rabbitmq_password="guest",
+        ).consume_messages(
+            exchange_name=f"{topic}.parking",
+            queue_topic=f"{topic}.parking",
+            consume_forever=False,
+            deserialization_function=lambda queue_message: queue_message.headers,
+            callback_function=parked_messages.append,
+        )
+
+        assert consumption_status is None
+        assert len(parked_messages) == 1
+        assert parked_messages[0][PikaRabbitMqMessageConsumer.RETRY_COUNT_HEADER] == 3
+        assert (
+            parked_messages[0][PikaRabbitMqMessageConsumer.LAST_ERROR_HEADER]
+            == "Poison message !"
+        )
+
+
+def test_keep_priority_of_failing_message_when_retrying_and_parking_it() -> None:
+    with RabbitMQContainer() as container:
+        codec = MsgPackMessageCodec()
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+                retry_delays_in_ms=(100,),
+            ),
+            message_codec=codec,
+        )
+
+        topic: str = "test-retry-priority-topic"
+        parked_priorities: list[int] = []
+
+        def fail_processing(test_data: DataForTesting) -> None:
+            raise ValueError("Poison message !")
+
+        consumption_thread = threading.Thread(
+            target=message_queue_service.consume_subscriptions,
+            kwargs=dict(
+                subscriptions=[
+                    MessageSubscription(
+                        exchange_name=topic,
+                        queue_topic=topic,
+                        deserialization_function=lambda queue_message: DataForTesting(
+                            **codec.decode(data=queue_message.body)
+                        ),
+                        callback_function=fail_processing,
+                        max_priority=9,
+                    )
+                ],
+            ),
+        )
+        consumption_thread.daemon = True
+        consumption_thread.start()
+        sleep(3)
+
+        producing_status = message_queue_service.produce_message(
+            topic=topic,
+            data=codec.encode(data=asdict(DataForTesting(data="data !"))),
+            content_type=codec.get_content_type(),
+            priority=7,
+        )
+        assert producing_status is None
+        sleep(3)
+
+        async def get_parked_message_priority() -> None:
+            connection = await connect_robust(
+                host=container.get_container_host_ip(),
+                port=int(container.get_amqp_port()),
+                login="guest",
+                password="guest",
+            )
+            async with connection:
+                channel = await connection.channel()
+                parking_queue = await channel.get_queue(f"{topic}.parking")
+                parked_message = await parking_queue.get(no_ack=True)
+                assert parked_message is not None
+                parked_priorities.append(parked_message.priority)
+                assert parked_message.content_type == codec.get_content_type()
+
+        asyncio.run(get_parked_message_priority())
+        assert parked_priorities == [7]
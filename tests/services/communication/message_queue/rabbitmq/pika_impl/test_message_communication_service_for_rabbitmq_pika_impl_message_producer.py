@@ -1,3 +1,5 @@
+import asyncio
+import socket
 from testcontainer_python_rabbitmq import RabbitMQContainer
 from src.domain.entity.error.message_queue import ProducingMessageError
 from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_producer import (
@@ -6,6 +8,9 @@ from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.messag
 from src.adapters.outbound.communication.message_queue.rabbitmq.pika_impl.message_consumer import (
     PikaRabbitMqMessageConsumer,
 )
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
 from src.services.communication.message_queue import MessageQueueCommunicationService
 
 
@@ -24,6 +29,7 @@ def test_produce_message_successfully() -> None:
                 rabbitmq_username="guest",
                 rabbitmq_password="guest",
             ),
+            message_codec=MsgPackMessageCodec(),
         ).produce_message(topic="test-topic", data=b"here we are !")
 
         assert produce_status is None
@@ -44,7 +50,160 @@ def test_invalid_credential_for_message_queue() -> None:
                 rabbitmq_username="invalid",
                 rabbitmq_password="invalid",
             ),
+            message_codec=MsgPackMessageCodec(),
         ).produce_message(topic="test-topic", data=b"here we are !")
 
         assert isinstance(produce_status, ProducingMessageError)
         assert "Login was refused" in produce_status.error
+
+
+def test_produce_many_messages_over_the_same_connection_successfully() -> None:
+    with RabbitMQContainer() as container:
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        )
+
+        for index in range(10):
+            produce_status = message_queue_service.produce_message(
+                topic="test-topic", data=f"message [{index}]".encode()
+            )
+            assert produce_status is None
+
+        message_queue_service.close()
+
+
+def test_produce_message_after_closing_the_producer() -> None:
+    with RabbitMQContainer() as container:
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        )
+        message_queue_service.close()
+
+        produce_status = message_queue_service.produce_message(
+            topic="test-topic", data=b"here we are !"
+        )
+
+        assert isinstance(produce_status, ProducingMessageError)
+        assert produce_status.error == "This message producer is closed !"
+
+
+def test_async_produce_message_successfully() -> None:
+    with RabbitMQContainer() as container:
+        message_queue_service = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        )
+
+        produce_status = asyncio.run(
+            message_queue_service.aproduce_message(
+                topic="test-topic", data=b"here we are !"
+            )
+        )
+
+        assert produce_status is None
+
+
+def test_produce_many_messages_at_once_successfully() -> None:
+    with RabbitMQContainer() as container:
+        producing_statuses = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+                max_in_flight_messages=3,
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="guest",
+                rabbitmq_password="guest",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        ).produce_messages(
+            topic="test-topic",
+            data_items=(f"message [{index}]".encode() for index in range(10)),
+        )
+
+        assert producing_statuses == [None] * 10
+
+
+def test_invalid_credential_for_producing_many_messages_at_once() -> None:
+    with RabbitMQContainer() as container:
+        producing_statuses = MessageQueueCommunicationService(
+            message_producer=PikaRabbitMqMessageProducer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="invalid",
+                rabbitmq_password="invalid",
+            ),
+            message_consumer=PikaRabbitMqMessageConsumer(
+                rabbitmq_host=container.get_container_host_ip(),
+                rabbitmq_port=int(container.get_amqp_port()),
+                rabbitmq_username="invalid",
+                rabbitmq_password="invalid",
+            ),
+            message_codec=MsgPackMessageCodec(),
+        ).produce_messages(topic="test-topic", data_items=[b"first", b"second"])
+
+        assert len(producing_statuses) == 2
+        for producing_status in producing_statuses:
+            assert isinstance(producing_status, ProducingMessageError)
+            assert "Login was refused" in producing_status.error
+
+
+def test_bound_producing_many_messages_at_once_by_timeout() -> None:
+    # A broker accepting the connections but never answering them
+    with socket.create_server(("127.0.0.1", 0)) as silent_server:
+        message_producer = PikaRabbitMqMessageProducer(
+            rabbitmq_host="127.0.0.1",
+            rabbitmq_port=silent_server.getsockname()[1],
+            rabbitmq_username="guest",
+            rabbitmq_password="guest",
+            connection_timeout=60,
+            producing_timeout=1,
+        )
+        producing_statuses = message_producer.produce_messages(
+            topic="test-topic", data_items=(data for data in [b"first", b"second"])
+        )
+        message_producer.close()
+
+    assert len(producing_statuses) == 2
+    for producing_status in producing_statuses:
+        assert isinstance(producing_status, ProducingMessageError)
+        assert "TimeoutError" in producing_status.error
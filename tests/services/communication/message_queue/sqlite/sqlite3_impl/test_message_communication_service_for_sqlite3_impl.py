@@ -0,0 +1,321 @@
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import sleep
+from typing import Any, Generator
+
+import pytest
+
+from src.adapters.outbound.communication.message_queue.codec.msgpack_impl.message_codec import (
+    MsgPackMessageCodec,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_broker import (
+    Sqlite3MessageBroker,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_consumer import (
+    Sqlite3MessageConsumer,
+)
+from src.adapters.outbound.communication.message_queue.sqlite.sqlite3_impl.message_producer import (
+    Sqlite3MessageProducer,
+)
+from src.domain.entity.message_queue.message_subscription import (
+    MessageBatchSubscription,
+    MessageSubscription,
+)
+from src.domain.entity.message_queue.queue_message import QueueMessage
+from src.services.communication.message_queue import MessageQueueCommunicationService
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DataForTesting:
+    data: str
+
+
+@pytest.fixture
+def message_broker(tmp_path: Path) -> Generator[Sqlite3MessageBroker, Any, None]:
+    message_broker = Sqlite3MessageBroker(
+        database_path=str(tmp_path / "message_queue.db"), visibility_timeout_in_s=1
+    )
+    yield message_broker
+    message_broker.close()
+
+
+@pytest.fixture
+def message_queue_service(
+    message_broker: Sqlite3MessageBroker,
+) -> Generator[MessageQueueCommunicationService, Any, None]:
+    message_queue_service = MessageQueueCommunicationService(
+        message_producer=Sqlite3MessageProducer(message_broker=message_broker),
+        message_consumer=Sqlite3MessageConsumer(
+            message_broker=message_broker, polling_interval_in_ms=10
+        ),
+        message_codec=MsgPackMessageCodec(),
+    )
+    yield message_queue_service
+    message_queue_service.close()
+
+
+def encode(test_data: DataForTesting) -> bytes:
+    encoded_data = MsgPackMessageCodec().encode(data=asdict(test_data))
+    assert isinstance(encoded_data, bytes)
+    return encoded_data
+
+
+def deserialize(queue_message: QueueMessage) -> DataForTesting:
+    decoded_data = MsgPackMessageCodec().decode(data=queue_message.body)
+    assert isinstance(decoded_data, dict)
+    return DataForTesting(**decoded_data)
+
+
+def test_fanout_one_message_to_every_bound_queue(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    topic: str = "test-topic"
+    expected_message: DataForTesting = DataForTesting(data="data !")
+    consumed_messages: dict[str, DataForTesting] = {}
+
+    def collect_consumption_wrapper(queue_topic: str):
+        def collect_consumption(test_data: DataForTesting) -> None:
+            consumed_messages[queue_topic] = test_data
+
+        return collect_consumption
+
+    consumption_threads = [
+        threading.Thread(
+            target=message_queue_service.consume_messages,
+            kwargs=dict(
+                exchange_name=topic,
+                queue_topic=queue_topic,
+                consume_forever=False,
+                deserialization_function=lambda data: DataForTesting(**data),
+                callback_function=collect_consumption_wrapper(queue_topic),
+            ),
+            daemon=True,
+        )
+        for queue_topic in [f"{topic}_first", f"{topic}_second"]
+    ]
+    for consumption_thread in consumption_threads:
+        consumption_thread.start()
+    sleep(0.5)
+
+    producing_status = message_queue_service.produce_message(
+        topic=topic,
+        data=encode(expected_message),
+        content_type=MsgPackMessageCodec().get_content_type(),
+    )
+    assert producing_status is None
+
+    for consumption_thread in consumption_threads:
+        consumption_thread.join(timeout=5)
+    assert consumed_messages == {
+        f"{topic}_first": expected_message,
+        f"{topic}_second": expected_message,
+    }
+
+
+def test_requeue_a_failed_batch_then_consume_it_again(
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    topic: str = "test-batch-topic"
+    expected_messages: list[DataForTesting] = [
+        DataForTesting(data=f"data {index} !") for index in range(5)
+    ]
+    consumed_batches: list[list[DataForTesting]] = []
+
+    def fail_first_batch(batch: list[DataForTesting]) -> bool:
+        consumed_batches.append(batch)
+        return len(consumed_batches) > 1
+
+    consumption_thread = threading.Thread(
+        target=message_queue_service.consume_batches,
+        kwargs=dict(
+            subscriptions=[
+                MessageBatchSubscription(
+                    exchange_name=topic,
+                    queue_topic=topic,
+                    deserialization_function=deserialize,
+                    batch_callback_function=fail_first_batch,
+                )
+            ],
+            batch_size=10,
+            batch_timeout_in_ms=200,
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    sleep(0.5)
+
+    producing_statuses = message_queue_service.produce_messages(
+        topic=topic,
+        data_items=[encode(message) for message in expected_messages],
+        content_type=MsgPackMessageCodec().get_content_type(),
+    )
+    assert producing_statuses == [None] * len(expected_messages)
+
+    sleep(1)
+    assert consumed_batches == [expected_messages, expected_messages]
+
+
+def test_redeliver_unacknowledged_message_after_visibility_timeout(
+    message_broker: Sqlite3MessageBroker,
+) -> None:
+    message_broker.bind_queue(
+        exchange_name="test-topic", queue_name="test-queue"
+    ).result()
+    message_broker.publish(
+        exchange_name="test-topic", messages=[QueueMessage(body=b"data !")]
+    ).result()
+
+    claimed_messages = message_broker.claim(
+        queue_name="test-queue", max_messages=10
+    ).result()
+    assert [message.body for _, message in claimed_messages] == [b"data !"]
+    assert message_broker.claim(queue_name="test-queue", max_messages=10).result() == []
+
+    sleep(1.2)
+    assert (
+        message_broker.claim(queue_name="test-queue", max_messages=10).result()
+        == claimed_messages
+    )
+
+
+def test_keep_published_messages_after_reopening_the_database(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "message_queue.db")
+    message_broker = Sqlite3MessageBroker(database_path=database_path)
+    message_broker.bind_queue(
+        exchange_name="test-topic", queue_name="test-queue"
+    ).result()
+    message_broker.publish(
+        exchange_name="test-topic",
+        messages=[QueueMessage(body=b"data !", headers={"x-schema-version": 1})],
+    ).result()
+    message_broker.close()
+
+    reopened_message_broker = Sqlite3MessageBroker(database_path=database_path)
+    claimed_messages = reopened_message_broker.claim(
+        queue_name="test-queue", max_messages=10
+    ).result()
+    reopened_message_broker.close()
+
+    assert [message for _, message in claimed_messages] == [
+        QueueMessage(body=b"data !", headers={"x-schema-version": 1})
+    ]
+
+
+def test_retry_failing_message_then_park_it(
+    message_broker: Sqlite3MessageBroker,
+) -> None:
+    message_queue_service = MessageQueueCommunicationService(
+        message_producer=Sqlite3MessageProducer(message_broker=message_broker),
+        message_consumer=Sqlite3MessageConsumer(
+            message_broker=message_broker,
+            polling_interval_in_ms=10,
+            retry_delays_in_ms=(100, 200),
+        ),
+        message_codec=MsgPackMessageCodec(),
+    )
+    topic: str = "test-retry-topic"
+    expected_message: DataForTesting = DataForTesting(data="data !")
+    failed_messages: list[DataForTesting] = []
+
+    def fail_processing(test_data: DataForTesting) -> None:
+        failed_messages.append(test_data)
+        raise ValueError("Poison message !")
+
+    consumption_thread = threading.Thread(
+        target=message_queue_service.consume_messages,
+        kwargs=dict(
+            exchange_name=topic,
+            queue_topic=topic,
+            deserialization_function=lambda data: DataForTesting(**data),
+            callback_function=fail_processing,
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    sleep(0.5)
+
+    producing_status = message_queue_service.produce_message(
+        topic=topic,
+        data=encode(expected_message),
+        content_type=MsgPackMessageCodec().get_content_type(),
+    )
+    assert producing_status is None
+    sleep(1)
+
+    # The first delivery and one per retry delay, then the message is parked
+    assert failed_messages == [expected_message] * 3
+    parked_messages = message_broker.get_parked_messages(queue_name=topic).result()
+    assert [deserialize(message) for message in parked_messages] == [expected_message]
+    assert parked_messages[0].headers[Sqlite3MessageConsumer.RETRY_COUNT_HEADER] == 3
+    assert (
+        parked_messages[0].headers[Sqlite3MessageConsumer.LAST_ERROR_HEADER]
+        == "Poison message !"
+    )
+
+
+def test_expire_transient_queue_unless_renewed(
+    message_broker: Sqlite3MessageBroker,
+) -> None:
+    for queue_name in ("dead-consumer-queue", "live-consumer-queue"):
+        message_broker.bind_queue(
+            exchange_name="test-topic", queue_name=queue_name, is_transient=True
+        ).result()
+
+    sleep(0.6)
+    message_broker.renew_transient_queues(queue_names=["live-consumer-queue"]).result()
+    sleep(0.6)
+    # Any consumer renewing its own transient queues deletes the expired ones
+    message_broker.renew_transient_queues(queue_names=[]).result()
+    message_broker.publish(
+        exchange_name="test-topic", messages=[QueueMessage(body=b"data !")]
+    ).result()
+
+    assert (
+        message_broker.claim(queue_name="dead-consumer-queue", max_messages=10).result()
+        == []
+    )
+    assert [
+        message.body
+        for _, message in message_broker.claim(
+            queue_name="live-consumer-queue", max_messages=10
+        ).result()
+    ] == [b"data !"]
+
+
+def test_release_transient_queues_when_stopping_consumption(
+    message_broker: Sqlite3MessageBroker,
+    message_queue_service: MessageQueueCommunicationService,
+) -> None:
+    consumption_thread = threading.Thread(
+        target=message_queue_service.consume_subscriptions,
+        kwargs=dict(
+            subscriptions=[
+                MessageSubscription(
+                    exchange_name="test-topic",
+                    queue_topic="test-transient-queue",
+                    deserialization_function=deserialize,
+                    callback_function=lambda _: None,
+                    is_transient=True,
+                )
+            ]
+        ),
+        daemon=True,
+    )
+    consumption_thread.start()
+    sleep(0.5)
+
+    message_queue_service.stop_consuming()
+    consumption_thread.join(timeout=5)
+    assert not consumption_thread.is_alive()
+
+    # Nothing is kept for the transient queue once its consumer is gone
+    message_broker.publish(
+        exchange_name="test-topic", messages=[QueueMessage(body=b"data !")]
+    ).result()
+    assert (
+        message_broker.claim(
+            queue_name="test-transient-queue", max_messages=10
+        ).result()
+        == []
+    )
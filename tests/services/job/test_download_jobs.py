@@ -0,0 +1,159 @@
+from src.domain.entity.video.download_progress import VideoDownloadProgressSnapshot
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+from src.services.job import DownloadJobsService
+
+
+def __get_snapshot(
+    *, url: str, downloaded_bytes: int, job_id: str | None = "job"
+) -> VideoDownloadProgressSnapshot:
+    return VideoDownloadProgressSnapshot(
+        status=OnProgressDownloadingVideoStatus(
+            url=url,
+            title=url,
+            height=1080,
+            width=1920,
+            downloaded_bytes=downloaded_bytes,
+            total_bytes=100,
+            speed_in_bytes_per_s=10,
+        ),
+        batch_id="batch",
+        job_id=job_id,
+    )
+
+
+def test_track_url_job_from_request_to_completion() -> None:
+    download_jobs_service = DownloadJobsService()
+    job = download_jobs_service.add_requested_job(
+        job_id="job",
+        topic="download_youtube_video_from_url",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=False,
+    )
+    assert job.get_status() == "queued"
+    assert job.urls_count == 1
+
+    [job] = download_jobs_service.add_progress_snapshots(
+        snapshots=[
+            __get_snapshot(url="url", downloaded_bytes=50),
+            __get_snapshot(url="other_url", downloaded_bytes=50, job_id=None),
+        ]
+    )
+    assert job.get_status() == "running"
+    assert job.progress.get_downloaded_ratio() == 0.5
+
+    job = download_jobs_service.add_downloaded_video(
+        job_id="job", url="url", is_batch=False
+    )
+    assert job.get_status() == "completed"
+    assert job.progress.downloads_count == 0
+    assert download_jobs_service.get_job(job_id="job") == job
+
+
+def test_track_batch_job_from_events_in_any_order() -> None:
+    download_jobs_service = DownloadJobsService()
+
+    # The videos can be done before the job has been recorded or fanned out
+    download_jobs_service.add_failed_video(
+        job_id="job", url="first_url", error="error", is_batch=True
+    )
+    job = download_jobs_service.add_requested_job(
+        job_id="job",
+        topic="download_youtube_videos_from_txt_file",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=True,
+    )
+    assert job.get_status() == "running"
+    assert job.urls_count is None
+
+    job = download_jobs_service.add_fanned_out_urls(job_id="job", urls_count=2)
+    assert job.get_status() == "running"
+    assert job.topic == "download_youtube_videos_from_txt_file"
+
+    job = download_jobs_service.add_failed_video(
+        job_id="job", url="second_url", error="last error", is_batch=True
+    )
+    assert job.get_status() == "failed"
+    assert job.last_error == "last error"
+
+    # The redelivered events of a finished job don't open it again
+    assert (
+        download_jobs_service.add_downloaded_video(
+            job_id="job", url="second_url", is_batch=True
+        )
+        == job
+    )
+
+
+def test_page_jobs_running_first_and_forget_oldest_finished() -> None:
+    download_jobs_service = DownloadJobsService(max_finished_jobs=1)
+    for job_id in ["first", "second", "third", "fourth"]:
+        download_jobs_service.add_requested_job(
+            job_id=job_id,
+            topic="download_youtube_video_from_url",
+            created_at_iso_format="2024-01-01T00:00:00",
+            is_batch=False,
+        )
+    for job_id in ["first", "second"]:
+        download_jobs_service.add_downloaded_video(
+            job_id=job_id, url="url", is_batch=False
+        )
+
+    assert download_jobs_service.get_job(job_id="first") is None
+    jobs, total_count = download_jobs_service.get_jobs(offset=1, limit=2)
+    assert total_count == 3
+    assert [job.job_id for job in jobs] == ["third", "second"]
+
+
+def test_count_redelivered_events_of_running_job_once() -> None:
+    download_jobs_service = DownloadJobsService()
+    download_jobs_service.add_fanned_out_urls(job_id="job", urls_count=3)
+
+    for _ in range(2):
+        download_jobs_service.add_failed_video(
+            job_id="job", url="first_url", error="error", is_batch=True
+        )
+        job = download_jobs_service.add_downloaded_video(
+            job_id="job", url="second_url", is_batch=True
+        )
+    assert job.get_done_count() == 2
+    assert job.get_status() == "running"
+
+    # A url that failed then got downloaded (once its command has been redelivered) only counts as downloaded
+    job = download_jobs_service.add_downloaded_video(
+        job_id="job", url="first_url", is_batch=True
+    )
+    assert (job.downloaded_count, job.failed_count) == (2, 0)
+    assert job.get_status() == "running"
+
+
+def test_fail_job_of_txt_file_that_could_not_be_fanned_out() -> None:
+    download_jobs_service = DownloadJobsService()
+    download_jobs_service.add_requested_job(
+        job_id="job",
+        topic="download_youtube_videos_from_txt_file",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=True,
+    )
+
+    job = download_jobs_service.add_fanned_out_urls(
+        job_id="job", urls_count=0, error="missing file"
+    )
+    assert job.get_status() == "failed"
+    assert job.last_error == "missing file"
+
+
+def test_fail_job_whose_command_could_not_be_requested() -> None:
+    download_jobs_service = DownloadJobsService()
+    download_jobs_service.add_requested_job(
+        job_id="job",
+        topic="download_youtube_video_from_url",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=False,
+    )
+
+    job = download_jobs_service.add_failed_request(
+        job_id="job", error="broker unreachable"
+    )
+    assert job.get_status() == "failed"
+    assert job.last_error == "broker unreachable"
+    assert job.topic == "download_youtube_video_from_url"
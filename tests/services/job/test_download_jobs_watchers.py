@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+from src.domain.entity.job.download_job import DownloadJob
+from src.services.job import DownloadJobsService
+from src.services.job.watchers import DownloadJobsWatchersService
+
+
+def __request_job(
+    *, download_jobs_service: DownloadJobsService, job_id: str = "job"
+) -> None:
+    download_jobs_service.add_requested_job(
+        job_id=job_id,
+        topic="download_youtube_videos_from_txt_file",
+        created_at_iso_format="2024-01-01T00:00:00",
+        is_batch=True,
+    )
+
+
+def test_fan_out_job_updates_from_another_thread_to_all_watchers() -> None:
+    download_jobs_service = DownloadJobsService()
+    download_jobs_watchers_service = DownloadJobsWatchersService(
+        download_jobs_service=download_jobs_service
+    )
+    __request_job(download_jobs_service=download_jobs_service)
+
+    async def __watch() -> list[DownloadJob | None]:
+        return [
+            job async for job in download_jobs_watchers_service.watch_job(job_id="job")
+        ]
+
+    async def __run() -> list[list[DownloadJob | None]]:
+        watching_tasks = [asyncio.create_task(__watch()) for _ in range(3)]
+        while download_jobs_watchers_service.get_watchers_count() < 3:
+            await asyncio.sleep(0)
+
+        # The events are consumed on another thread than the watchers' event loop
+        def __consume_events() -> None:
+            download_jobs_service.add_fanned_out_urls(job_id="job", urls_count=1)
+            download_jobs_service.add_downloaded_video(
+                job_id="job", url="url", is_batch=True
+            )
+
+        consumer_thread = threading.Thread(target=__consume_events)
+        consumer_thread.start()
+        await asyncio.to_thread(consumer_thread.join)
+        return await asyncio.gather(*watching_tasks)
+
+    for watched_jobs in asyncio.run(__run()):
+        assert watched_jobs[0] is not None
+        assert watched_jobs[0].get_status() == "queued"
+        assert watched_jobs[-1] is not None
+        assert watched_jobs[-1].get_status() == "completed"
+    assert download_jobs_watchers_service.get_watchers_count() == 0
+
+
+def test_keep_alive_watcher_of_idle_job() -> None:
+    download_jobs_service = DownloadJobsService()
+    download_jobs_watchers_service = DownloadJobsWatchersService(
+        download_jobs_service=download_jobs_service
+    )
+    __request_job(download_jobs_service=download_jobs_service)
+
+    async def __run() -> list[DownloadJob | None]:
+        watched_jobs: list[DownloadJob | None] = []
+        async for job in download_jobs_watchers_service.watch_job(
+            job_id="job", keepalive_interval_in_s=0.01
+        ):
+            watched_jobs.append(job)
+            if len(watched_jobs) == 2:
+                break
+        return watched_jobs
+
+    watched_jobs = asyncio.run(__run())
+    assert watched_jobs[0] is not None
+    assert watched_jobs[1] is None
+
+
+def test_watch_nothing_for_unknown_job() -> None:
+    download_jobs_watchers_service = DownloadJobsWatchersService(
+        download_jobs_service=DownloadJobsService()
+    )
+
+    async def __run() -> list[DownloadJob | None]:
+        return [
+            job
+            async for job in download_jobs_watchers_service.watch_job(job_id="unknown")
+        ]
+
+    assert asyncio.run(__run()) == []
+    assert download_jobs_watchers_service.get_watchers_count() == 0
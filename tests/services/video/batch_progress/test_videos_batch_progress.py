@@ -0,0 +1,74 @@
+from src.domain.entity.video.batch_progress import VideosBatchProgress
+from src.services.video.batch_progress import VideosBatchProgressService
+
+
+def test_aggregate_batch_progress_from_events_in_any_order() -> None:
+    batch_progress_service = VideosBatchProgressService()
+
+    # The videos can be done before the whole batch has been fanned out
+    batch_progress_service.add_downloaded_video(batch_id="batch", url="first_url")
+    batch_progress_service.add_failed_video(batch_id="batch", url="second_url")
+    assert batch_progress_service.get_batch_progress(
+        batch_id="batch"
+    ) == VideosBatchProgress(batch_id="batch", downloaded_count=1, failed_count=1)
+
+    batch_progress = batch_progress_service.add_fanned_out_batch(
+        batch_id="batch", urls_count=3
+    )
+    assert not batch_progress.is_completed()
+    assert batch_progress_service.get_active_batches_progress() == [batch_progress]
+
+    batch_progress = batch_progress_service.add_downloaded_video(
+        batch_id="batch", url="third_url"
+    )
+    assert batch_progress == VideosBatchProgress(
+        batch_id="batch", urls_count=3, downloaded_count=2, failed_count=1
+    )
+    assert batch_progress.is_completed()
+    assert batch_progress_service.get_active_batches_progress() == []
+
+
+def test_ignore_redelivered_events_of_completed_batch() -> None:
+    batch_progress_service = VideosBatchProgressService()
+    batch_progress_service.add_fanned_out_batch(batch_id="batch", urls_count=1)
+    completed_batch_progress = batch_progress_service.add_downloaded_video(
+        batch_id="batch", url="url"
+    )
+
+    assert (
+        batch_progress_service.add_downloaded_video(batch_id="batch", url="url")
+        == completed_batch_progress
+    )
+    assert batch_progress_service.get_active_batches_progress() == []
+
+
+def test_forget_the_oldest_completed_batches() -> None:
+    batch_progress_service = VideosBatchProgressService(max_completed_batches=1)
+    for batch_id in ["first", "second"]:
+        batch_progress_service.add_fanned_out_batch(batch_id=batch_id, urls_count=0)
+
+    assert batch_progress_service.get_batch_progress(batch_id="first") is None
+    assert batch_progress_service.get_batch_progress(batch_id="second") is not None
+
+
+def test_count_redelivered_events_of_active_batch_once() -> None:
+    batch_progress_service = VideosBatchProgressService()
+    batch_progress_service.add_fanned_out_batch(batch_id="batch", urls_count=3)
+    batch_progress_service.add_downloaded_video(batch_id="batch", url="first_url")
+    batch_progress_service.add_downloaded_video(batch_id="batch", url="first_url")
+    batch_progress_service.add_failed_video(batch_id="batch", url="second_url")
+    batch_progress_service.add_failed_video(batch_id="batch", url="second_url")
+    assert batch_progress_service.get_batch_progress(
+        batch_id="batch"
+    ) == VideosBatchProgress(
+        batch_id="batch", urls_count=3, downloaded_count=1, failed_count=1
+    )
+
+    # A url that failed then got downloaded only counts as downloaded
+    batch_progress = batch_progress_service.add_downloaded_video(
+        batch_id="batch", url="second_url"
+    )
+    assert batch_progress == VideosBatchProgress(
+        batch_id="batch", urls_count=3, downloaded_count=2, failed_count=0
+    )
+    assert not batch_progress.is_completed()
@@ -0,0 +1,145 @@
+import threading
+
+from src.domain.entity.video.download_progress import (
+    VideoDownloadProgressSnapshot,
+    VideosDownloadProgress,
+)
+from src.domain.entity.video.download_status import OnProgressDownloadingVideoStatus
+from src.services.video.download_progress import VideosDownloadProgressReporterService
+
+
+def get_progress_status(
+    *,
+    url: str,
+    downloaded_bytes: int,
+    total_bytes: int | None = 100,
+    speed_in_bytes_per_s: float | None = 10,
+) -> OnProgressDownloadingVideoStatus:
+    return OnProgressDownloadingVideoStatus(
+        url=url,
+        title="testing_title",
+        height=1,
+        width=1,
+        downloaded_bytes=downloaded_bytes,
+        total_bytes=total_bytes,
+        speed_in_bytes_per_s=speed_in_bytes_per_s,
+    )
+
+
+def test_report_only_the_latest_progress_of_each_download() -> None:
+    reports: list[list[VideoDownloadProgressSnapshot]] = []
+    reporter_service = VideosDownloadProgressReporterService(
+        report_function=reports.append, reporting_interval_in_s=60
+    )
+
+    for downloaded_bytes in (10, 20, 30):
+        reporter_service.add_progress(
+            get_progress_status(url="first", downloaded_bytes=downloaded_bytes),
+            batch_id="batch",
+        )
+    reporter_service.add_progress(
+        get_progress_status(url="second", downloaded_bytes=50)
+    )
+    reporter_service.close()
+
+    assert len(reports) == 1
+    assert sorted(reports[0], key=lambda snapshot: snapshot.status.url) == [
+        VideoDownloadProgressSnapshot(
+            status=get_progress_status(url="first", downloaded_bytes=30),
+            batch_id="batch",
+        ),
+        VideoDownloadProgressSnapshot(
+            status=get_progress_status(url="second", downloaded_bytes=50)
+        ),
+    ]
+
+
+def test_report_from_a_single_thread_once_per_interval() -> None:
+    reporting_threads: set[int] = set()
+    reports: list[list[VideoDownloadProgressSnapshot]] = []
+
+    def report(snapshots: list[VideoDownloadProgressSnapshot]) -> None:
+        reporting_threads.add(threading.get_ident())
+        reports.append(snapshots)
+
+    reporter_service = VideosDownloadProgressReporterService(
+        report_function=report, reporting_interval_in_s=0.1
+    )
+    downloading_threads = [
+        threading.Thread(
+            target=lambda url: [
+                reporter_service.add_progress(
+                    get_progress_status(url=url, downloaded_bytes=downloaded_bytes)
+                )
+                for downloaded_bytes in range(100)
+            ],
+            args=(f"url-{index}",),
+        )
+        for index in range(10)
+    ]
+    for downloading_thread in downloading_threads:
+        downloading_thread.start()
+    for downloading_thread in downloading_threads:
+        downloading_thread.join()
+    threading.Event().wait(0.3)
+    reporter_service.add_progress(
+        get_progress_status(url="url-0", downloaded_bytes=100)
+    )
+    reporter_service.close()
+
+    assert len(reporting_threads) == 1
+    assert len(reports) <= 5
+    assert {snapshot.status.url for report in reports[:-1] for snapshot in report} == {
+        f"url-{index}" for index in range(10)
+    }
+    # Only the downloads that progressed since the previous report are reported
+    assert [snapshot.status for snapshot in reports[-1]] == [
+        get_progress_status(url="url-0", downloaded_bytes=100)
+    ]
+
+
+def test_aggregate_progress_per_batch_and_per_worker() -> None:
+    reporter_service = VideosDownloadProgressReporterService(
+        report_function=lambda _: None, reporting_interval_in_s=60
+    )
+    reporter_service.add_progress(
+        get_progress_status(url="first", downloaded_bytes=50), batch_id="batch"
+    )
+    reporter_service.add_progress(
+        get_progress_status(url="second", downloaded_bytes=30), batch_id="batch"
+    )
+    reporter_service.add_progress(
+        get_progress_status(
+            url="third",
+            downloaded_bytes=10,
+            total_bytes=None,
+            speed_in_bytes_per_s=None,
+        )
+    )
+    reporter_service.remove_progress(url="second")
+    reporter_service.add_progress(
+        get_progress_status(url="fourth", downloaded_bytes=20), batch_id="batch"
+    )
+    batches_progress = reporter_service.get_batches_progress()
+    worker_progress = reporter_service.get_worker_progress()
+    reporter_service.close()
+
+    assert batches_progress == {
+        "batch": VideosDownloadProgress(
+            downloads_count=2,
+            downloaded_bytes=70,
+            total_bytes=200,
+            speed_in_bytes_per_s=20,
+        )
+    }
+    assert batches_progress["batch"].get_downloaded_ratio() == 0.35
+    assert batches_progress["batch"].get_eta_in_s() == 6.5
+    assert worker_progress == VideosDownloadProgress(
+        downloads_count=3,
+        downloaded_bytes=80,
+        total_bytes=200,
+        unknown_total_downloads_count=1,
+        speed_in_bytes_per_s=20,
+    )
+    assert worker_progress.get_downloaded_ratio() is None
+    assert worker_progress.get_eta_in_s() is None
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from src.services.video.youtube import YouTubeVideoService
+
+
+def test_get_urls_from_txt_file_skipping_blank_comment_and_duplicate_lines(
+    tmp_path: Path,
+) -> None:
+    urls_txt_file_path = tmp_path / "urls.txt"
+    urls_txt_file_path.write_text(
+        "https://www.youtube.com/watch?v=first\n"
+        + "\n"
+        + "   \n"
+        + "# https://www.youtube.com/watch?v=commented\n"
+        + "  https://www.youtube.com/watch?v=second  \n"
+        + "https://www.youtube.com/watch?v=first\n"
+    )
+
+    assert list(
+        YouTubeVideoService.get_urls_from_txt_file(
+            urls_txt_file_path=str(urls_txt_file_path)
+        )
+    ) == [
+        "https://www.youtube.com/watch?v=first",
+        "https://www.youtube.com/watch?v=second",
+    ]